@@ -3,21 +3,53 @@ import pandas as pd
 import sqlite3
 import requests
 import time
-from datetime import datetime, timedelta
+import calendar
+from datetime import datetime, timedelta, timezone
 import logging
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import re
 import os
-from concurrent.futures import ThreadPoolExecutor
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from pydantic import BaseModel, Field
 import uvicorn
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from apscheduler.schedulers.background import BackgroundScheduler
 import json
-from langdetect import detect, DetectorFactory
+import base64
+import csv
+import io
+import asyncio
+import atexit
+import functools
+import multiprocessing
+import hashlib
+import operator
+import queue
+import threading
+import unicodedata
+import uuid
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from urllib.parse import quote, unquote, urlparse
+import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from langdetect import DetectorFactory
+from langdetect.detector_factory import PROFILES_DIRECTORY
+from enrichment import detect_language, enrich_chunk, init_enrich_worker, sentiment_scores
+
+try:
+    import duckdb  # Optional: only needed for the DuckDB storage backend
+except ImportError:
+    duckdb = None
 
 # Ensure consistent language detection results by setting a fixed seed
 DetectorFactory.seed = 0
@@ -125,8 +157,135 @@ HISTORICAL_URLS = {
     ],
 }
 
-# Initialize FastAPI application
-app = FastAPI()
+# Supported feed fetching modes: 'async' drives every feed from one asyncio event
+# loop, 'threaded' is the legacy ThreadPoolExecutor path kept for benchmarking
+FETCH_MODES = ('async', 'threaded')
+
+# Article storage backends: 'sqlite' serves the API (FTS5 keyword search, rollup
+# tables), 'duckdb' is a columnar store for analytical queries over large corpora
+STORAGE_BACKENDS = ('sqlite', 'duckdb')
+
+# Raw VADER scores stored next to the sentiment label, and the compound score thresholds
+# (negative, positive) the stored label was assigned with
+SCORE_FIELDS = ('sentiment_compound', 'sentiment_pos', 'sentiment_neg', 'sentiment_neu')
+SENTIMENT_THRESHOLDS = (-0.05, 0.05)
+
+# FilterRequest score range prefixes ({prefix}_min, {prefix}_max) and the column each one bounds
+SCORE_FILTERS = {'compound': 'sentiment_compound', 'pos': 'sentiment_pos', 'neg': 'sentiment_neg',
+                 'neu': 'sentiment_neu'}
+
+# Columns returned by the article endpoints (derived columns such as year are left out)
+ARTICLE_FIELDS = ('title', 'publication_date', 'source', 'country', 'summary', 'url', 'language',
+                  'sentiment') + SCORE_FIELDS
+ARTICLE_COLUMNS = ', '.join(ARTICLE_FIELDS)
+
+# FilterRequest fields that map one-to-one onto an indexed news column
+FILTER_FIELDS = ('country', 'source', 'language', 'sentiment', 'year')
+
+# Derived columns: the year filter and a Unix timestamp for time buckets, from publication_date,
+# and the enriched filter, 0 while the language is the PENDING_ENRICHMENT placeholder
+GENERATED_COLUMNS = {
+    'year': "TEXT GENERATED ALWAYS AS (strftime('%Y', publication_date)) VIRTUAL",
+    'published_at': "INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', publication_date) AS INTEGER)) VIRTUAL",
+    'enriched': "INTEGER GENERATED ALWAYS AS (language != 'pending') VIRTUAL",
+}
+
+# Secondary indexes on the news table; every FILTER_FIELDS column leads a (field, publication_date)
+# index, so a filtered page is read in keyset order from the index without walking the table
+NEWS_INDEXES = {
+    'idx_news_country_date': ('country', 'publication_date'),
+    'idx_news_source_date': ('source', 'publication_date'),
+    'idx_news_language_date': ('language', 'publication_date'),
+    'idx_news_sentiment_date': ('sentiment', 'publication_date'),
+    'idx_news_year_date': ('year', 'publication_date'),
+    'idx_news_country_source': ('country', 'source'),
+    'idx_news_language_sentiment': ('language', 'sentiment'),
+    # Score ranges and custom thresholds (articles without scores keep their sentiment label);
+    # publication_date makes them cover a page's sort key
+    'idx_news_compound_date': ('sentiment_compound', 'sentiment', 'publication_date'),
+    'idx_news_pos_date': ('sentiment_pos', 'publication_date'),
+    'idx_news_neg_date': ('sentiment_neg', 'publication_date'),
+    'idx_news_neu_date': ('sentiment_neu', 'publication_date'),
+    'idx_news_year_country': ('year', 'country'),
+    'idx_news_publication_date': ('publication_date',),  # Keyset pagination order
+    'idx_news_published_at': ('published_at',),  # Time ranges of /news/timeseries
+    'idx_news_enriched_date': ('enriched', 'publication_date'),  # Deferred enrichment, see FilterRequest.enriched
+}
+
+# BM25 column weights for keyword search (title matches count double) and the
+# markers wrapped around matched terms in snippets (bold in Markdown)
+FTS_WEIGHTS = (2.0, 1.0)
+SNIPPET_MARKERS = ('**', '**')
+
+# Page sizes of the keyset-paginated article endpoints
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Most values of one filter field that a page query reads as separate keyset-ordered
+# index ranges and merges, see keyset_merge_field
+MAX_MERGED_VALUES = 50
+
+# Rows fetched per fetchmany call when streaming articles, and the media type of each stream format
+STREAM_BATCH_SIZE = 500
+STREAM_MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'json': 'application/json'}
+
+# Dimensions of the news_rollup table and the fields /news/stats can group by
+ROLLUP_FIELDS = ('day', 'country', 'source', 'language', 'sentiment')
+STATS_FIELDS = FILTER_FIELDS + ('day',)
+
+# Parquet archive: Hive partition keys (publication day, then country), the value
+# used for a missing key and the compression codec
+ARCHIVE_PARTITIONS = ('date', 'country')
+ARCHIVE_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+ARCHIVE_COMPRESSION = 'zstd'
+# Days behind the newest archived publication day that still take late articles;
+# older days are closed and their parts merged into one file per partition
+ARCHIVE_OPEN_DAYS = 2
+
+# Articles read from the store per batch by the incremental exports (CSV, JSON Lines, Parquet)
+EXPORT_BATCH_SIZE = 10000
+
+# Per-source language priors: detections remembered per source, the samples and the
+# dominant-language share needed before detection is skipped for that source, and how
+# often an article from such a source is still detected to keep the prior honest
+LANGUAGE_PRIOR_WINDOW = 1000
+LANGUAGE_PRIOR_MIN_SAMPLES = 200
+LANGUAGE_PRIOR_THRESHOLD = 0.99
+LANGUAGE_PRIOR_VERIFY_EVERY = 20
+
+# Enrichment worker processes (1 runs enrichment in the writer thread) and the articles
+# shipped to a worker per task
+ENRICH_WORKERS = os.cpu_count() or 1
+ENRICH_CHUNK_SIZE = 250
+
+# Enrichment cache: results kept in memory per kind, rows kept in the SQLite table, and
+# the share of rows evicted at once when the table is full
+ENRICH_CACHE_MEMORY = 50000
+ENRICH_CACHE_MAX_ROWS = 1000000
+ENRICH_CACHE_EVICT_FRACTION = 0.1
+
+# Enrichment modes: 'inline' enriches articles before saving them, 'deferred' saves them
+# at once with PENDING_ENRICHMENT as language and sentiment and leaves enrichment to the
+# background backfill, which takes BACKFILL_BATCH_SIZE articles at a time and looks for
+# pending articles every BACKFILL_INTERVAL seconds when nothing wakes it
+ENRICHMENT_MODES = ('inline', 'deferred')
+PENDING_ENRICHMENT = 'pending'
+BACKFILL_BATCH_SIZE = 1000
+BACKFILL_INTERVAL = 60
+
+# Feed results buffered between the fetch workers and the pipeline writer; fetching
+# blocks while the buffer is full, so memory stays flat however many feeds a run covers
+PIPELINE_QUEUE_SIZE = 64
+
+# Error messages kept per scrape run for job progress reports (all errors are logged)
+MAX_RUN_ERRORS = 20
+
+# Bucket sizes and group-by dimensions of /news/timeseries
+TIMESERIES_BUCKETS = ('hour', 'day', 'week')
+TIMESERIES_GROUPS = ('country', 'source', 'language', 'sentiment')
+
+# Initialize FastAPI application; responses are serialized with orjson
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Pydantic model for RSS feed scrape request
 class ScrapeRequest(BaseModel):
@@ -142,351 +301,3924 @@ class FilterRequest(BaseModel):
     sentiment: str | None = None  # Filter by sentiment (optional)
     year: str | None = None  # Filter by year (optional)
     keyword: str | None = None  # Filter by keyword in title/summary (optional)
+    enriched: bool | None = None  # True: only enriched articles, False: only ones awaiting enrichment (optional)
+    compound_min: float | None = Field(None, ge=-1, le=1)  # Minimum VADER compound score (optional)
+    compound_max: float | None = Field(None, ge=-1, le=1)  # Maximum VADER compound score (optional)
+    pos_min: float | None = Field(None, ge=0, le=1)  # Minimum positive share (optional)
+    pos_max: float | None = Field(None, ge=0, le=1)  # Maximum positive share (optional)
+    neg_min: float | None = Field(None, ge=0, le=1)  # Minimum negative share (optional)
+    neg_max: float | None = Field(None, ge=0, le=1)  # Maximum negative share (optional)
+    neu_min: float | None = Field(None, ge=0, le=1)  # Minimum neutral share (optional)
+    neu_max: float | None = Field(None, ge=0, le=1)  # Maximum neutral share (optional)
+    positive_threshold: float | None = Field(None, ge=-1, le=1)  # Label compound scores above as positive (optional)
+    negative_threshold: float | None = Field(None, ge=-1, le=1)  # Label compound scores below as negative (optional)
+    cursor: str | None = None  # Cursor of the previous page (optional, default: first page)
+    limit: int = Field(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)  # Page size
+    include_total: bool = False  # Also count every matching article
+    stream: Literal['ndjson', 'json'] | None = None  # Stream every match from the cursor on instead of one page
 
-class NewsScraper:
-    """Class to manage news scraping, storage, and processing."""
+class AsyncFeedFetcher:
+    """Fetch feed bodies concurrently on an asyncio event loop.
+
+    A global semaphore caps the number of requests in flight and a per-host
+    semaphore keeps a single slow server from taking up the whole budget.
+    Slots are released while waiting to retry, so backoff never stalls other feeds.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_in_flight=100, per_host_limit=4, retries=3, backoff_factor=1, timeout=10):
+        """Initialize the fetcher with its concurrency and retry settings.
+
+        Args:
+            max_in_flight (int): Maximum number of requests in flight across all hosts.
+            per_host_limit (int): Maximum number of concurrent requests to one host.
+            retries (int): Number of retries on network errors and retryable statuses.
+            backoff_factor (float): Base delay in seconds for exponential backoff.
+            timeout (float): Per-request timeout in seconds.
+        """
+        self.max_in_flight = max_in_flight
+        self.per_host_limit = per_host_limit
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self._in_flight = None
+        self._host_limits = {}
+
+    def create_client(self):
+        """Create an HTTP client sized for the configured concurrency.
+
+        Must be called from the event loop that will run the fetches, since it
+        also resets the semaphores bound to that loop.
+
+        Returns:
+            httpx.AsyncClient: Client that follows redirects like requests does.
+        """
+        limits = httpx.Limits(max_connections=self.max_in_flight,
+                              max_keepalive_connections=self.max_in_flight)
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._host_limits = {}
+        return httpx.AsyncClient(headers={'User-Agent': 'Mozilla/5.0'}, limits=limits,
+                                 timeout=self.timeout, follow_redirects=True)
+
+    def _host_limit(self, url):
+        """Return the semaphore guarding requests to the host of a URL."""
+        host = urlparse(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
+
+    async def fetch(self, client, url, headers=None):
+        """Fetch a URL, retrying network errors and retryable statuses with backoff.
+
+        Args:
+            client (httpx.AsyncClient): Client created by create_client.
+            url (str): URL to fetch.
+            headers (dict, optional): Extra request headers.
+
+        Returns:
+            httpx.Response: Successful (or 304 Not Modified) response.
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                # Host slot first: requests queued behind a slow host must not hold global slots
+                async with self._host_limit(url), self._in_flight:
+                    response = await client.get(url, headers=headers)
+                if response.status_code == 304:
+                    return response
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.retries:
+                    response.raise_for_status()
+                    return response
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+class ConnectionFactory:
+    """Create tuned SQLite connections for the news database.
     
-    def __init__(self, db_name='news_data.db', output_dir='downloads'):
-        """Initialize the NewsScraper with database and output directory settings.
+    The database runs in WAL mode so a running save never blocks readers.
+    Writes go through one shared writer connection serialized by a lock, and
+    every thread gets its own query-only reader connection. Async code awaits
+    queries through run(), which executes them on a bounded thread pool.
+    """
+
+    def __init__(self, db_name, mmap_size=256 * 1024 * 1024, cache_size_kib=64 * 1024, busy_timeout=30,
+                 pool_size=8):
+        """Initialize the factory and switch the database to WAL mode.
         
         Args:
-            db_name (str): Name of the SQLite database file (default: 'news_data.db').
-            output_dir (str): Directory to save output files (default: 'downloads').
+            db_name (str): Path of the SQLite database.
+            mmap_size (int): Bytes of the database file to memory-map (default: 256 MiB).
+            cache_size_kib (int): Page cache size per connection in KiB (default: 64 MiB).
+            busy_timeout (float): Seconds to wait for a lock before failing (default: 30).
+            pool_size (int): Threads, and so reader connections, serving run() (default: 8).
         """
         self.db_name = db_name
-        self.output_dir = output_dir
-        self.create_output_directory()
-        self.setup_database()
-        self.news_data = []  # List to store scraped articles
-        self.session = self.setup_session()
-        self.analyzer = SentimentIntensityAnalyzer()  # Initialize sentiment analyzer
-        self.scheduler = BackgroundScheduler()  # Initialize background scheduler
-        self.setup_scheduler()
+        self.mmap_size = mmap_size
+        self.cache_size_kib = cache_size_kib
+        self.busy_timeout = busy_timeout
+        self._write_lock = threading.Lock()
+        self._writer = None
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='db')
+        with self.writer() as conn:
+            # journal_mode is persistent, so setting it once covers every connection
+            journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+        logging.info(f"Database journal mode: {journal_mode}")
 
-    def create_output_directory(self):
-        """Create the output directory if it doesn't exist."""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-            logging.info(f"Created output directory: {self.output_dir}")
+    def connect(self, query_only=False):
+        """Open a new connection with the tuned PRAGMAs applied.
+        
+        Query-only connections return sqlite3.Row rows, which convert straight
+        to dicts for the API without going through pandas.
+        
+        Args:
+            query_only (bool, optional): Reject writes on this connection. Defaults to False.
+            
+        Returns:
+            sqlite3.Connection: Tuned connection, usable from any thread.
+        """
+        conn = sqlite3.connect(self.db_name, timeout=self.busy_timeout, check_same_thread=False)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
+        conn.execute(f'PRAGMA cache_size={-int(self.cache_size_kib)}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        if query_only:
+            conn.execute('PRAGMA query_only=ON')
+            conn.row_factory = sqlite3.Row
+        return conn
 
-    def setup_database(self):
-        """Set up the SQLite database with a news table."""
-        try:
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS news (
-                        title TEXT,
-                        publication_date TEXT,
-                        source TEXT,
-                        country TEXT,
-                        summary TEXT,
-                        url TEXT,
-                        language TEXT NOT NULL,
-                        sentiment TEXT,
-                        UNIQUE(title, publication_date, source, url)
-                    )
-                ''')
-                conn.commit()
-            logging.info("Database setup completed")
-        except sqlite3.Error as e:
-            logging.error(f"Database setup error: {str(e)}")
+    @contextmanager
+    def writer(self):
+        """Borrow the writer connection for one transaction.
+        
+        Commits when the block exits normally and rolls back on error.
+        
+        Yields:
+            sqlite3.Connection: The shared writer connection.
+        """
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self.connect()
+            try:
+                yield self._writer
+                self._writer.commit()
+            except BaseException:
+                self._writer.rollback()
+                raise
 
-    def setup_session(self):
-        """Set up an HTTP session with retry mechanism for scraping.
+    @contextmanager
+    def reader(self):
+        """Borrow this thread's reader connection.
         
-        Returns:
-            requests.Session: Configured session with retries.
+        Yields:
+            sqlite3.Connection: Query-only connection owned by the calling thread.
         """
-        session = requests.Session()
-        retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-        session.mount('http://', HTTPAdapter(max_retries=retries))
-        session.mount('https://', HTTPAdapter(max_retries=retries))
-        return session
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self.connect(query_only=True)
+        yield conn
 
-    def clean_text(self, text):
-        """Clean text by removing extra whitespace and handling encoding issues.
+    async def run(self, func, *args):
+        """Run a blocking database function on the pool without blocking the event loop.
         
         Args:
-            text (str): Input text to clean.
+            func (callable): Function doing the database work, typically through reader().
+            *args: Positional arguments for func.
             
         Returns:
-            str: Cleaned text.
+            Any: Result of func; exceptions are raised in the awaiting coroutine.
         """
-        if not text:
-            return ""
-        cleaned = re.sub(r'\s+', ' ', text.strip())
-        return cleaned.encode('utf-8', errors='ignore').decode('utf-8')
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
 
-    def detect_language(self, text):
-        """Detect the language of the provided text using langdetect.
+    def close(self):
+        """Stop the query pool and close the writer and the calling thread's reader connection."""
+        self._executor.shutdown(wait=True)
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+class LanguageDetector:
+    """Batch language identification with per-source priors.
+
+    Every text is detected with one shared, seeded langdetect factory whose
+    profiles are loaded once. Batches skip texts too short to classify and
+    detect each distinct text once. Sources whose last LANGUAGE_PRIOR_WINDOW
+    detections are nearly all one language get that language without detection;
+    every verify_every-th article of such a source is still detected and fed
+    back, so a source that changes language loses its prior.
+    """
+
+    def __init__(self, window=LANGUAGE_PRIOR_WINDOW, min_samples=LANGUAGE_PRIOR_MIN_SAMPLES,
+                 threshold=LANGUAGE_PRIOR_THRESHOLD, verify_every=LANGUAGE_PRIOR_VERIFY_EVERY):
+        """Load the language profiles.
         
         Args:
-            text (str): Text to analyze for language detection.
+            window (int, optional): Detections remembered per source. Defaults to LANGUAGE_PRIOR_WINDOW.
+            min_samples (int, optional): Detections needed before a prior applies. Defaults to
+                LANGUAGE_PRIOR_MIN_SAMPLES.
+            threshold (float, optional): Share of the dominant language needed for a prior. Defaults
+                to LANGUAGE_PRIOR_THRESHOLD.
+            verify_every (int, optional): Detect every n-th article of a source with a prior. Defaults
+                to LANGUAGE_PRIOR_VERIFY_EVERY.
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self.verify_every = verify_every
+        self.factory = DetectorFactory()
+        self.factory.load_profile(PROFILES_DIRECTORY)
+        self._history = {}  # source -> deque of recent detected languages
+        self._counts = {}  # source -> Counter over the deque
+        self._skipped = {}  # source -> articles given the prior since the last verification
+        self._lock = threading.Lock()
+
+    def warm(self, store):
+        """Seed the per-source histories with the most recent stored languages.
+        
+        Args:
+            store (NewsStore): Storage backend of the news corpus.
             
         Returns:
-            str: Language code (e.g., 'en', 'hi') or 'unknown' if detection fails.
+            int: Number of sources that have a prior after warming.
         """
         try:
-            if len(text.strip()) < 10:
-                return 'unknown'
-            lang = detect(text[:1000])  # Limit to first 1000 characters
-            return lang if lang else 'unknown'
+            for source, language in store.source_languages(self.window):
+                self.observe(source, language)
         except Exception as e:
-            logging.error(f"Language detection error: {str(e)}")
-            return 'unknown'
+            logging.error(f"Error warming language priors: {str(e)}")
+        return sum(1 for source in list(self._history) if self.prior(source))
 
-    def analyze_sentiment(self, text):
-        """Analyze the sentiment of the provided text using VADER.
+    def observe(self, source, language):
+        """Record a detected language for a source.
         
         Args:
-            text (str): Text to analyze for sentiment.
+            source (str): News agency name.
+            language (str): Detected language code; 'unknown' and PENDING_ENRICHMENT are not recorded.
+        """
+        if language in ('unknown', PENDING_ENRICHMENT):
+            return
+        with self._lock:
+            history = self._history.get(source)
+            if history is None:
+                history = self._history[source] = deque(maxlen=self.window)
+                self._counts[source] = Counter()
+            counts = self._counts[source]
+            if len(history) == self.window:
+                counts[history[0]] -= 1
+            history.append(language)
+            counts[language] += 1
+
+    def prior(self, source):
+        """Get the language a source almost always publishes in.
+        
+        Args:
+            source (str): News agency name.
             
         Returns:
-            str: Sentiment label ('positive', 'negative', 'neutral', or 'unknown').
+            str: Dominant language code, or None if the source has no prior yet.
         """
-        try:
-            scores = self.analyzer.polarity_scores(text)
-            compound = scores['compound']
-            if compound > 0.05:
-                return 'positive'
-            elif compound < -0.05:
-                return 'negative'
-            else:
-                return 'neutral'
-        except Exception as e:
-            logging.error(f"Sentiment analysis error: {str(e)}")
-            return 'unknown'
+        with self._lock:
+            history = self._history.get(source)
+            if not history or len(history) < self.min_samples:
+                return None
+            language, count = self._counts[source].most_common(1)[0]
+        return language if count >= self.threshold * len(history) else None
 
-    def fetch_feed(self, country, agency, feed_url):
-        """Fetch and parse articles from an RSS feed.
+    def detect(self, text):
+        """Detect the language of one text (the per-call path).
         
         Args:
-            country (str): Country associated with the feed.
-            agency (str): News agency name.
-            feed_url (str): URL of the RSS feed.
+            text (str): Text to analyze.
             
         Returns:
-            list: List of article dictionaries with title, date, source, etc.
+            str: Language code (e.g., 'en', 'hi') or 'unknown' if detection fails.
         """
-        try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = self.session.get(feed_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
-
-            if not feed.entries:
-                logging.warning(f"No entries found for {agency} ({country})")
-                return []
+        return detect_language(self.factory, text)
 
-            entries = []
-            one_year_ago = datetime.now() - timedelta(days=365)
-
-            for entry in feed.entries:
-                try:
-                    pub_date = entry.get('published', entry.get('updated', ''))
-                    if pub_date:
-                        try:
-                            pub_date = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %z')
-                            if pub_date < one_year_ago:
-                                continue
-                        except ValueError:
-                            pub_date = datetime.now()
-                    else:
-                        pub_date = datetime.now()
-                except Exception as e:
-                    logging.error(f"Error parsing date for {entry.get('title', 'No title')}: {str(e)}")
-                    pub_date = datetime.now()
-
-                title = self.clean_text(entry.get('title', 'No Title'))
-                summary = self.clean_text(entry.get('summary', entry.get('description', '')))
-                url = entry.get('link', '')
-                language = self.detect_language(title + ' ' + summary)
-                sentiment = self.analyze_sentiment(summary)
-
-                entries.append({
-                    'title': title,
-                    'publication_date': pub_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'source': agency,
-                    'country': country,
-                    'summary': summary,
-                    'url': url,
-                    'language': language,
-                    'sentiment': sentiment
-                })
-
-            logging.info(f"Fetched {len(entries)} articles from {agency} ({country})")
-            return entries
-
-        except requests.RequestException as e:
-            logging.error(f"Failed to fetch {feed_url} for {agency} ({country}): {str(e)}")
-            return []
-        except Exception as e:
-            logging.error(f"Error processing {feed_url} for {agency} ({country}): {str(e)}")
-            return []
-
-    def scrape_historical_articles(self, historical_urls):
-        """Scrape articles from historical URLs.
+    def detect_batch(self, texts, sources=None, stats=None):
+        """Detect the languages of a batch of texts.
         
         Args:
-            historical_urls (dict): Dictionary of URLs by country.
+            texts (list): Texts to analyze.
+            sources (list, optional): Source of each text, enabling priors. Defaults to no priors.
+            stats (dict, optional): Counters to increment: 'detected', 'prior', 'repeated' and 'short'.
             
         Returns:
-            list: List of article dictionaries with scraped metadata.
+            list: Language code per text, 'unknown' where detection is not possible.
         """
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        entries = []
-
-        for country, urls in historical_urls.items():
-            for url in urls:
-                try:
-                    response = self.session.get(url, headers=headers, timeout=10)
-                    response.encoding = 'utf-8'
-                    soup = BeautifulSoup(response.text, 'summary')
+        languages, pending = self.plan_batch(texts, sources, stats)
+        detected = [self.detect(text) for text in pending]
+        return self.finish_batch(languages, pending, detected, sources)
 
-                    title = self.clean_text(soup.find('title').text if soup.find('title') else 'No Title')
-                    summary = self.clean_text(' '.join(p.text for p in soup.find_all('p')[:3]) if soup.find_all('p') else '')
-                    pub_date = soup.find('meta', property='article:published_time')
-                    pub_date = pub_date['content'] if pub_date and pub_date.get('content') else datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    source = soup.find('meta', property='og_site')
-                    source = source['content'] if source and source.get('content') else 'Unknown'
-                    language = self.detect_language(title + ' ' + summary)
-                    sentiment = self.analyze_sentiment(summary)
-
-                    entries.append({
-                        'title': title,
-                        'publication_date': pub_date,
-                        'source': source,
-                        'country': country,
-                        'summary': summary,
-                        'url': url,
-                        'language': language,
-                        'sentiment': sentiment
-                    })
-                except Exception as e:
-                    logging.error(f"Historical scrape error for {url}: {str(e)}")
+    def plan_batch(self, texts, sources=None, stats=None):
+        """Assign the languages that need no detection and collect the texts that do.
+        
+        Args:
+            texts (list): Texts to analyze.
+            sources (list, optional): Source of each text, enabling priors. Defaults to no priors.
+            stats (dict, optional): Counters to increment: 'detected', 'prior', 'repeated' and 'short'.
+            
+        Returns:
+            tuple: Language per text (None where pending) and a dict mapping each distinct
+                text to detect to the indexes of the texts waiting for it.
+        """
+        sources = sources or [None] * len(texts)
+        languages = [None] * len(texts)
+        pending = {}
+        counts = Counter()
+        for i, (text, source) in enumerate(zip(texts, sources)):
+            if len(text.strip()) < 10:
+                languages[i] = 'unknown'
+                counts['short'] += 1
+                continue
+            prior = self.prior(source) if source is not None else None
+            if prior:
+                with self._lock:
+                    skipped = self._skipped.get(source, 0) + 1
+                    self._skipped[source] = 0 if skipped >= self.verify_every else skipped
+                if skipped < self.verify_every:
+                    languages[i] = prior
+                    counts['prior'] += 1
                     continue
-        return entries
-
-    def scrape_all_feeds(self):
-        """Scrape all configured RSS feeds and historical articles."""
-        tasks = []
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for country, feeds in RSS_FEEDS.items():
-                for agency, feed_url in feeds:
-                    tasks.append(executor.submit(self.fetch_feed, country, agency, feed_url))
-            self.news_data.extend(self.scrape_historical_articles(HISTORICAL_URLS))
-            for future in tasks:
-                self.news_data.extend(future.result())
-        logging.info(f"Total articles fetched: {len(self.news_data)}")
+            key = text[:1000]
+            if key in pending:
+                counts['repeated'] += 1
+            pending.setdefault(key, []).append(i)
+        counts['detected'] = len(pending)
+        if stats is not None:
+            for name, count in counts.items():
+                stats[name] = stats.get(name, 0) + count
+        return languages, pending
 
-    def scrape_single_feed(self, feed_url, country='Custom', agency='Custom Feed'):
-        """Scrape a single RSS feed and save results.
+    def finish_batch(self, languages, pending, detected, sources=None):
+        """Fill in detected languages and feed them back into the source priors.
         
         Args:
-            feed_url (str): URL of the RSS feed.
-            country (str, optional): Country of the feed. Defaults to 'Custom'.
-            agency (str, optional): Agency name. Defaults to 'Custom Feed'.
+            languages (list): Languages returned by plan_batch, None where pending.
+            pending (dict): Texts to detect returned by plan_batch.
+            detected (list): Detected language per pending text, in the same order.
+            sources (list, optional): Source of each text. Defaults to no priors.
             
         Returns:
-            list: List of scraped article dictionaries.
+            list: Language code per text.
         """
-        entries = self.fetch_feed(country, agency, feed_url)
-        self.news_data.extend(entries)
-        self.save_to_database()
-        self.save_to_csv()
-        self.save_to_json()
-        return entries
+        for indexes, language in zip(pending.values(), detected):
+            for i in indexes:
+                languages[i] = language
+                if sources and sources[i] is not None:
+                    self.observe(sources[i], language)
+        return languages
+
+def sentiment_label(compound, thresholds=SENTIMENT_THRESHOLDS):
+    """Label a VADER compound score.
+    
+    Args:
+        compound (float): Compound score, or None when the text could not be scored.
+        thresholds (tuple, optional): (negative, positive) thresholds. Defaults to SENTIMENT_THRESHOLDS.
+        
+    Returns:
+        str: Sentiment label ('positive', 'negative', 'neutral', or 'unknown').
+    """
+    if compound is None:
+        return 'unknown'
+    negative, positive = thresholds
+    if compound > positive:
+        return 'positive'
+    elif compound < negative:
+        return 'negative'
+    else:
+        return 'neutral'
 
-    def remove_duplicates(self):
-        """Remove duplicate articles based on title, source, and URL."""
-        df = pd.DataFrame(self.news_data)
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['title', 'source', 'url'], keep='first')
-        self.news_data = df.to_dict('records')
-        logging.info(f"Removed {initial_count - len(self.news_data)} duplicates")
+class EnrichmentCache:
+    """Language and sentiment results memoized by a hash of the normalized text.
 
-    def save_to_csv(self):
-        """Save scraped articles to a CSV file."""
-        try:
-            df = pd.DataFrame(self.news_data)
-            output_path = os.path.join(self.output_dir, 'news_data.csv')
-            df.to_csv(output_path, index=False, encoding='utf-8')
-            logging.info(f"Saved to {output_path}")
-        except Exception as e:
-            logging.error(f"Error saving to CSV: {str(e)}")
+    Syndicated stories reach many feeds, and across runs, with identical text.
+    Results live in an in-memory LRU of ENRICH_CACHE_MEMORY entries per kind in
+    front of the enrichment_cache table. Each row records when it was last used,
+    and the least recently used rows are evicted once the table holds more than
+    max_rows. Normalization only unifies Unicode forms and whitespace, because
+    VADER scores case and punctuation.
+    """
 
-    def save_to_json(self):
-        """Save scraped articles to a JSON file."""
-        try:
-            df = pd.DataFrame(self.news_data)
-            output_path = os.path.join(self.output_dir, 'news_data.json')
-            df.to_json(output_path, orient='records', force_ascii=False)
-            logging.info(f"Saved to {output_path}")
-        except Exception as e:
-            logging.error(f"Error saving to JSON: {str(e)}")
+    def __init__(self, db, memory_size=ENRICH_CACHE_MEMORY, max_rows=ENRICH_CACHE_MAX_ROWS):
+        """Create the cache table if needed.
+        
+        Args:
+            db (ConnectionFactory): Connection factory of the scraper database.
+            memory_size (int, optional): Entries kept in memory per kind. Defaults to ENRICH_CACHE_MEMORY.
+            max_rows (int, optional): Rows kept in the database. Defaults to ENRICH_CACHE_MAX_ROWS.
+        """
+        self.db = db
+        self.memory_size = memory_size
+        self.max_rows = max_rows
+        self._memory = {}  # kind -> OrderedDict of text hash -> result
+        self._touched = {}  # kind -> hashes read from the database since the last put_many
+        self._lock = threading.Lock()
+        self.rows = 0
+        self.setup()
 
-    def save_to_database(self):
-        """Save scraped articles to the SQLite database."""
+    def setup(self):
+        """Create the enrichment_cache table and count its rows."""
         try:
-            with sqlite3.connect(self.db_name) as conn:
-                for item in self.news_data:
-                    cursor = conn.cursor()
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO news (title, publication_date, source, country, summary, url, language, sentiment)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        item['title'],
-                        item['publication_date'],
-                        item['source'],
-                        item['country'],
-                        item['summary'],
-                        item['url'],
-                        item['language'],
-                        item['sentiment']
-                    ))
-                    conn.commit()
-            logging.info("Saved data to database")
+            with self.db.writer() as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS enrichment_cache (
+                        kind TEXT NOT NULL,
+                        text_hash BLOB NOT NULL,
+                        value TEXT NOT NULL,
+                        used_at INTEGER NOT NULL,
+                        PRIMARY KEY (kind, text_hash)
+                    )
+                ''')
+                conn.execute('CREATE INDEX IF NOT EXISTS idx_enrichment_cache_used_at ON enrichment_cache(used_at)')
+                self.rows = conn.execute('SELECT COUNT(*) FROM enrichment_cache').fetchone()[0]
         except sqlite3.Error as e:
-            logging.error(f"Error saving to database: {str(e)}")
+            logging.error(f"Enrichment cache setup error: {str(e)}")
 
-    def setup_scheduler(self):
-        """Set up a background scheduler to run scraping every 4 hours."""
-        self.scheduler.add_job(self.run_scrape, 'interval', hours=4)
-        self.scheduler.start()
-        logging.info("Scheduler started for scraping every 4 hours")
+    @staticmethod
+    def text_hash(text):
+        """Hash a text after normalizing its Unicode form and whitespace.
+        
+        Args:
+            text (str): Text to hash.
+            
+        Returns:
+            bytes: 16-byte BLAKE2b digest.
+        """
+        normalized = ' '.join(unicodedata.normalize('NFC', text).split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+    def get_many(self, kind, texts, stats=None):
+        """Look up cached results for texts.
+        
+        Args:
+            kind (str): Result kind, 'language' or 'vader' (JSON score lists).
+            texts (iterable): Texts to look up.
+            stats (dict, optional): Counters to increment: '<kind>_cache_hits' and '<kind>_cache_misses'.
+            
+        Returns:
+            dict: Cached result by text, for the texts found.
+        """
+        hashes = {text: self.text_hash(text) for text in texts}
+        found = {}
+        with self._lock:
+            memory = self._memory.setdefault(kind, OrderedDict())
+            for text, digest in hashes.items():
+                if digest in memory:
+                    memory.move_to_end(digest)
+                    found[text] = memory[digest]
+        missing = {digest: text for text, digest in hashes.items() if text not in found}
+        if missing:
+            try:
+                stored = {}
+                with self.db.reader() as conn:
+                    digests = list(missing)
+                    for i in range(0, len(digests), 500):
+                        chunk = digests[i:i + 500]
+                        rows = conn.execute(f"SELECT text_hash, value FROM enrichment_cache WHERE kind = ? "
+                                            f"AND text_hash IN ({','.join('?' * len(chunk))})", [kind, *chunk])
+                        stored.update((bytes(digest), value) for digest, value in rows)
+                with self._lock:
+                    self._touched.setdefault(kind, set()).update(stored)
+                    self._remember(kind, stored)
+                found.update((missing[digest], value) for digest, value in stored.items())
+            except sqlite3.Error as e:
+                logging.error(f"Enrichment cache read error: {str(e)}")
+        if stats is not None:
+            stats[f'{kind}_cache_hits'] = stats.get(f'{kind}_cache_hits', 0) + len(found)
+            stats[f'{kind}_cache_misses'] = stats.get(f'{kind}_cache_misses', 0) + len(hashes) - len(found)
+        return found
 
-    def run_scrape(self):
-        """Run the full scraping process and save results."""
+    def put_many(self, kind, results):
+        """Store new results, refresh the rows read since the last call and evict if full.
+        
+        Args:
+            kind (str): Result kind, 'language' or 'vader' (JSON score lists).
+            results (iterable): (text, result) tuples.
+        """
+        entries = {self.text_hash(text): value for text, value in results}
+        now = int(time.time())
+        with self._lock:
+            self._remember(kind, entries)
+            touched = self._touched.pop(kind, set())
         try:
-            self.news_data = []
-            self.scrape_all_feeds()
-            self.remove_duplicates()
-            self.save_to_csv()
-            self.save_to_json()
-            self.save_to_database()
-            logging.info("Scheduled scraping completed")
-        except Exception as e:
-            logging.error(f"Scheduled scraping failed: {str(e)}")
+            with self.db.writer() as conn:
+                before = conn.total_changes
+                conn.executemany('INSERT OR IGNORE INTO enrichment_cache (kind, text_hash, value, used_at) '
+                                 'VALUES (?, ?, ?, ?)', [(kind, digest, value, now) for digest, value in entries.items()])
+                self.rows += conn.total_changes - before
+                conn.executemany('UPDATE enrichment_cache SET used_at = ? WHERE kind = ? AND text_hash = ?',
+                                 [(now, kind, digest) for digest in touched])
+                if self.rows > self.max_rows:
+                    evict = self.rows - self.max_rows + int(self.max_rows * ENRICH_CACHE_EVICT_FRACTION)
+                    conn.execute('DELETE FROM enrichment_cache WHERE rowid IN '
+                                 '(SELECT rowid FROM enrichment_cache ORDER BY used_at LIMIT ?)', (evict,))
+                    self.rows = conn.execute('SELECT COUNT(*) FROM enrichment_cache').fetchone()[0]
+                    logging.info(f"Evicted {evict} least recently used enrichment cache rows")
+        except sqlite3.Error as e:
+            logging.error(f"Enrichment cache write error: {str(e)}")
 
-scraper = NewsScraper()
+    def _remember(self, kind, entries):
+        """Add results to the in-memory LRU of a kind; call with the lock held."""
+        memory = self._memory.setdefault(kind, OrderedDict())
+        for digest, value in entries.items():
+            memory[digest] = value
+            memory.move_to_end(digest)
+        while len(memory) > self.memory_size:
+            memory.popitem(last=False)
 
-# API Endpoints
-@app.get("/news")
-async def get_all_news():
-    """Fetch all news articles from the database.
+class SeenItemIndex:
+    """In-memory index of articles already ingested, checked before enrichment.
     
-    Returns:
-        list: List of article dictionaries.
-        
-    Raises:
-        HTTPException: If there's an error accessing the database.
+    Keys are (source, link) pairs, falling back to the title for entries without
+    a link. This is coarser than the news table's UNIQUE(title, publication_date,
+    source, url) key: an entry whose link a source already served is dropped even
+    when its title or publication date changed since, so feeds that re-serve an
+    article with an edited headline or a bumped date do not store it again.
     """
-    try:
-        with sqlite3.connect(scraper.db_name) as conn:
-            df = pd.read_sql_query("SELECT * FROM news", conn)
-        return df.to_dict(orient='records')
-    except Exception as e:
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._keys = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source, url, title):
+        """Build the index key of an article.
+        
+        Args:
+            source (str): News agency name.
+            url (str): Article link (may be empty).
+            title (str): Cleaned article title.
+            
+        Returns:
+            tuple: Index key.
+        """
+        return (source, url or title)
+
+    def warm(self, store):
+        """Load the keys of every stored article, typically once at startup.
+        
+        Args:
+            store (NewsStore): Storage backend of the news corpus.
+            
+        Returns:
+            int: Number of keys in the index after warming.
+        """
+        try:
+            keys = {self.key(source, url, title) for source, url, title in store.article_keys()}
+            with self._lock:
+                self._keys.update(keys)
+        except Exception as e:
+            logging.error(f"Error warming seen-item index: {str(e)}")
+        return len(self)
+
+    def add_articles(self, articles):
+        """Mark articles as ingested.
+        
+        Args:
+            articles (list): Article dictionaries that were saved.
+        """
+        keys = [self.key(a['source'], a['url'], a['title']) for a in articles]
+        with self._lock:
+            self._keys.update(keys)
+
+    def contains(self, source, url, title):
+        """Check whether an article has already been ingested.
+        
+        Args:
+            source (str): News agency name.
+            url (str): Article link (may be empty).
+            title (str): Cleaned article title.
+            
+        Returns:
+            bool: True if the article is already stored.
+        """
+        return self.key(source, url, title) in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+class DataVersionCache:
+    """Read-through cache of query results, keyed on a data-version counter.
+
+    The owner bumps the version whenever rows are written; entries cached under
+    an older version are dropped, so results are served from memory until new
+    data lands.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache at version 0."""
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def bump(self):
+        """Advance the data version and drop every cached entry.
+
+        Returns:
+            int: The new data version.
+        """
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            return self.version
+
+    def get(self, key, loader):
+        """Return the cached value of key, calling loader on a miss.
+
+        A value loaded while the version changed is returned but not cached,
+        since it may predate the write that bumped the version.
+
+        Args:
+            key (hashable): Cache key, e.g. the facet name.
+            loader (callable): Zero-argument function computing the value.
+
+        Returns:
+            Any: Cached or freshly loaded value.
+        """
+        with self._lock:
+            version = self.version
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = loader()
+        with self._lock:
+            if self.version == version:
+                self._entries[key] = value
+        return value
+
+    def stats(self):
+        """Return the cache counters.
+
+        Returns:
+            dict: Data version, hits, misses, hit rate and number of cached entries.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'version': self.version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries)
+            }
+
+class JobRegistry:
+    """Run background jobs one at a time and keep their status for polling.
+    
+    Jobs of the same kind are single-flight: submitting a kind that is already
+    queued or running returns the existing job instead of starting another.
+    """
+
+    def __init__(self, max_finished=50):
+        """Initialize the registry and its worker thread.
+        
+        Args:
+            max_finished (int, optional): Finished jobs kept for polling. Defaults to 50.
+        """
+        self.max_finished = max_finished
+        self._jobs = {}
+        self._active = {}  # Job ID of the queued or running job of each kind
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job')
+
+    def submit(self, kind, func, progress=None):
+        """Queue func as a job of the given kind unless one is already in flight.
+        
+        Args:
+            kind (str): Job kind used for single-flight protection.
+            func (callable): Zero-argument function run in the background; its return
+                value becomes the job result.
+            progress (callable, optional): Zero-argument function returning the live
+                progress of the job while it runs.
+            
+        Returns:
+            tuple: Job status dictionary and True if a new job was created.
+        """
+        with self._lock:
+            active = self._active.get(kind)
+            if active:
+                return self._snapshot(self._jobs[active]), False
+            job = {
+                'id': uuid.uuid4().hex,
+                'kind': kind,
+                'status': 'queued',
+                'submitted_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'started_at': None,
+                'finished_at': None,
+                'progress': None,
+                'result': None,
+                'error': None,
+                '_progress': progress
+            }
+            self._jobs[job['id']] = job
+            self._active[kind] = job['id']
+            self._prune()
+            snapshot = self._snapshot(job)
+        self._executor.submit(self._run, job, func)
+        return snapshot, True
+
+    def get(self, job_id):
+        """Return the status of a job, including live progress while it runs.
+        
+        Args:
+            job_id (str): Job ID returned by submit.
+            
+        Returns:
+            dict: Job status, or None if the job is unknown or was pruned.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def _run(self, job, func):
+        with self._lock:
+            job['status'] = 'running'
+            job['started_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            result = func()
+            status, error = 'succeeded', None
+        except Exception as e:
+            logging.error(f"Job {job['id']} ({job['kind']}) failed: {str(e)}")
+            result, status, error = None, 'failed', str(e)
+        progress = job['_progress']() if job['_progress'] else None
+        with self._lock:
+            job.update(status=status, result=result, error=error, progress=progress,
+                       finished_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            del self._active[job['kind']]
+
+    def _snapshot(self, job):
+        snapshot = {key: value for key, value in job.items() if not key.startswith('_')}
+        if job['status'] == 'running' and job['_progress']:
+            snapshot['progress'] = job['_progress']()
+        return snapshot
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job['finished_at']]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+class ScrapeRun:
+    """Counters, errors and feed validators of one scrape.
+
+    Every full scrape job and every single-feed scrape gets its own run, so
+    concurrent scrapes never mix their counters or persist each other's
+    validators. Validators are kept per feed until the feed's articles are
+    saved; feeds whose articles failed to save are excluded from persistence
+    so the next run fetches and parses them again.
+    """
+
+    def __init__(self):
+        """Initialize zeroed counters and empty validator and failure sets."""
+        self.stats = {'feeds_total': 0, 'feeds_parsed': 0, 'feeds_not_modified': 0, 'feeds_unchanged': 0,
+                      'feeds_failed': 0, 'entries_new': 0, 'entries_seen': 0, 'entries_duplicate': 0,
+                      'languages_detected': 0, 'languages_from_prior': 0, 'language_cache_hits': 0,
+                      'language_cache_misses': 0, 'vader_cache_hits': 0, 'vader_cache_misses': 0,
+                      'articles_inserted': 0, 'articles_deferred': 0, 'articles_ignored': 0,
+                      'articles_failed': 0, 'articles_archived': 0, 'error_count': 0, 'errors': []}
+        self.validators = {}  # ETag/Last-Modified/body hash by feed URL, persisted once the articles are saved
+        self.failed_feeds = set()  # Feeds whose articles were not saved
+        self._lock = threading.Lock()
+
+    def record_stat(self, name, count=1):
+        """Increment a counter; safe to call from fetch worker threads.
+
+        Args:
+            name (str): Counter name.
+            count (int, optional): Amount to add. Defaults to 1.
+        """
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + count
+
+    def record_error(self, message):
+        """Log an error and keep it in the run's error list.
+
+        Args:
+            message (str): Error message.
+        """
+        logging.error(message)
+        with self._lock:
+            self.stats['error_count'] += 1
+            if len(self.stats['errors']) < MAX_RUN_ERRORS:
+                self.stats['errors'].append(message)
+
+    def set_validators(self, feed_url, validators):
+        """Remember the validators of a feed that was fetched successfully.
+
+        Args:
+            feed_url (str): URL of the RSS feed.
+            validators (dict): etag, last_modified and body_hash of the response.
+        """
+        with self._lock:
+            self.validators[feed_url] = validators
+
+    def fail_feeds(self, feed_urls):
+        """Keep the validators of feeds whose articles were not saved from being persisted.
+
+        Args:
+            feed_urls (Iterable): URLs of the affected feeds.
+        """
+        with self._lock:
+            self.failed_feeds.update(feed_urls)
+
+    def saved_validators(self):
+        """Return the validators of the feeds whose articles were all saved.
+
+        Returns:
+            dict: Validators by feed URL.
+        """
+        with self._lock:
+            return {feed_url: validators for feed_url, validators in self.validators.items()
+                    if feed_url not in self.failed_feeds}
+
+    def progress(self):
+        """Snapshot the counters for job progress reports.
+
+        Returns:
+            dict: Copy of the counters with the number of feeds done so far and the
+                enrichment cache hit rates (None before any lookup).
+        """
+        with self._lock:
+            progress = dict(self.stats, errors=list(self.stats['errors']))
+        progress['feeds_done'] = (progress['feeds_parsed'] + progress['feeds_not_modified'] +
+                                  progress['feeds_unchanged'] + progress['feeds_failed'])
+        for kind in ('language', 'vader'):
+            lookups = progress[f'{kind}_cache_hits'] + progress[f'{kind}_cache_misses']
+            progress[f'{kind}_cache_hit_rate'] = round(progress[f'{kind}_cache_hits'] / lookups, 4) if lookups else None
+        return progress
+
+class ArticlePipeline:
+    """Bounded-memory path from parsed feed entries to stored articles.
+
+    Fetch workers hand each feed's new entries to put(), which blocks while the
+    queue is full, so a slow writer throttles fetching instead of letting articles
+    pile up. One writer thread drops entries already stored or already pending,
+    then enriches and saves the rest in fixed-size batches (in deferred mode it
+    saves them unenriched and wakes the EnrichmentBackfill). Peak memory depends on
+    the queue and batch sizes and the feeds in flight, not on the number of feeds.
+    Feeds with entries in a batch that failed are marked failed on the run, so
+    their validators are not persisted.
+    """
+
+    def __init__(self, scraper, run, batch_size=1000, queue_size=PIPELINE_QUEUE_SIZE):
+        """Initialize the pipeline; call start() before putting entries.
+        
+        Args:
+            scraper (NewsScraper): Scraper providing the seen-item index, enrichment and storage.
+            run (ScrapeRun): Run receiving the counters, errors and failed feeds.
+            batch_size (int, optional): Articles enriched and saved per batch. Defaults to 1000.
+            queue_size (int, optional): Feed results buffered before put() blocks. Defaults to PIPELINE_QUEUE_SIZE.
+        """
+        self.scraper = scraper
+        self.run = run
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batch = []
+        self.batch_keys = set()
+        self.batch_feeds = set()  # Feeds with entries in the current batch
+        self._thread = threading.Thread(target=self._run, name='article-pipeline', daemon=True)
+
+    def start(self):
+        """Start the writer thread."""
+        self._thread.start()
+
+    def put(self, entries, feed_url=None):
+        """Queue one feed's parsed entries, blocking while the queue is full.
+        
+        Args:
+            entries (list): Article dictionaries without language and sentiment.
+            feed_url (str, optional): URL of the feed the entries came from. Defaults to None.
+        """
+        if entries:
+            self.queue.put((feed_url, entries))
+
+    def close(self):
+        """Save the last partial batch and wait for the writer thread to finish."""
+        self.queue.put(None)
+        self._thread.join()
+
+    def add(self, entries, feed_url=None):
+        """Add entries to the current batch, dropping duplicates within the run.
+        
+        Articles saved by earlier batches are in the seen-item index; the batch
+        keys catch repeats that are still waiting to be saved.
+        
+        Args:
+            entries (list): Article dictionaries without language and sentiment.
+            feed_url (str, optional): URL of the feed the entries came from. Defaults to None.
+        """
+        duplicates = 0
+        for item in entries:
+            key = SeenItemIndex.key(item['source'], item['url'], item['title'])
+            if key in self.batch_keys or self.scraper.seen_index.contains(item['source'], item['url'], item['title']):
+                duplicates += 1
+                continue
+            self.batch_keys.add(key)
+            self.batch.append(item)
+            if feed_url:
+                self.batch_feeds.add(feed_url)
+            if len(self.batch) >= self.batch_size:
+                self.flush()
+        self.run.record_stat('entries_duplicate', duplicates)
+
+    def flush(self):
+        """Enrich (or mark for deferred enrichment) and save the current batch."""
+        if not self.batch:
+            return
+        batch, feeds = self.batch, self.batch_feeds
+        self.batch, self.batch_keys, self.batch_feeds = [], set(), set()
+        try:
+            saved = self.scraper.save_to_database(self.scraper.prepare_articles(batch, self.run), run=self.run)
+        except Exception:
+            self.run.fail_feeds(feeds)
+            raise
+        if saved['failed']:
+            self.run.fail_feeds(feeds)
+        self.run.record_stat('articles_inserted', saved['inserted'])
+        self.run.record_stat('articles_ignored', saved['ignored'])
+        if self.scraper.enrichment == 'deferred' and saved['inserted']:
+            self.run.record_stat('articles_deferred', saved['inserted'])
+            self.scraper.backfill.notify()
+
+    def _run(self):
+        """Consume queued entries until close() is called."""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    self.flush()
+                else:
+                    self.add(item[1], item[0])
+            except Exception as e:
+                # Keep draining the queue so fetch workers never block on a dead writer
+                if item is not None and item[0]:
+                    self.run.fail_feeds([item[0]])
+                self.run.record_error(f"Pipeline error: {str(e)}")
+            if item is None:
+                break
+
+class EnrichmentBackfill:
+    """Background worker enriching the articles saved in deferred enrichment mode.
+
+    The thread sleeps until notify() is called or BACKFILL_INTERVAL passes, then
+    enriches pending articles oldest first, BACKFILL_BATCH_SIZE at a time, until
+    none are left, and brings the exports up to date. Enrichment goes through
+    NewsScraper.enrich_articles, so it uses the language priors, the enrichment
+    cache and the worker processes.
+    """
+
+    def __init__(self, scraper, batch_size=BACKFILL_BATCH_SIZE, interval=BACKFILL_INTERVAL):
+        """Initialize the worker; it starts on the first notify() or an explicit start().
+        
+        Args:
+            scraper (NewsScraper): Scraper providing the store and enrichment.
+            batch_size (int, optional): Articles enriched per batch. Defaults to BACKFILL_BATCH_SIZE.
+            interval (float, optional): Seconds between checks without a notify(). Defaults to BACKFILL_INTERVAL.
+        """
+        self.scraper = scraper
+        self.batch_size = batch_size
+        self.interval = interval
+        self.backfilled = 0  # Articles enriched since startup
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start the worker thread if it is not running; it is stopped at interpreter exit."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='enrichment-backfill', daemon=True)
+                self._thread.start()
+                # A thread left running at exit can abort the process inside DuckDB
+                atexit.register(self.stop)
+
+    def notify(self):
+        """Wake the worker to enrich the pending articles now."""
+        self.start()
+        self._wake.set()
+
+    def stop(self):
+        """Stop the worker after its current batch."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def run_once(self):
+        """Enrich one batch of pending articles.
+        
+        Returns:
+            int: Number of articles enriched (0 when none are pending).
+        """
+        rows = self.scraper.store.pending_articles(self.batch_size)
+        if not rows:
+            return 0
+        self.scraper.enrich_articles([item for _, item in rows])
+        updated = self.scraper.store.update_enrichment(rows)
+        self.backfilled += updated
+        logging.info(f"Backfilled enrichment of {updated} articles")
+        return len(rows)
+
+    def _run(self):
+        """Enrich pending articles whenever woken, until stop() is called."""
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                enriched = 0
+                while not self._stop.is_set():
+                    count = self.run_once()
+                    if not count:
+                        break
+                    enriched += count
+                if enriched:
+                    # Exports stop at the first pending article, so they can catch up now
+                    self.scraper.save_to_csv()
+                    self.scraper.save_to_json()
+                    self.scraper.save_to_archive()
+            except Exception as e:
+                logging.error(f"Enrichment backfill error: {str(e)}")
+
+def run_coroutine(coro):
+    """Run a coroutine to completion from synchronous code.
+
+    Falls back to a helper thread when called from inside a running event loop
+    (e.g. a FastAPI endpoint), where asyncio.run is not allowed.
+
+    Args:
+        coro (coroutine): Coroutine to run.
+
+    Returns:
+        Any: Result of the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+class NewsScraper:
+    """Class to manage news scraping, storage, and processing."""
+    
+    def __init__(self, db_name='news_data.db', output_dir='downloads', fetch_mode='async',
+                 max_in_flight=100, per_host_limit=4, db_batch_size=1000, storage='sqlite',
+                 enrich_workers=ENRICH_WORKERS, enrichment='inline'):
+        """Initialize the NewsScraper with database and output directory settings.
+        
+        Args:
+            db_name (str): Name of the SQLite database file (default: 'news_data.db').
+            output_dir (str): Directory to save output files (default: 'downloads').
+            fetch_mode (str): Feed fetching mode, one of FETCH_MODES (default: 'async').
+            max_in_flight (int): Global cap on concurrent feed requests in async mode (default: 100).
+            per_host_limit (int): Cap on concurrent requests per host in async mode (default: 4).
+            db_batch_size (int): Articles enriched and saved per pipeline batch, and rows per
+                executemany call when saving to the database (default: 1000).
+            storage (str): Article storage backend, one of STORAGE_BACKENDS (default: 'sqlite'). The
+                DuckDB store lives next to the SQLite file with a .duckdb extension.
+            enrich_workers (int): Processes running language detection and sentiment analysis; 1
+                runs them in the pipeline writer thread (default: ENRICH_WORKERS, the CPU count).
+            enrichment (str): One of ENRICHMENT_MODES; 'deferred' saves articles before enriching
+                them in the background (default: 'inline').
+        """
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode}")
+        if enrichment not in ENRICHMENT_MODES:
+            raise ValueError(f"Unknown enrichment mode: {enrichment}")
+        if storage not in STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {storage}")
+        self.db_name = db_name
+        self.output_dir = output_dir
+        self.fetch_mode = fetch_mode
+        self.max_in_flight = max_in_flight
+        self.per_host_limit = per_host_limit
+        self.db_batch_size = db_batch_size
+        self.db = ConnectionFactory(db_name)  # WAL-mode reader/writer connections
+        self.create_output_directory()
+        self.setup_database()
+        if storage == 'duckdb':
+            self.store = DuckDBStore(os.path.splitext(db_name)[0] + '.duckdb')
+        else:
+            self.store = SQLiteStore(self.db)
+        self.csv_export = CsvExport(os.path.join(output_dir, 'news_data.csv'))  # Append-only CSV of every article
+        self.json_export = JsonLinesExport(os.path.join(output_dir, 'news_data.jsonl'))  # Same, as JSON Lines
+        self.archive = ParquetArchive(os.path.join(output_dir, 'archive'))  # Partitioned Parquet copy of the corpus
+        self.feed_validators = self.load_feed_validators()  # Persisted ETag/Last-Modified/body hash by feed URL
+        self.seen_index = SeenItemIndex()  # Articles already stored, skipped before enrichment
+        self.warm_seen_index()
+        self.language_detector = LanguageDetector()  # Batched language detection with per-source priors
+        self.warm_language_priors()
+        self.session = self.setup_session()
+        self.analyzer = SentimentIntensityAnalyzer()  # Initialize sentiment analyzer
+        self.enrich_workers = enrich_workers
+        self.enrich_pool = None  # Worker processes for enrich_articles, started on first use
+        self._enrich_pool_lock = threading.Lock()
+        self._enrich_pool_failed = False
+        self.enrichment_cache = EnrichmentCache(self.db)  # Memoized language and sentiment by text hash
+        self.enrichment = enrichment
+        self.backfill = EnrichmentBackfill(self)  # Enriches articles saved in deferred mode
+        if enrichment == 'deferred' or self.store.first_pending_id() is not None:
+            self.backfill.notify()
+        self.jobs = JobRegistry()  # Background scrape jobs, polled through /jobs/{job_id}
+        self.scheduler = BackgroundScheduler()  # Initialize background scheduler
+        self.setup_scheduler()
+
+    def create_output_directory(self):
+        """Create the output directory if it doesn't exist."""
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+            logging.info(f"Created output directory: {self.output_dir}")
+
+    def setup_database(self):
+        """Set up the SQLite tables the scraper keeps for itself (feed validators).
+        
+        Articles live in the storage backend, see SQLiteStore.setup.
+        """
+        try:
+            with self.db.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS feed_validators (
+                        feed_url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        body_hash TEXT,
+                        updated_at TEXT
+                    )
+                ''')
+            logging.info("Database setup completed")
+        except sqlite3.Error as e:
+            logging.error(f"Database setup error: {str(e)}")
+
+    def load_feed_validators(self):
+        """Load the persisted HTTP validators of every known feed.
+        
+        Returns:
+            dict: Mapping of feed URL to a dict with etag, last_modified and body_hash.
+        """
+        try:
+            with self.db.reader() as conn:
+                cursor = conn.execute('SELECT feed_url, etag, last_modified, body_hash FROM feed_validators')
+                return {
+                    row[0]: {'etag': row[1], 'last_modified': row[2], 'body_hash': row[3]}
+                    for row in cursor.fetchall()
+                }
+        except sqlite3.Error as e:
+            logging.error(f"Error loading feed validators: {str(e)}")
+            return {}
+
+    def save_feed_validators(self, run):
+        """Persist the validators collected during a run.
+        
+        Called only after the articles have been saved, and skips feeds whose
+        articles failed to save, so the next run never skips a feed whose
+        articles were not stored.
+        
+        Args:
+            run (ScrapeRun): Run whose validators to persist.
+        """
+        pending = run.saved_validators()
+        if not pending:
+            return
+        updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        try:
+            with self.db.writer() as conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO feed_validators (feed_url, etag, last_modified, body_hash, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [
+                    (feed_url, v['etag'], v['last_modified'], v['body_hash'], updated_at)
+                    for feed_url, v in pending.items()
+                ])
+            self.feed_validators.update(pending)
+            logging.info(f"Saved validators for {len(pending)} feeds")
+        except sqlite3.Error as e:
+            run.record_error(f"Error saving feed validators: {str(e)}")
+
+    def warm_seen_index(self):
+        """Warm the seen-item index from the news table."""
+        count = self.seen_index.warm(self.store)
+        logging.info(f"Seen-item index warmed with {count} articles")
+
+    def start_enrich_pool(self):
+        """Start the enrichment worker processes on first use.
+        
+        Scrapers that never enrich (most benchmarks, read-only API use) start no
+        workers. Workers are spawned rather than forked, because by now this
+        process runs the scheduler, database and backfill threads and a forked
+        child could inherit a lock one of them holds. They import only the
+        enrichment module and the main script, which builds no scraper at import
+        (see start_scraper), and load their analyzer and language profiles once
+        (see init_enrich_worker). Shut them down with close().
+        
+        Returns:
+            ProcessPoolExecutor: The worker pool, or None when enrich_workers is 1 or
+                less or the workers could not be started.
+        """
+        if self.enrich_workers <= 1:
+            return None
+        with self._enrich_pool_lock:
+            if self.enrich_pool is None and not self._enrich_pool_failed:
+                try:
+                    self.enrich_pool = ProcessPoolExecutor(max_workers=self.enrich_workers,
+                                                           initializer=init_enrich_worker,
+                                                           mp_context=multiprocessing.get_context('spawn'))
+                    logging.info(f"Started {self.enrich_workers} enrichment worker processes")
+                except Exception as e:
+                    self._enrich_pool_failed = True
+                    logging.error(f"Error starting enrichment workers, enriching inline: {str(e)}")
+            return self.enrich_pool
+
+    def close(self):
+        """Stop the scheduler, the enrichment backfill and workers, and close the stores.
+        
+        Call once the scraper is no longer needed (the API calls it at shutdown);
+        the scraper cannot be used afterwards.
+        """
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        self.backfill.stop()
+        with self._enrich_pool_lock:
+            if self.enrich_pool is not None:
+                self.enrich_pool.shutdown()
+                self.enrich_pool = None
+        self.store.close()
+        self.db.close()
+        logging.info("News scraper closed")
+
+    def warm_language_priors(self):
+        """Warm the per-source language priors from the most recent stored articles."""
+        count = self.language_detector.warm(self.store)
+        logging.info(f"Language priors warmed, {count} sources skip detection")
+
+    def conditional_headers(self, feed_url):
+        """Build request headers, adding If-None-Match/If-Modified-Since when validators are known.
+        
+        Args:
+            feed_url (str): URL of the RSS feed.
+            
+        Returns:
+            dict: Request headers.
+        """
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        validators = self.feed_validators.get(feed_url)
+        if validators:
+            if validators['etag']:
+                headers['If-None-Match'] = validators['etag']
+            if validators['last_modified']:
+                headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def process_feed_response(self, run, country, agency, feed_url, status_code, headers, content, conditional=True):
+        """Turn a feed response into articles, skipping feeds that have not changed.
+        
+        A 304 or a body identical to the last one seen skips feedparser, language
+        detection and sentiment analysis entirely. The response's validators are
+        kept on the run once the body has been parsed.
+        
+        Args:
+            run (ScrapeRun): Run receiving the counters and validators.
+            country (str): Country associated with the feed.
+            agency (str): News agency name.
+            feed_url (str): URL of the RSS feed.
+            status_code (int): HTTP status code of the response.
+            headers (Mapping): Response headers.
+            content (bytes): Response body.
+            conditional (bool, optional): Skip unchanged bodies and already stored entries. Defaults to True.
+            
+        Returns:
+            list: List of article dictionaries (empty when the feed was skipped).
+        """
+        if status_code == 304:
+            run.record_stat('feeds_not_modified')
+            logging.info(f"Not modified: {agency} ({country})")
+            return []
+
+        body_hash = hashlib.sha256(content).hexdigest()
+        previous = self.feed_validators.get(feed_url)
+        validators = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'body_hash': body_hash,
+        }
+        if conditional and previous and previous['body_hash'] == body_hash:
+            run.set_validators(feed_url, validators)
+            run.record_stat('feeds_unchanged')
+            logging.info(f"Unchanged body: {agency} ({country})")
+            return []
+
+        entries = self.parse_feed(country, agency, content, skip_seen=conditional, run=run)
+        run.set_validators(feed_url, validators)
+        run.record_stat('feeds_parsed')
+        return entries
+
+    def setup_session(self):
+        """Set up an HTTP session with retry mechanism for scraping.
+        
+        Returns:
+            requests.Session: Configured session with retries.
+        """
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        session.mount('http://', HTTPAdapter(max_retries=retries))
+        session.mount('https://', HTTPAdapter(max_retries=retries))
+        return session
+
+    def clean_text(self, text):
+        """Clean text by removing extra whitespace and handling encoding issues.
+        
+        Args:
+            text (str): Input text to clean.
+            
+        Returns:
+            str: Cleaned text.
+        """
+        if not text:
+            return ""
+        cleaned = re.sub(r'\s+', ' ', text.strip())
+        return cleaned.encode('utf-8', errors='ignore').decode('utf-8')
+
+    def detect_language(self, text):
+        """Detect the language of the provided text using langdetect.
+        
+        Args:
+            text (str): Text to analyze for language detection.
+            
+        Returns:
+            str: Language code (e.g., 'en', 'hi') or 'unknown' if detection fails.
+        """
+        return self.language_detector.detect(text)
+
+    def analyze_sentiment(self, text):
+        """Analyze the sentiment of the provided text using VADER.
+        
+        Args:
+            text (str): Text to analyze for sentiment.
+            
+        Returns:
+            str: Sentiment label ('positive', 'negative', 'neutral', or 'unknown').
+        """
+        scores = self.score_sentiment(text)
+        return sentiment_label(scores[0] if scores else None)
+
+    def score_sentiment(self, text):
+        """Score the sentiment of the provided text using VADER.
+        
+        Args:
+            text (str): Text to analyze for sentiment.
+            
+        Returns:
+            tuple: Compound, positive, negative and neutral scores, or None if the analysis fails.
+        """
+        return sentiment_scores(self.analyzer, text)
+
+    def parse_feed(self, country, agency, content, skip_seen=True, run=None):
+        """Parse a downloaded RSS feed body into articles, without enrichment.
+        
+        Entries already in the seen-item index are dropped here, before they
+        reach language detection and sentiment analysis (see enrich_articles).
+        
+        Args:
+            country (str): Country associated with the feed.
+            agency (str): News agency name.
+            content (bytes): Raw feed body.
+            skip_seen (bool, optional): Drop entries that are already stored. Defaults to True.
+            run (ScrapeRun, optional): Run receiving the entry counters. Defaults to None.
+            
+        Returns:
+            list: List of article dictionaries with title, date, source, etc.
+        """
+        feed = feedparser.parse(content)
+
+        if not feed.entries:
+            logging.warning(f"No entries found for {agency} ({country})")
+            return []
+
+        entries = []
+        seen = 0
+        one_year_ago = datetime.now() - timedelta(days=365)
+
+        for entry in feed.entries:
+            try:
+                pub_date = entry.get('published', entry.get('updated', ''))
+                if pub_date:
+                    try:
+                        pub_date = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %z')
+                        if pub_date < one_year_ago:
+                            continue
+                    except ValueError:
+                        pub_date = datetime.now()
+                else:
+                    pub_date = datetime.now()
+            except Exception as e:
+                logging.error(f"Error parsing date for {entry.get('title', 'No title')}: {str(e)}")
+                pub_date = datetime.now()
+
+            title = self.clean_text(entry.get('title', 'No Title'))
+            summary = self.clean_text(entry.get('summary', entry.get('description', '')))
+            url = entry.get('link', '')
+            if skip_seen and self.seen_index.contains(agency, url, title):
+                seen += 1
+                continue
+
+            entries.append({
+                'title': title,
+                'publication_date': pub_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'source': agency,
+                'country': country,
+                'summary': summary,
+                'url': url,
+            })
+
+        if run is not None:
+            run.record_stat('entries_new', len(entries))
+            run.record_stat('entries_seen', seen)
+        logging.info(f"Fetched {len(entries)} new articles from {agency} ({country}), skipped {seen} already stored")
+        return entries
+
+    def enrich_articles(self, articles, run=None):
+        """Add the detected language, sentiment label and VADER scores to articles, in place.
+        
+        Languages are detected for the whole batch at once, with per-source priors
+        kept in this process. Texts already analyzed in this or an earlier run come
+        from the enrichment cache; the remaining texts to detect and summaries to
+        score are split into chunks for the enrichment workers when there are any.
+        
+        Args:
+            articles (list): Article dictionaries with title and summary.
+            run (ScrapeRun, optional): Run receiving the detection and cache counters. Defaults to None.
+            
+        Returns:
+            list: The same article dictionaries.
+        """
+        stats = {}
+        sources = [item['source'] for item in articles]
+        languages, pending = self.language_detector.plan_batch(
+            [item['title'] + ' ' + item['summary'] for item in articles], sources, stats)
+        known_languages = self.enrichment_cache.get_many('language', pending, stats)
+        known_scores = {summary: orjson.loads(value) for summary, value in
+                        self.enrichment_cache.get_many('vader', {item['summary'] for item in articles}, stats).items()}
+        texts = [text for text in pending if text not in known_languages]
+        summaries = list({item['summary'] for item in articles} - known_scores.keys())
+        detected, scored = None, None
+        if (texts or summaries) and self.start_enrich_pool() is not None:
+            try:
+                detected, scored = self.enrich_in_workers(texts, summaries)
+            except Exception as e:
+                logging.error(f"Enrichment worker error, enriching inline: {str(e)}")
+        if detected is None:
+            detected = [self.detect_language(text) for text in texts]
+            scored = [self.score_sentiment(summary) for summary in summaries]
+        self.enrichment_cache.put_many('language', zip(texts, detected))
+        # A failed analysis is not remembered, so the text is retried next time
+        self.enrichment_cache.put_many('vader', [(summary, orjson.dumps(scores).decode()) for summary, scores
+                                                 in zip(summaries, scored) if scores is not None])
+        known_languages.update(zip(texts, detected))
+        known_scores.update(zip(summaries, scored))
+        languages = self.language_detector.finish_batch(languages, pending,
+                                                        [known_languages[text] for text in pending], sources)
+        for item, language in zip(articles, languages):
+            scores = known_scores[item['summary']] or (None,) * len(SCORE_FIELDS)
+            item['language'] = language
+            item['sentiment'] = sentiment_label(scores[0])
+            item.update(zip(SCORE_FIELDS, scores))
+        if run is not None:
+            run.record_stat('languages_detected', len(texts))
+            run.record_stat('languages_from_prior', stats.get('prior', 0))
+            for name in ('language_cache_hits', 'language_cache_misses', 'vader_cache_hits', 'vader_cache_misses'):
+                run.record_stat(name, stats.get(name, 0))
+        return articles
+
+    def prepare_articles(self, articles, run=None):
+        """Enrich articles before saving, or mark them for deferred enrichment.
+        
+        Args:
+            articles (list): Article dictionaries with title and summary.
+            run (ScrapeRun, optional): Run receiving the enrichment counters. Defaults to None.
+            
+        Returns:
+            list: The same article dictionaries, ready for save_to_database.
+        """
+        if self.enrichment != 'deferred':
+            return self.enrich_articles(articles, run)
+        for item in articles:
+            item['language'] = item['sentiment'] = PENDING_ENRICHMENT
+            item.update(dict.fromkeys(SCORE_FIELDS))
+        return articles
+
+    def enrich_in_workers(self, texts, summaries):
+        """Detect languages and score sentiments on the enrichment worker processes.
+        
+        Args:
+            texts (list): Texts to detect the language of.
+            summaries (list): Summaries to score the sentiment of.
+            
+        Returns:
+            tuple: Language code per text and score tuple (or None) per summary, in order.
+        """
+        chunks = max(1, -(-max(len(texts), len(summaries)) // ENRICH_CHUNK_SIZE))
+        text_step = -(-len(texts) // chunks) or 1
+        summary_step = -(-len(summaries) // chunks) or 1
+        futures = [self.enrich_pool.submit(enrich_chunk, texts[i * text_step:(i + 1) * text_step],
+                                           summaries[i * summary_step:(i + 1) * summary_step])
+                   for i in range(chunks)]
+        detected, sentiments = [], []
+        for future in futures:
+            chunk_languages, chunk_sentiments = future.result()
+            detected.extend(chunk_languages)
+            sentiments.extend(chunk_sentiments)
+        return detected, sentiments
+
+    def fetch_feed(self, run, country, agency, feed_url, conditional=True):
+        """Fetch and parse articles from an RSS feed.
+        
+        Args:
+            run (ScrapeRun): Run receiving the counters, errors and validators.
+            country (str): Country associated with the feed.
+            agency (str): News agency name.
+            feed_url (str): URL of the RSS feed.
+            conditional (bool, optional): Send validators and skip unchanged feeds. Defaults to True.
+            
+        Returns:
+            list: List of article dictionaries with title, date, source, etc.
+        """
+        try:
+            headers = self.conditional_headers(feed_url) if conditional else {'User-Agent': 'Mozilla/5.0'}
+            response = self.session.get(feed_url, headers=headers, timeout=10)
+            response.raise_for_status()
+            return self.process_feed_response(run, country, agency, feed_url, response.status_code,
+                                              response.headers, response.content, conditional)
+
+        except requests.RequestException as e:
+            run.record_stat('feeds_failed')
+            run.record_error(f"Failed to fetch {feed_url} for {agency} ({country}): {str(e)}")
+            return []
+        except Exception as e:
+            run.record_stat('feeds_failed')
+            run.record_error(f"Error processing {feed_url} for {agency} ({country}): {str(e)}")
+            return []
+
+    async def fetch_feed_async(self, run, fetcher, client, country, agency, feed_url):
+        """Fetch an RSS feed on the event loop and parse it in a worker thread.
+        
+        Args:
+            run (ScrapeRun): Run receiving the counters, errors and validators.
+            fetcher (AsyncFeedFetcher): Fetcher enforcing the concurrency limits.
+            client (httpx.AsyncClient): Client created by the fetcher.
+            country (str): Country associated with the feed.
+            agency (str): News agency name.
+            feed_url (str): URL of the RSS feed.
+            
+        Returns:
+            list: List of article dictionaries with title, date, source, etc.
+        """
+        try:
+            response = await fetcher.fetch(client, feed_url, headers=self.conditional_headers(feed_url))
+            # Parsing and enrichment are CPU-bound, keep them off the event loop
+            return await asyncio.to_thread(self.process_feed_response, run, country, agency, feed_url,
+                                           response.status_code, response.headers, response.content)
+
+        except httpx.HTTPError as e:
+            run.record_stat('feeds_failed')
+            run.record_error(f"Failed to fetch {feed_url} for {agency} ({country}): {str(e)}")
+            return []
+        except Exception as e:
+            run.record_stat('feeds_failed')
+            run.record_error(f"Error processing {feed_url} for {agency} ({country}): {str(e)}")
+            return []
+
+    def scrape_historical_articles(self, run, historical_urls):
+        """Scrape articles from historical URLs.
+        
+        Args:
+            run (ScrapeRun): Run receiving the errors.
+            historical_urls (dict): Dictionary of URLs by country.
+            
+        Returns:
+            list: List of article dictionaries with scraped metadata.
+        """
+        headers = {'User-Agent': 'Mozilla/5.0'}
+        entries = []
+
+        for country, urls in historical_urls.items():
+            for url in urls:
+                try:
+                    response = self.session.get(url, headers=headers, timeout=10)
+                    response.encoding = 'utf-8'
+                    soup = BeautifulSoup(response.text, 'summary')
+
+                    title = self.clean_text(soup.find('title').text if soup.find('title') else 'No Title')
+                    summary = self.clean_text(' '.join(p.text for p in soup.find_all('p')[:3]) if soup.find_all('p') else '')
+                    pub_date = soup.find('meta', property='article:published_time')
+                    pub_date = pub_date['content'] if pub_date and pub_date.get('content') else datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    source = soup.find('meta', property='og_site')
+                    source = source['content'] if source and source.get('content') else 'Unknown'
+
+                    entries.append({
+                        'title': title,
+                        'publication_date': pub_date,
+                        'source': source,
+                        'country': country,
+                        'summary': summary,
+                        'url': url,
+                    })
+                except Exception as e:
+                    run.record_error(f"Historical scrape error for {url}: {str(e)}")
+                    continue
+        return entries
+
+    def scrape_feeds_threaded(self, run, rss_feeds, historical_urls, sink):
+        """Scrape feeds with the legacy thread pool (one blocking request per worker).
+        
+        Args:
+            run (ScrapeRun): Run receiving the counters, errors and validators.
+            rss_feeds (dict): Dictionary of (agency, URL) feeds by country.
+            historical_urls (dict): Dictionary of historical URLs by country.
+            sink (callable): Receives each feed's list of parsed articles and the feed URL.
+        """
+        def fetch(country, agency, feed_url):
+            sink(self.fetch_feed(run, country, agency, feed_url), feed_url)
+
+        tasks = []
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            for country, feeds in rss_feeds.items():
+                for agency, feed_url in feeds:
+                    tasks.append(executor.submit(fetch, country, agency, feed_url))
+            sink(self.scrape_historical_articles(run, historical_urls))
+            for future in tasks:
+                future.result()
+
+    async def scrape_feeds_async(self, run, rss_feeds, historical_urls, sink):
+        """Scrape feeds concurrently on the event loop with per-host and global limits.
+        
+        Feed tasks are created as slots free up rather than all at once, and a
+        feed holds its slot until the sink has accepted its articles, so a blocked
+        sink stops new fetches instead of letting response bodies pile up.
+        
+        Args:
+            run (ScrapeRun): Run receiving the counters, errors and validators.
+            rss_feeds (dict): Dictionary of (agency, URL) feeds by country.
+            historical_urls (dict): Dictionary of historical URLs by country.
+            sink (callable): Receives each feed's list of parsed articles and the feed URL
+                (called in a worker thread).
+        """
+        fetcher = AsyncFeedFetcher(max_in_flight=self.max_in_flight, per_host_limit=self.per_host_limit)
+        # Twice the request budget, so feeds waiting on retries never take every slot
+        slots = asyncio.Semaphore(2 * self.max_in_flight)
+
+        async def scrape(client, country, agency, feed_url):
+            try:
+                entries = await self.fetch_feed_async(run, fetcher, client, country, agency, feed_url)
+                await asyncio.to_thread(sink, entries, feed_url)
+            finally:
+                slots.release()
+
+        async with fetcher.create_client() as client:
+            tasks = {asyncio.create_task(asyncio.to_thread(
+                lambda: sink(self.scrape_historical_articles(run, historical_urls))))}
+            for country, feeds in rss_feeds.items():
+                for agency, feed_url in feeds:
+                    await slots.acquire()
+                    task = asyncio.create_task(scrape(client, country, agency, feed_url))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+
+    def scrape_all_feeds(self, mode=None, rss_feeds=None, historical_urls=None, run=None):
+        """Scrape all configured RSS feeds and historical articles through an ArticlePipeline.
+        
+        Articles are deduplicated, enriched and saved in batches of db_batch_size
+        while feeds are still being fetched; nothing accumulates across feeds.
+        
+        Args:
+            mode (str, optional): Fetch mode override, one of FETCH_MODES. Defaults to self.fetch_mode.
+            rss_feeds (dict, optional): Feeds to scrape. Defaults to RSS_FEEDS.
+            historical_urls (dict, optional): Historical URLs to scrape. Defaults to HISTORICAL_URLS.
+            run (ScrapeRun, optional): Run receiving the counters, errors and validators. Defaults to a new one.
+            
+        Returns:
+            ScrapeRun: The run, with the validators of the feeds whose articles were saved.
+        """
+        mode = mode or self.fetch_mode
+        if mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {mode}")
+        rss_feeds = RSS_FEEDS if rss_feeds is None else rss_feeds
+        historical_urls = HISTORICAL_URLS if historical_urls is None else historical_urls
+        run = run or ScrapeRun()
+        run.record_stat('feeds_total', sum(len(feeds) for feeds in rss_feeds.values()))
+        start = time.perf_counter()
+        pipeline = ArticlePipeline(self, run, batch_size=self.db_batch_size)
+        pipeline.start()
+        try:
+            if mode == 'threaded':
+                self.scrape_feeds_threaded(run, rss_feeds, historical_urls, pipeline.put)
+            else:
+                run_coroutine(self.scrape_feeds_async(run, rss_feeds, historical_urls, pipeline.put))
+        finally:
+            pipeline.close()
+        progress = run.progress()
+        logging.info(f"Total articles fetched: {progress['entries_new']}, "
+                     f"saved: {progress['articles_inserted']}, failed to save: {progress['articles_failed']} "
+                     f"({mode} mode, {time.perf_counter() - start:.2f}s)")
+        logging.info(f"Feeds parsed: {progress['feeds_parsed']}, "
+                     f"skipped as not modified: {progress['feeds_not_modified']}, "
+                     f"skipped as unchanged: {progress['feeds_unchanged']}, "
+                     f"failed: {progress['feeds_failed']}")
+        logging.info(f"Entries enriched: {progress['entries_new'] - progress['entries_duplicate']}, "
+                     f"skipped as already stored: {progress['entries_seen']}, "
+                     f"repeated within the run: {progress['entries_duplicate']}")
+        logging.info(f"Enrichment cache hit rate: language {progress['language_cache_hit_rate']}, "
+                     f"sentiment scores {progress['vader_cache_hit_rate']}, "
+                     f"languages detected: {progress['languages_detected']}, "
+                     f"from a source prior: {progress['languages_from_prior']}")
+        return run
+
+    def scrape_single_feed(self, feed_url, country='Custom', agency='Custom Feed'):
+        """Scrape a single RSS feed and save results.
+        
+        Args:
+            feed_url (str): URL of the RSS feed.
+            country (str, optional): Country of the feed. Defaults to 'Custom'.
+            agency (str, optional): Agency name. Defaults to 'Custom Feed'.
+            
+        Returns:
+            list: List of scraped article dictionaries (awaiting enrichment in deferred mode).
+            
+        Raises:
+            RuntimeError: If the articles could not be saved; the feed's validators are not persisted.
+        """
+        # A run of its own, so a full scrape in flight never sees this feed's counters or validators
+        run = ScrapeRun()
+        # Ad-hoc scrapes always return every article of the feed, so fetch unconditionally
+        entries = self.prepare_articles(self.fetch_feed(run, country, agency, feed_url, conditional=False), run)
+        saved = self.save_to_database(entries, run=run)
+        if saved['failed']:
+            raise RuntimeError(run.stats['errors'][-1])
+        if self.enrichment == 'deferred' and saved['inserted']:
+            self.backfill.notify()
+        self.save_to_csv()
+        self.save_to_json()
+        self.save_to_archive()
+        self.save_feed_validators(run)
+        return entries
+
+    def save_to_csv(self):
+        """Append the articles stored since the last export to the CSV file.
+        
+        Returns:
+            int: Number of articles appended.
+        """
+        try:
+            exported = self.csv_export.export(self.store)
+            logging.info(f"Appended {exported} articles to {self.csv_export.path}")
+            return exported
+        except Exception as e:
+            logging.error(f"Error saving to CSV: {str(e)}")
+            return 0
+
+    def save_to_json(self):
+        """Append the articles stored since the last export to the JSON Lines file.
+        
+        Returns:
+            int: Number of articles appended.
+        """
+        try:
+            exported = self.json_export.export(self.store)
+            logging.info(f"Appended {exported} articles to {self.json_export.path}")
+            return exported
+        except Exception as e:
+            logging.error(f"Error saving to JSON: {str(e)}")
+            return 0
+
+    def save_to_database(self, articles, batch_size=None, run=None):
+        """Save scraped articles to the storage backend in a single transaction.
+        
+        Args:
+            articles (list): Enriched article dictionaries to save.
+            batch_size (int, optional): Rows per write call. Defaults to self.db_batch_size.
+            run (ScrapeRun, optional): Run receiving the error and failed count if the save fails. Defaults to None.
+            
+        Returns:
+            dict: Number of rows inserted, ignored as duplicates and failed (not saved because of an error).
+        """
+        batch_size = batch_size or self.db_batch_size
+        try:
+            inserted = self.store.insert_batch(articles, batch_size)
+            self.seen_index.add_articles(articles)
+            logging.info(f"Saved data to database: {inserted} inserted, {len(articles) - inserted} ignored")
+            return {'inserted': inserted, 'ignored': len(articles) - inserted, 'failed': 0}
+        except Exception as e:
+            message = f"Error saving {len(articles)} articles to database: {str(e)}"
+            if run is None:
+                logging.error(message)
+            else:
+                run.record_error(message)
+                run.record_stat('articles_failed', len(articles))
+            return {'inserted': 0, 'ignored': 0, 'failed': len(articles)}
+
+    def save_to_archive(self):
+        """Append the articles stored since the last export to the Parquet archive.
+        
+        Returns:
+            int: Number of articles archived.
+        """
+        try:
+            archived = self.archive.export(self.store)
+            logging.info(f"Archived {archived} articles to {self.archive.path}")
+            return archived
+        except Exception as e:
+            logging.error(f"Error saving to archive: {str(e)}")
+            return 0
+
+    def setup_scheduler(self):
+        """Set up a background scheduler to submit a scrape job every 4 hours."""
+        self.scheduler.add_job(self.submit_scrape, 'interval', hours=4)
+        self.scheduler.start()
+        logging.info("Scheduler started for scraping every 4 hours")
+
+    def submit_scrape(self):
+        """Start a full scrape as a background job unless one is already queued or running.
+        
+        Returns:
+            tuple: Job status dictionary and True if a new job was started.
+        """
+        run = ScrapeRun()
+        job, created = self.jobs.submit('scrape_all', lambda: self.run_scrape(run), progress=run.progress)
+        if created:
+            logging.info(f"Submitted scrape job {job['id']}")
+        else:
+            logging.info(f"Scrape job {job['id']} already in flight, not starting another")
+        return job, created
+
+    def run_scrape(self, run=None):
+        """Run the full scraping process and save results.
+        
+        Args:
+            run (ScrapeRun, optional): Run receiving the counters, errors and validators. Defaults to a new one.
+            
+        Returns:
+            dict: Final run counters.
+            
+        Raises:
+            Exception: Re-raised after logging when the scrape fails.
+        """
+        try:
+            run = self.scrape_all_feeds(run=run)
+            self.save_to_csv()
+            self.save_to_json()
+            run.record_stat('articles_archived', self.save_to_archive())
+            self.save_feed_validators(run)
+            logging.info("Scheduled scraping completed")
+            return run.progress()
+        except Exception as e:
+            logging.error(f"Scheduled scraping failed: {str(e)}")
+            raise
+
+def parse_keyword(keyword):
+    """Split a user keyword string into search terms.
+    
+    Quoted text is kept as one phrase and a trailing '*' on a word marks a prefix.
+    Terms without a letter or digit are dropped, as the FTS5 tokenizer ignores them.
+    
+    Args:
+        keyword (str): Keyword string, e.g. 'climate "trade war" elect*'.
+        
+    Returns:
+        list: (text, is_prefix) tuples, one per term.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', keyword):
+        text = phrase or word.replace('"', '')
+        prefix = bool(word) and text.endswith('*')
+        text = text.rstrip('*').strip()
+        if re.search(r'\w', text):
+            terms.append((text, prefix))
+    return terms
+
+def build_fts_query(keyword):
+    """Turn a user keyword string into a safe FTS5 MATCH expression.
+    
+    Every term is quoted so FTS5 operators in user input are inert; prefix terms
+    keep their '*'. All terms must match.
+    
+    Args:
+        keyword (str): Keyword string, e.g. 'climate "trade war" elect*'.
+        
+    Returns:
+        str: FTS5 query, or None if the keyword contains no terms.
+    """
+    terms = [f'"{text}"' + ('*' if prefix else '') for text, prefix in parse_keyword(keyword)]
+    return ' '.join(terms) or None
+
+def encode_cursor(order, key):
+    """Encode the sort key of the last row of a page as an opaque cursor.
+    
+    Args:
+        order (str): Sort order the key belongs to ('date' or 'rank').
+        key (list): Sort key values of the last row, ending with its rowid.
+        
+    Returns:
+        str: URL-safe cursor string.
+    """
+    payload = json.dumps({'o': order, 'k': key}, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, order):
+    """Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor (str): Cursor string from a previous page.
+        order (str): Sort order of the current query.
+        
+    Returns:
+        list: Sort key values of the last row of the previous page.
+        
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another sort order.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        key = payload['k']
+        if payload['o'] != order or not isinstance(key, list) or len(key) != 2:
+            raise ValueError
+        return key
+    except (ValueError, KeyError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+def sentiment_thresholds(filters):
+    """Get the compound score thresholds a request labels sentiment with.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        
+    Returns:
+        tuple: (negative, positive) thresholds, or None to use the stored labels.
+        
+    Raises:
+        ValueError: If the negative threshold is above the positive one.
+    """
+    if filters.positive_threshold is None and filters.negative_threshold is None:
+        return None
+    negative = SENTIMENT_THRESHOLDS[0] if filters.negative_threshold is None else filters.negative_threshold
+    positive = SENTIMENT_THRESHOLDS[1] if filters.positive_threshold is None else filters.positive_threshold
+    if negative > positive:
+        raise ValueError(f"negative_threshold ({negative}) must not be above positive_threshold ({positive})")
+    return negative, positive
+
+def sentiment_expr(filters, prefix='news.'):
+    """Build the SQL expression of the sentiment label under the request's thresholds.
+    
+    The thresholds are validated floats, so they are inlined rather than bound,
+    which keeps the expression usable in any SELECT list. Rows stored without
+    scores keep their stored label.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        prefix (str, optional): Table qualifier of the columns. Defaults to 'news.'.
+        
+    Returns:
+        str: SQL expression evaluating to the label.
+    """
+    thresholds = sentiment_thresholds(filters)
+    if thresholds is None:
+        return f'{prefix}sentiment'
+    negative, positive = (float(threshold) for threshold in thresholds)
+    compound = f'{prefix}sentiment_compound'
+    return (f"CASE WHEN {compound} IS NULL THEN {prefix}sentiment WHEN {compound} > {positive!r} THEN 'positive' "
+            f"WHEN {compound} < {negative!r} THEN 'negative' ELSE 'neutral' END")
+
+def build_score_clauses(filters, prefix='news.'):
+    """Build the WHERE conditions of score ranges and of a sentiment filter under custom thresholds.
+    
+    Both are ranges on the indexed score columns, so re-labeling the corpus with
+    other thresholds is an index range scan rather than a new VADER pass.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        prefix (str, optional): Table qualifier of the columns. Defaults to 'news.'.
+        
+    Returns:
+        tuple: List of SQL conditions and list of parameters.
+        
+    Raises:
+        ValueError: If the thresholds are inconsistent.
+    """
+    clauses, params = [], []
+    for name, column in SCORE_FILTERS.items():
+        low, high = getattr(filters, f'{name}_min'), getattr(filters, f'{name}_max')
+        if low is not None:
+            clauses.append(f'{prefix}{column} >= ?')
+            params.append(low)
+        if high is not None:
+            clauses.append(f'{prefix}{column} <= ?')
+            params.append(high)
+
+    thresholds = sentiment_thresholds(filters)
+    if thresholds and filters.sentiment:
+        negative, positive = thresholds
+        labels = sorted({v.strip() for v in filters.sentiment.split(',')})
+        compound = f'{prefix}sentiment_compound'
+        ranges = []
+        if 'positive' in labels:
+            ranges.append(f'{compound} > ?')
+            params.append(positive)
+        if 'negative' in labels:
+            ranges.append(f'{compound} < ?')
+            params.append(negative)
+        if 'neutral' in labels:
+            ranges.append(f'{compound} BETWEEN ? AND ?')
+            params.extend([negative, positive])
+        ranges.append(f"({compound} IS NULL AND {prefix}sentiment IN ({','.join(['?' for _ in labels])}))")
+        params.extend(labels)
+        clauses.append('(' + ' OR '.join(ranges) + ')')
+    return clauses, params
+
+def build_filter_clauses(filters):
+    """Build the FROM and WHERE clauses shared by filtered page and count queries.
+    
+    A keyword without searchable terms (e.g. '*' or only punctuation) matches no
+    articles rather than dropping the keyword filter.
+    
+    Args:
+        filters (FilterRequest): Filter parameters (comma-separated values per field).
+        
+    Returns:
+        tuple: FROM/WHERE SQL, list of parameters, and the FTS5 match expression (or None).
+    """
+    match = build_fts_query(filters.keyword) if filters.keyword else None
+    if match:
+        clauses = "FROM news_fts JOIN news ON news.rowid = news_fts.rowid WHERE news_fts MATCH ?"
+        params = [match]
+    elif filters.keyword:
+        clauses = "FROM news WHERE 0"
+        params = []
+    else:
+        clauses = "FROM news WHERE 1=1"
+        params = []
+
+    relabel = sentiment_thresholds(filters) is not None
+    for field in FILTER_FIELDS:
+        value = getattr(filters, field)
+        if value and not (field == 'sentiment' and relabel):
+            values = [v.strip() for v in value.split(',')]
+            clauses += f" AND news.{field} IN ({','.join(['?' for _ in values])})"
+            params.extend(values)
+    score_clauses, score_params = build_score_clauses(filters)
+    for clause in score_clauses:
+        clauses += f" AND {clause}"
+    params.extend(score_params)
+    if filters.enriched is not None:
+        clauses += " AND news.enriched = ?"
+        params.append(int(filters.enriched))
+    return clauses, params, match
+
+def indexed_values(filters):
+    """Parse the field filters a query applies as IN lists on indexed columns.
+    
+    Under custom thresholds the sentiment filter is a compound score range instead.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        
+    Returns:
+        dict: Set of selected values per filtered FILTER_FIELDS field.
+    """
+    selected = selected_values(filters)
+    if sentiment_thresholds(filters) is not None:
+        selected.pop('sentiment', None)
+    return selected
+
+def keyset_merge_field(filters):
+    """Pick the filter field whose values a page query reads as separate index ranges.
+    
+    Rows matching a multi-value IN on the leading column of a (field,
+    publication_date) index come out of date order, so SQLite would rather walk
+    the whole publication_date index, which for a rare value reads most of the
+    table per page. Reading each value as its own ordered range and merging the
+    ranges keeps a page proportional to its size. A single-value filter already
+    gives that order, so nothing is split then.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        
+    Returns:
+        str: FILTER_FIELDS field with the fewest values, or None if no field needs splitting.
+    """
+    selected = indexed_values(filters)
+    if not selected:
+        return None
+    field = min(selected, key=lambda name: len(selected[name]))
+    return field if 1 < len(selected[field]) <= MAX_MERGED_VALUES else None
+
+def build_filter_query(filters, columns=ARTICLE_FIELDS, cursor=None, limit=None):
+    """Build the SQL query and parameters for one page of filtered articles.
+    
+    Pages are keyset-paginated: newest first on (publication_date, rowid), or
+    by BM25 rank and rowid for keyword searches, which also carry a highlighted
+    summary snippet. Every row has its sort key in the _rowid (and _score)
+    columns so the caller can build the next cursor. With custom thresholds the
+    sentiment column is re-labeled from the compound score.
+    
+    Date-ordered pages are read in order from a (field, publication_date) index:
+    a multi-value field filter becomes one UNION ALL arm per value, merged by
+    the compound ORDER BY (see keyset_merge_field), and score ranges without a
+    field filter pick the page's rowids from a covering (score, publication_date)
+    index, so no page walks the table looking for rare matches.
+    
+    Keyword pages rank (rowid, score) pairs first, from news_fts alone when no
+    other filter applies, and only then read the page's rows and snippets. BM25
+    still scores every match, so a keyword page costs time proportional to the
+    number of matches. Scores depend on corpus-wide statistics, so articles
+    stored between two requests shift them and a rank cursor may then skip or
+    repeat rows; date cursors are not affected.
+    
+    Args:
+        filters (FilterRequest): Filter parameters (comma-separated values per field).
+        columns (tuple, optional): News columns to select. Defaults to ARTICLE_FIELDS.
+        cursor (str, optional): Cursor of the previous page. Defaults to the first page.
+        limit (int, optional): Maximum number of rows. Defaults to no limit.
+        
+    Returns:
+        tuple: SQL query string and list of parameters.
+        
+    Raises:
+        ValueError: If the cursor is invalid for this query.
+    """
+    clauses, params, match = build_filter_clauses(filters)
+    select = ', '.join(f'{sentiment_expr(filters)} AS sentiment' if column == 'sentiment' else f'news.{column}'
+                       for column in columns) + ', news.rowid AS _rowid'
+    if match:
+        score = f"bm25(news_fts, {FTS_WEIGHTS[0]}, {FTS_WEIGHTS[1]})"
+        # news.rowid makes SQLite check the cursor after the field filters, scoring fewer rows
+        key = 'news.rowid'
+        if params == [match]:
+            # The keyword is the only filter: rank straight from the FTS index without reading news
+            clauses = "FROM news_fts WHERE news_fts MATCH ?"
+            key = 'news_fts.rowid'
+        ranked = f"SELECT {key} AS rowid, {score} AS score {clauses}"
+        if cursor:
+            ranked += f" AND ({score}, {key}) > (?, ?)"
+            params.extend(decode_cursor(cursor, 'rank'))
+        ranked += " ORDER BY score, rowid"
+        if limit:
+            ranked += " LIMIT ?"
+            params.append(limit)
+        # Only the page's rows are read whole and get a snippet, each looked up in news_fts
+        # by rowid; a prefix term rebuilds its doclist on every lookup, so with one the
+        # matches are scanned once instead (CROSS JOIN fixes the join order)
+        if '"*' in match:
+            joins = f"news_fts CROSS JOIN ({ranked}) AS page ON page.rowid = news_fts.rowid"
+        else:
+            joins = f"({ranked}) AS page CROSS JOIN news_fts ON news_fts.rowid = page.rowid"
+        select += (f", snippet(news_fts, 1, '{SNIPPET_MARKERS[0]}', '{SNIPPET_MARKERS[1]}', '…', 24) AS snippet"
+                   ", page.score AS _score")
+        query = (f"SELECT {select} FROM {joins} CROSS JOIN news ON news.rowid = page.rowid "
+                 "WHERE news_fts MATCH ? ORDER BY page.score, page.rowid")
+        params.append(match)
+    else:
+        keyset, keyset_params = '', []
+        if cursor:
+            keyset = " AND (news.publication_date, news.rowid) < (?, ?)"
+            keyset_params = decode_cursor(cursor, 'date')
+        field = keyset_merge_field(filters)
+        score_clauses, _ = build_score_clauses(filters)
+        if field:
+            arms = [build_filter_clauses(filters.model_copy(update={field: value}))
+                    for value in sorted(indexed_values(filters)[field])]
+            query = ' UNION ALL '.join(f"SELECT {select} {arm_clauses}{keyset}" for arm_clauses, _, _ in arms)
+            query += " ORDER BY publication_date DESC, _rowid DESC"
+            params = [param for _, arm_params, _ in arms for param in arm_params + keyset_params]
+        elif score_clauses and not indexed_values(filters) and filters.enriched is None:
+            # '+' keeps SQLite from walking the publication_date index instead of the score range
+            rowids = f"SELECT news.rowid {clauses}"
+            if cursor:
+                rowids += " AND (+news.publication_date, news.rowid) < (?, ?)"
+            rowids += " ORDER BY +news.publication_date DESC, news.rowid DESC"
+            params += keyset_params
+            if limit:
+                rowids += " LIMIT ?"
+                params.append(limit)
+            query = (f"SELECT {select} FROM news WHERE news.rowid IN ({rowids}) "
+                     "ORDER BY news.publication_date DESC, news.rowid DESC")
+        else:
+            query = f"SELECT {select} {clauses}{keyset} ORDER BY news.publication_date DESC, news.rowid DESC"
+            params += keyset_params
+
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+    return query, params
+
+def build_count_query(filters):
+    """Build the SQL query and parameters counting every article matching the filters.
+    
+    Args:
+        filters (FilterRequest): Filter parameters (comma-separated values per field).
+        
+    Returns:
+        tuple: SQL query string and list of parameters.
+    """
+    clauses, params, _ = build_filter_clauses(filters)
+    return f"SELECT COUNT(*) {clauses}", params
+
+def build_stats_source(filters):
+    """Build the grouping expressions and FROM/WHERE clauses of aggregate queries.
+    
+    Field filters are answered from news_rollup; keyword searches cannot be, so
+    they count the matching articles through news_fts instead.
+    
+    Args:
+        filters (FilterRequest): Filter parameters (comma-separated values per field).
+        
+    Returns:
+        tuple: Expression per STATS_FIELDS field, count expression, FROM/WHERE SQL and list of parameters.
+    """
+    if filters.keyword:
+        clauses, params, _ = build_filter_clauses(filters)
+        exprs = {field: f'news.{field}' for field in FILTER_FIELDS}
+        exprs['day'] = 'date(news.publication_date)'
+        return exprs, 'COUNT(*)', clauses, params
+
+    # Rollup keys store NULL as '', see NewsScraper.setup_rollup
+    exprs = {field: f"NULLIF({field}, '')" for field in ROLLUP_FIELDS}
+    exprs['year'] = "NULLIF(substr(day, 1, 4), '')"
+    clauses = "FROM news_rollup WHERE 1=1"
+    params = []
+    for field in FILTER_FIELDS:
+        value = getattr(filters, field)
+        if value:
+            values = [v.strip() for v in value.split(',')]
+            column = 'substr(day, 1, 4)' if field == 'year' else field
+            clauses += f" AND {column} IN ({','.join(['?' for _ in values])})"
+            params.extend(values)
+    if filters.enriched is not None:
+        clauses += " AND language != ?" if filters.enriched else " AND language = ?"
+        params.append(PENDING_ENRICHMENT)
+    return exprs, 'SUM(count)', clauses, params
+
+def next_page_cursor(rows, limit):
+    """Build the cursor of the page after `rows`, or None on the last page.
+    
+    Args:
+        rows (list): Rows fetched with limit + 1, including the _rowid/_score keys.
+        limit (int): Page size requested by the client.
+        
+    Returns:
+        str: Cursor of the next page, or None.
+    """
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    if '_score' in last:
+        return encode_cursor('rank', [last['_score'], last['_rowid']])
+    return encode_cursor('date', [last['publication_date'], last['_rowid']])
+
+def page_response(filters, cursor=None, limit=DEFAULT_PAGE_SIZE, include_total=False):
+    """Fetch one page of articles as a ready-to-send response.
+    
+    Returning the response directly skips FastAPI's jsonable_encoder pass, and
+    building it here keeps the orjson serialization on the database pool.
+    
+    Args:
+        filters (FilterRequest): Filter parameters (comma-separated values per field).
+        cursor (str, optional): Cursor returned with the previous page.
+        limit (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+        include_total (bool, optional): Also count every matching article. Defaults to False.
+        
+    Returns:
+        ORJSONResponse: Serialized page from the scraper's store.
+    """
+    return ORJSONResponse(scraper.store.query(filters, cursor, limit, include_total))
+
+def stream_news(filters, cursor=None, fmt='ndjson', batch_size=STREAM_BATCH_SIZE):
+    """Stream every article matching the filters as NDJSON or a chunked JSON array.
+    
+    Rows are read from the store in batches, so memory stays constant however
+    large the result is and the first bytes go out as soon as the first batch is read.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        cursor (str, optional): Cursor to start after. Defaults to the first article.
+        fmt (str, optional): 'ndjson' (one object per line) or 'json' (one array). Defaults to 'ndjson'.
+        batch_size (int, optional): Articles per batch. Defaults to STREAM_BATCH_SIZE.
+        
+    Returns:
+        StreamingResponse: Response streaming the articles.
+        
+    Raises:
+        ValueError: If the cursor is invalid (raised before streaming starts).
+    """
+    batches = scraper.store.iter_batches(filters, cursor, batch_size)
+
+    def generate():
+        separator = b'\n' if fmt == 'ndjson' else b','
+        first = True
+        if fmt == 'json':
+            yield b'['
+        for batch in batches:
+            chunk = separator.join(orjson.dumps(item) for item in batch)
+            if fmt == 'ndjson':
+                yield chunk + b'\n'
+            else:
+                yield chunk if first else b',' + chunk
+            first = False
+        if fmt == 'json':
+            yield b']'
+
+    return StreamingResponse(generate(), media_type=STREAM_MEDIA_TYPES[fmt])
+
+def selected_values(filters):
+    """Parse the comma-separated field filters of a request.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        
+    Returns:
+        dict: Set of selected values per filtered FILTER_FIELDS field.
+    """
+    selected = {}
+    for field in FILTER_FIELDS:
+        value = getattr(filters, field)
+        if value:
+            selected[field] = {v.strip() for v in value.split(',')}
+    return selected
+
+def enrichment_matches(filters, language):
+    """Tell whether articles with a language pass the request's enriched filter.
+    
+    Args:
+        filters (FilterRequest): Filter parameters.
+        language (str): Stored language, PENDING_ENRICHMENT while awaiting enrichment.
+        
+    Returns:
+        bool: True when the filter is unset or the enrichment state matches it.
+    """
+    return filters.enriched is None or (language != PENDING_ENRICHMENT) == filters.enriched
+
+def sorted_counts(counts, chronological=False):
+    """Turn a value -> count mapping into the list returned by the aggregate endpoints.
+    
+    Args:
+        counts (dict): Article count per value.
+        chronological (bool): Sort by value instead of by descending count.
+        
+    Returns:
+        list: {'value', 'count'} dictionaries.
+    """
+    if chronological:
+        items = sorted(counts.items(), key=lambda item: (item[0] is None, item[0] or ''))
+    else:
+        items = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    return [{'value': value, 'count': count} for value, count in items]
+
+class NewsStore:
+    """Storage backend of the news corpus.
+    
+    Subclasses implement article writes, keyset-paginated reads, the grouped
+    counts behind facets and statistics, and time buckets. Facets and aggregates
+    are reduced here from facet_groups, so every backend answers them the same way.
+    Each store owns a DataVersionCache that its insert_batch bumps.
+    """
+
+    def __init__(self):
+        """Initialize the store's query cache."""
+        self.cache = DataVersionCache()
+
+    def close(self):
+        """Release the store's connections; stores sharing the scraper's ConnectionFactory have none."""
+
+    def insert_batch(self, articles, batch_size=1000):
+        """Insert articles in one transaction, ignoring duplicates.
+        
+        Args:
+            articles (list): Article dictionaries with the ARTICLE_FIELDS keys.
+            batch_size (int, optional): Rows per write call. Defaults to 1000.
+            
+        Returns:
+            int: Number of articles inserted.
+        """
+        raise NotImplementedError
+
+    def article_keys(self):
+        """Iterate over the (source, url, title) of every stored article.
+        
+        Returns:
+            iterable: Key tuples, used to warm the SeenItemIndex.
+        """
+        raise NotImplementedError
+
+    def source_languages(self, per_source):
+        """Iterate over the languages of the most recent articles of every source.
+        
+        Args:
+            per_source (int): Maximum number of articles per source.
+            
+        Returns:
+            iterable: (source, language) tuples, oldest first within each source.
+        """
+        raise NotImplementedError
+
+    def query(self, filters, cursor=None, limit=DEFAULT_PAGE_SIZE, include_total=False):
+        """Fetch one keyset-paginated page of articles matching the filters.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            cursor (str, optional): Cursor of the previous page. Defaults to the first page.
+            limit (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            include_total (bool, optional): Also count every matching article. Defaults to False.
+            
+        Returns:
+            dict: Page with 'items', 'next_cursor' and 'total' (None unless requested).
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        raise NotImplementedError
+
+    def iter_batches(self, filters, cursor=None, batch_size=STREAM_BATCH_SIZE):
+        """Read every article matching the filters in fixed-size batches.
+        
+        The query is prepared eagerly, so an invalid cursor raises before the
+        first batch is requested.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            cursor (str, optional): Cursor to start after. Defaults to the first article.
+            batch_size (int, optional): Articles per batch. Defaults to STREAM_BATCH_SIZE.
+            
+        Returns:
+            generator: Lists of article dictionaries.
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        raise NotImplementedError
+
+    def iter_new(self, after_id=0, batch_size=STREAM_BATCH_SIZE, before_id=None):
+        """Read the articles stored after a row id, in insertion order, in batches.
+        
+        Args:
+            after_id (int, optional): Last row id already read. Defaults to 0 (every article).
+            batch_size (int, optional): Articles per batch. Defaults to STREAM_BATCH_SIZE.
+            before_id (int, optional): Stop before this row id. Defaults to no bound.
+            
+        Returns:
+            generator: Lists of (row id, article dictionary) tuples.
+        """
+        raise NotImplementedError
+
+    def pending_articles(self, limit):
+        """Read the oldest articles awaiting enrichment.
+        
+        Args:
+            limit (int): Maximum number of articles.
+            
+        Returns:
+            list: (row id, article dictionary) tuples in insertion order.
+        """
+        raise NotImplementedError
+
+    def update_enrichment(self, rows):
+        """Store the language, sentiment and scores of articles that were awaiting enrichment.
+        
+        Args:
+            rows (list): (row id, enriched article dictionary) tuples from pending_articles.
+            
+        Returns:
+            int: Number of articles updated.
+        """
+        raise NotImplementedError
+
+    def first_pending_id(self):
+        """Get the row id of the oldest article awaiting enrichment.
+        
+        Returns:
+            int: Row id, or None when every article is enriched.
+        """
+        raise NotImplementedError
+
+    def facet_groups(self, keyword=None):
+        """Count articles per combination of FILTER_FIELDS values.
+        
+        Args:
+            keyword (str, optional): Keyword search restricting the counted articles.
+            
+        Returns:
+            list: Tuples of the FILTER_FIELDS values followed by the article count.
+        """
+        raise NotImplementedError
+
+    def day_counts(self, filters):
+        """Count the articles matching the filters per publication day.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            
+        Returns:
+            dict: Article count per 'YYYY-MM-DD' day (None for unparseable dates).
+        """
+        raise NotImplementedError
+
+    def timeseries_points(self, filters, bucket, group_by, start, end):
+        """Count the articles matching the filters per time bucket and group.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            bucket (str): One of TIMESERIES_BUCKETS.
+            group_by (str): One of TIMESERIES_GROUPS, or None.
+            start (datetime): Earliest publication date, or None.
+            end (datetime): Latest publication date, or None.
+            
+        Returns:
+            list: {'time', 'group', 'count'} dictionaries ordered by time and group.
+        """
+        raise NotImplementedError
+
+    def distinct(self, column):
+        """Return the distinct values of a filter column from the cached facet groups.
+        
+        Args:
+            column (str): One of FILTER_FIELDS.
+            
+        Returns:
+            list: Distinct values of the column, sorted.
+            
+        Raises:
+            ValueError: If the column is not a filter field.
+        """
+        if column not in FILTER_FIELDS:
+            raise ValueError(f"Unknown facet: {column}")
+        index = FILTER_FIELDS.index(column)
+        values = {group[index] for group in self.facet_groups()} - {PENDING_ENRICHMENT}
+        return sorted(values, key=lambda value: (value is None, value or ''))
+
+    def facets(self, filters):
+        """Count the articles per value of every facet under the given filters.
+        
+        Counts follow faceted-search semantics: the counts of a field apply every
+        filter except the field's own, so the values a user could switch to still
+        show how many articles they would add. Articles awaiting enrichment count
+        towards the total (unless filtered out with enriched) but their placeholder
+        language and sentiment are not listed as values.
+        
+        Args:
+            filters (FilterRequest): Filter parameters (comma-separated values per field).
+            
+        Returns:
+            dict: 'total' articles matching every filter and 'facets', mapping each field
+                to a list of {'value', 'count'} sorted by descending count.
+        """
+        selected = selected_values(filters)
+        language_index = FILTER_FIELDS.index('language')
+        total = 0
+        counts = {field: {} for field in FILTER_FIELDS}
+        for *values, count in self.facet_groups(filters.keyword):
+            if not enrichment_matches(filters, values[language_index]):
+                continue
+            unmatched = [field for field, value in zip(FILTER_FIELDS, values)
+                         if field in selected and value not in selected[field]]
+            if len(unmatched) > 1:
+                continue
+            if not unmatched:
+                total += count
+            for field, value in zip(FILTER_FIELDS, values):
+                if (not unmatched or unmatched[0] == field) and value != PENDING_ENRICHMENT:
+                    counts[field][value] = counts[field].get(value, 0) + count
+
+        return {
+            'total': total,
+            'facets': {field: sorted_counts(values) for field, values in counts.items()}
+        }
+
+    def aggregate(self, filters, by):
+        """Count the articles matching the filters, grouped by each requested field.
+        
+        Field groupings are reduced from the facet_groups combinations, whose number
+        does not grow with the number of articles; only 'day' goes back to the store.
+        As in facets, articles awaiting enrichment count towards the total but their
+        placeholder language and sentiment are not listed as values.
+        
+        Args:
+            filters (FilterRequest): Filter parameters (comma-separated values per field).
+            by (list): STATS_FIELDS to group by.
+            
+        Returns:
+            dict: 'total' matching articles and, per field, a list of {'value', 'count'};
+                day and year are sorted chronologically, other fields by descending count.
+            
+        Raises:
+            ValueError: If a field is not one of STATS_FIELDS.
+        """
+        unknown = [field for field in by if field not in STATS_FIELDS]
+        if unknown:
+            raise ValueError(f"Cannot group by {', '.join(unknown)}; expected one of {', '.join(STATS_FIELDS)}")
+
+        selected = selected_values(filters)
+        total = 0
+        counts = {field: {} for field in FILTER_FIELDS}
+        for *values, count in self.facet_groups(filters.keyword):
+            row = dict(zip(FILTER_FIELDS, values))
+            if any(row[field] not in selected[field] for field in selected):
+                continue
+            if not enrichment_matches(filters, row['language']):
+                continue
+            total += count
+            for field, value in row.items():
+                if value != PENDING_ENRICHMENT:
+                    counts[field][value] = counts[field].get(value, 0) + count
+
+        groups = {field: sorted_counts(counts[field], chronological=field == 'year')
+                  for field in by if field != 'day'}
+        if 'day' in by:
+            groups['day'] = sorted_counts(self.day_counts(filters), chronological=True)
+        return {'total': total, 'by': {field: groups[field] for field in by}}
+
+    def timeseries(self, filters, bucket='day', group_by=None, start=None, end=None, normalize=False):
+        """Count the articles matching the filters per time bucket.
+        
+        Dates are treated as UTC. Grouped by language or sentiment, articles awaiting
+        enrichment are left out rather than shown as a placeholder group, so shares
+        are of the enriched articles in each bucket.
+        
+        Args:
+            filters (FilterRequest): Filter parameters (comma-separated values per field).
+            bucket (str): One of TIMESERIES_BUCKETS; weeks start on Monday.
+            group_by (str, optional): One of TIMESERIES_GROUPS to split every bucket by.
+            start (datetime, optional): Earliest publication date to count.
+            end (datetime, optional): Latest publication date to count.
+            normalize (bool): Also return each group's share of its bucket.
+            
+        Returns:
+            dict: 'bucket', 'group_by' and 'points', a list of {'time', 'group', 'count'}
+                (plus 'share' when normalized) ordered by time.
+            
+        Raises:
+            ValueError: If the bucket or group-by dimension is unknown.
+        """
+        if bucket not in TIMESERIES_BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket}; expected one of {', '.join(TIMESERIES_BUCKETS)}")
+        if group_by is not None and group_by not in TIMESERIES_GROUPS:
+            raise ValueError(f"Cannot group by {group_by}; expected one of {', '.join(TIMESERIES_GROUPS)}")
+
+        points = self.timeseries_points(filters, bucket, group_by, start, end)
+        if group_by is not None:
+            points = [point for point in points if point['group'] != PENDING_ENRICHMENT]
+        if normalize:
+            totals = {}
+            for point in points:
+                totals[point['time']] = totals.get(point['time'], 0) + point['count']
+            for point in points:
+                point['share'] = point['count'] / totals[point['time']]
+        return {'bucket': bucket, 'group_by': group_by, 'points': points}
+
+class SQLiteStore(NewsStore):
+    """News store on the WAL-mode SQLite database.
+    
+    Keyword searches use the news_fts index ranked by BM25, and facets,
+    statistics and day/week time buckets are answered from the news_rollup table.
+    """
+
+    def __init__(self, db):
+        """Initialize the store and create its tables.
+        
+        Args:
+            db (ConnectionFactory): Connection factory of the news database.
+        """
+        super().__init__()
+        self.db = db
+        self.setup()
+
+    def setup(self):
+        """Create the news table with its score and generated columns, indexes, full-text index and rollup table."""
+        try:
+            with self.db.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS news (
+                        title TEXT,
+                        publication_date TEXT,
+                        source TEXT,
+                        country TEXT,
+                        summary TEXT,
+                        url TEXT,
+                        language TEXT NOT NULL,
+                        sentiment TEXT,
+                        sentiment_compound REAL,
+                        sentiment_pos REAL,
+                        sentiment_neg REAL,
+                        sentiment_neu REAL,
+                        UNIQUE(title, publication_date, source, url)
+                    )
+                ''')
+                # Older databases lack the score and derived columns; both can be added in
+                # place (existing rows get NULL scores) and indexed like any other column
+                columns = [row[1] for row in cursor.execute('PRAGMA table_xinfo(news)')]
+                for column in SCORE_FIELDS:
+                    if column not in columns:
+                        cursor.execute(f"ALTER TABLE news ADD COLUMN {column} REAL")
+                        logging.info(f"Added {column} column to news table")
+                for column, definition in GENERATED_COLUMNS.items():
+                    if column not in columns:
+                        cursor.execute(f"ALTER TABLE news ADD COLUMN {column} {definition}")
+                        logging.info(f"Added generated {column} column to news table")
+                for index_name, index_columns in NEWS_INDEXES.items():
+                    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON news ({', '.join(index_columns)})")
+                # Drop indexes that older versions created and a NEWS_INDEXES entry now supersedes
+                stale = [row[0] for row in cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'news' "
+                    "AND name LIKE 'idx_news_%'") if row[0] not in NEWS_INDEXES]
+                for index_name in stale:
+                    cursor.execute(f"DROP INDEX {index_name}")
+                    logging.info(f"Dropped superseded index {index_name}")
+                self.setup_fts(cursor)
+                self.setup_rollup(cursor)
+            logging.info("News store setup completed")
+        except sqlite3.Error as e:
+            logging.error(f"Database setup error: {str(e)}")
+
+    def setup_fts(self, cursor):
+        """Create the FTS5 keyword index over news titles and summaries.
+        
+        news_fts is an external-content table keyed on the news rowid and kept
+        in sync by triggers, so the article text is not stored twice. Because
+        news has no INTEGER PRIMARY KEY, run a 'rebuild' after any VACUUM.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor inside the setup transaction.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'").fetchone()
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                title, summary, content='news', content_rowid='rowid', prefix='2 3'
+            )
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_fts_insert AFTER INSERT ON news BEGIN
+                INSERT INTO news_fts (rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_fts_delete AFTER DELETE ON news BEGIN
+                INSERT INTO news_fts (news_fts, rowid, title, summary)
+                VALUES ('delete', old.rowid, old.title, old.summary);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_fts_update AFTER UPDATE OF title, summary ON news BEGIN
+                INSERT INTO news_fts (news_fts, rowid, title, summary)
+                VALUES ('delete', old.rowid, old.title, old.summary);
+                INSERT INTO news_fts (rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+            END
+        ''')
+        if not exists:
+            # Index the articles stored before the FTS table existed
+            cursor.execute("INSERT INTO news_fts (news_fts) VALUES ('rebuild')")
+            logging.info("Built full-text index for existing articles")
+
+    def setup_rollup(self, cursor):
+        """Create the news_rollup table of article counts per day, country, source, language and sentiment.
+        
+        Triggers keep the counts in step with every insert, delete and update of
+        news, so dashboard statistics never scan the article table. NULL keys are
+        stored as '' because the upsert relies on the primary key.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor inside the setup transaction.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_rollup'").fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS news_rollup (
+                day TEXT NOT NULL,
+                country TEXT NOT NULL,
+                source TEXT NOT NULL,
+                language TEXT NOT NULL,
+                sentiment TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (day, country, source, language, sentiment)
+            ) WITHOUT ROWID
+        ''')
+        add = '''
+            INSERT INTO news_rollup (day, country, source, language, sentiment, count)
+            VALUES (IFNULL(date(new.publication_date), ''), IFNULL(new.country, ''), IFNULL(new.source, ''),
+                    new.language, IFNULL(new.sentiment, ''), 1)
+            ON CONFLICT DO UPDATE SET count = count + 1;
+        '''
+        old_key = '''
+            day = IFNULL(date(old.publication_date), '') AND country = IFNULL(old.country, '')
+            AND source = IFNULL(old.source, '') AND language = old.language AND sentiment = IFNULL(old.sentiment, '')
+        '''
+        remove = f'''
+            UPDATE news_rollup SET count = count - 1 WHERE {old_key};
+            DELETE FROM news_rollup WHERE {old_key} AND count <= 0;
+        '''
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS news_rollup_insert AFTER INSERT ON news BEGIN {add} END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS news_rollup_delete AFTER DELETE ON news BEGIN {remove} END")
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS news_rollup_update
+            AFTER UPDATE OF publication_date, country, source, language, sentiment ON news
+            BEGIN {remove} {add} END
+        ''')
+        if not exists:
+            # Count the articles stored before the rollup table existed
+            cursor.execute('''
+                INSERT INTO news_rollup (day, country, source, language, sentiment, count)
+                SELECT IFNULL(date(publication_date), ''), IFNULL(country, ''), IFNULL(source, ''),
+                       language, IFNULL(sentiment, ''), COUNT(*)
+                FROM news GROUP BY 1, 2, 3, 4, 5
+            ''')
+            logging.info("Built rollup table for existing articles")
+
+    def insert_batch(self, articles, batch_size=1000):
+        """Insert articles with executemany in batches, committed as one transaction.
+        
+        One commit means the whole save pays for one fsync instead of one per
+        article. The cache version is bumped when any row was inserted.
+        
+        Args:
+            articles (list): Article dictionaries with the ARTICLE_FIELDS keys.
+            batch_size (int, optional): Rows per executemany call. Defaults to 1000.
+            
+        Returns:
+            int: Number of articles inserted (duplicates are ignored).
+        """
+        inserted = 0
+        with self.db.writer() as conn:
+            for start in range(0, len(articles), batch_size):
+                cursor = conn.executemany(f'''
+                    INSERT OR IGNORE INTO news ({ARTICLE_COLUMNS})
+                    VALUES ({', '.join('?' for _ in ARTICLE_FIELDS)})
+                ''', [tuple(item[field] for field in ARTICLE_FIELDS) for item in articles[start:start + batch_size]])
+                inserted += cursor.rowcount
+        if inserted:
+            self.cache.bump()
+        return inserted
+
+    def article_keys(self):
+        """Iterate over the (source, url, title) of every stored article.
+        
+        Returns:
+            list: Key tuples.
+        """
+        with self.db.reader() as conn:
+            return [tuple(row) for row in conn.execute('SELECT source, url, title FROM news')]
+
+    def source_languages(self, per_source):
+        """Iterate over the languages of the most recent articles of every source.
+        
+        Args:
+            per_source (int): Maximum number of articles per source.
+            
+        Returns:
+            list: (source, language) tuples, oldest first within each source.
+        """
+        with self.db.reader() as conn:
+            return [tuple(row) for row in conn.execute('''
+                SELECT source, language FROM (
+                    SELECT source, language, rowid AS _rowid,
+                           ROW_NUMBER() OVER (PARTITION BY source ORDER BY rowid DESC) AS _rank
+                    FROM news
+                ) WHERE _rank <= ? ORDER BY source, _rowid
+            ''', (per_source,))]
+
+    def query(self, filters, cursor=None, limit=DEFAULT_PAGE_SIZE, include_total=False):
+        """Fetch one page, newest first or by BM25 rank for keyword searches.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            cursor (str, optional): Cursor of the previous page. Defaults to the first page.
+            limit (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            include_total (bool, optional): Also count every matching article. Defaults to False.
+            
+        Returns:
+            dict: Page with 'items', 'next_cursor' and 'total' (None unless requested).
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        query, params = build_filter_query(filters, cursor=cursor, limit=limit + 1)
+        with self.db.reader() as conn:
+            rows = [dict(row) for row in conn.execute(query, params)]
+            total = None
+            if include_total:
+                count_query, count_params = build_count_query(filters)
+                total = conn.execute(count_query, count_params).fetchone()[0]
+        next_cursor = next_page_cursor(rows, limit)
+        items = [{k: v for k, v in row.items() if not k.startswith('_')} for row in rows[:limit]]
+        return {'items': items, 'next_cursor': next_cursor, 'total': total}
+
+    def iter_batches(self, filters, cursor=None, batch_size=STREAM_BATCH_SIZE):
+        """Read every matching article in fetchmany batches.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            cursor (str, optional): Cursor to start after. Defaults to the first article.
+            batch_size (int, optional): Rows per fetchmany call. Defaults to STREAM_BATCH_SIZE.
+            
+        Returns:
+            generator: Lists of article dictionaries.
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        query, params = build_filter_query(filters, cursor=cursor)
+
+        def batches():
+            # Starlette may resume the generator on different threads, so use a
+            # dedicated connection rather than a thread-local reader
+            conn = self.db.connect(query_only=True)
+            try:
+                rows = conn.execute(query, params)
+                while True:
+                    batch = rows.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield [{k: row[k] for k in row.keys() if not k.startswith('_')} for row in batch]
+            finally:
+                conn.close()
+
+        return batches()
+
+    def iter_new(self, after_id=0, batch_size=STREAM_BATCH_SIZE, before_id=None):
+        """Read the articles stored after a rowid, in insertion order, in fetchmany batches.
+        
+        Rows are never deleted, so rowids only grow and the last one read marks
+        everything already seen.
+        
+        Args:
+            after_id (int, optional): Last rowid already read. Defaults to 0 (every article).
+            batch_size (int, optional): Rows per fetchmany call. Defaults to STREAM_BATCH_SIZE.
+            before_id (int, optional): Stop before this rowid. Defaults to no bound.
+            
+        Returns:
+            generator: Lists of (rowid, article dictionary) tuples.
+        """
+        conn = self.db.connect(query_only=True)
+        try:
+            rows = conn.execute(f"SELECT rowid AS _rowid, {ARTICLE_COLUMNS} FROM news "
+                                f"WHERE rowid > ? AND rowid < ? ORDER BY rowid",
+                                (after_id, before_id if before_id is not None else 2 ** 63 - 1))
+            while True:
+                batch = rows.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield [(row['_rowid'], {field: row[field] for field in ARTICLE_FIELDS}) for row in batch]
+        finally:
+            conn.close()
+
+    def pending_articles(self, limit):
+        """Read the oldest articles awaiting enrichment over the language index.
+        
+        Args:
+            limit (int): Maximum number of articles.
+            
+        Returns:
+            list: (rowid, article dictionary) tuples in rowid order.
+        """
+        with self.db.reader() as conn:
+            rows = conn.execute(f"SELECT rowid AS _rowid, {ARTICLE_COLUMNS} FROM news WHERE language = ? "
+                                f"ORDER BY rowid LIMIT ?", (PENDING_ENRICHMENT, limit)).fetchall()
+        return [(row['_rowid'], {field: row[field] for field in ARTICLE_FIELDS}) for row in rows]
+
+    def update_enrichment(self, rows):
+        """Store the enrichment of pending articles in one transaction.
+        
+        The rollup triggers move each article's counts from the pending language
+        and sentiment to the enriched ones.
+        
+        Args:
+            rows (list): (rowid, enriched article dictionary) tuples.
+            
+        Returns:
+            int: Number of articles updated (ones enriched meanwhile are skipped).
+        """
+        fields = ('language', 'sentiment') + SCORE_FIELDS
+        with self.db.writer() as conn:
+            cursor = conn.executemany(
+                f"UPDATE news SET {', '.join(f'{field} = ?' for field in fields)} WHERE rowid = ? AND language = ?",
+                [tuple(item[field] for field in fields) + (row_id, PENDING_ENRICHMENT) for row_id, item in rows])
+            updated = cursor.rowcount
+        if updated:
+            self.cache.bump()
+        return updated
+
+    def first_pending_id(self):
+        """Get the rowid of the oldest article awaiting enrichment.
+        
+        Returns:
+            int: Rowid, or None when every article is enriched.
+        """
+        with self.db.reader() as conn:
+            return conn.execute('SELECT MIN(rowid) FROM news WHERE language = ?', (PENDING_ENRICHMENT,)).fetchone()[0]
+
+    def facet_groups(self, keyword=None):
+        """Count articles per combination of FILTER_FIELDS values in one grouped query.
+        
+        Without a keyword the query reads news_rollup and its result is served from
+        the cache, so facet counts for any field filters are computed in memory.
+        
+        Args:
+            keyword (str, optional): Keyword search restricting the counted articles.
+            
+        Returns:
+            list: Tuples of the FILTER_FIELDS values followed by the article count.
+        """
+        exprs, count, clauses, params = build_stats_source(FilterRequest(keyword=keyword))
+        columns = ', '.join(exprs[field] for field in FILTER_FIELDS)
+        query = f"SELECT {columns}, {count} {clauses} GROUP BY {columns}"
+
+        def load():
+            with self.db.reader() as conn:
+                return [tuple(row) for row in conn.execute(query, params)]
+
+        if keyword:
+            return load()
+        return self.cache.get('groups', load)
+
+    def day_counts(self, filters):
+        """Count the articles matching the filters per day from news_rollup.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            
+        Returns:
+            dict: Article count per day.
+        """
+        exprs, count, clauses, params = build_stats_source(filters)
+        with self.db.reader() as conn:
+            cursor = conn.execute(f"SELECT {exprs['day']}, {count} {clauses} GROUP BY 1", params)
+            return {day: total for day, total in cursor}
+
+    def timeseries_points(self, filters, bucket, group_by, start, end):
+        """Count the articles matching the filters per time bucket and group.
+        
+        Day and week buckets without a keyword are summed from news_rollup, so their
+        cost depends on the number of days covered rather than the number of articles;
+        their start/end bounds cover whole days. Hour buckets and keyword searches
+        count articles over the published_at index.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            bucket (str): One of TIMESERIES_BUCKETS.
+            group_by (str): One of TIMESERIES_GROUPS, or None.
+            start (datetime): Earliest publication date, or None.
+            end (datetime): Latest publication date, or None.
+            
+        Returns:
+            list: {'time', 'group', 'count'} dictionaries ordered by time and group.
+        """
+        if bucket != 'hour' and not filters.keyword:
+            exprs, count, clauses, params = build_stats_source(filters)
+            time_expr = 'day' if bucket == 'day' else "date(day, '-6 days', 'weekday 1')"
+            clauses += " AND day != ''"
+            if start:
+                clauses += " AND day >= ?"
+                params.append(start.strftime('%Y-%m-%d'))
+            if end:
+                clauses += " AND day <= ?"
+                params.append(end.strftime('%Y-%m-%d'))
+        else:
+            clauses, params, _ = build_filter_clauses(filters)
+            exprs = {field: f'news.{field}' for field in TIMESERIES_GROUPS}
+            count = 'COUNT(*)'
+            time_expr = {
+                'hour': "strftime('%Y-%m-%d %H:00:00', news.published_at, 'unixepoch')",
+                'day': "date(news.published_at, 'unixepoch')",
+                'week': "date(news.published_at, 'unixepoch', '-6 days', 'weekday 1')",
+            }[bucket]
+            clauses += " AND news.published_at IS NOT NULL"
+            if start:
+                clauses += " AND news.published_at >= ?"
+                params.append(calendar.timegm(start.utctimetuple()))
+            if end:
+                clauses += " AND news.published_at <= ?"
+                params.append(calendar.timegm(end.utctimetuple()))
+
+        group_expr = exprs[group_by] if group_by else 'NULL'
+        query = f"SELECT {time_expr} AS time, {group_expr} AS grp, {count} AS count {clauses} GROUP BY 1, 2 ORDER BY 1, 2"
+        with self.db.reader() as conn:
+            return [{'time': row['time'], 'group': row['grp'], 'count': row['count']}
+                    for row in conn.execute(query, params)]
+
+class DuckDBStore(NewsStore):
+    """News store on an embedded DuckDB database, for analytical queries at scale.
+    
+    DuckDB stores the corpus column by column and scans it vectorized, so grouped
+    counts and time buckets over tens of millions of rows need no rollup tables.
+    Keyword search is a case-insensitive substring match on title and summary
+    (every term must match): there is no BM25 ranking or snippet, and keyword
+    pages are ordered newest first like the others.
+    """
+
+    def __init__(self, path):
+        """Open (or create) the DuckDB database.
+        
+        Args:
+            path (str): Path of the DuckDB database file.
+            
+        Raises:
+            ImportError: If the duckdb package is not installed.
+        """
+        if duckdb is None:
+            raise ImportError("The DuckDB storage backend requires the duckdb package (pip install duckdb)")
+        super().__init__()
+        self.path = path
+        self._conn = duckdb.connect(path)
+        self._write_lock = threading.Lock()
+        self._conn.execute("CREATE SEQUENCE IF NOT EXISTS news_id")
+        self._conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS news (
+                id BIGINT DEFAULT nextval('news_id'),
+                {', '.join(f"{field} {'DOUBLE' if field in SCORE_FIELDS else 'VARCHAR'}" for field in ARTICLE_FIELDS)},
+                published_at TIMESTAMP,
+                year VARCHAR
+            )
+        ''')
+        for field in SCORE_FIELDS:  # Stores created before the score columns existed
+            self._conn.execute(f"ALTER TABLE news ADD COLUMN IF NOT EXISTS {field} DOUBLE")
+        logging.info(f"DuckDB news store opened at {path}")
+
+    def close(self):
+        """Close the DuckDB connection."""
+        self._conn.close()
+
+    def cursor(self):
+        """Open a cursor for the calling thread; DuckDB connections are not thread-safe.
+        
+        Returns:
+            duckdb.DuckDBPyConnection: Cursor on the shared database.
+        """
+        return self._conn.cursor()
+
+    def build_where(self, filters):
+        """Build the WHERE clause of a filtered query.
+        
+        Args:
+            filters (FilterRequest): Filter parameters (comma-separated values per field).
+            
+        Returns:
+            tuple: WHERE SQL and list of parameters.
+        """
+        clauses = ['1=1']
+        params = []
+        relabel = sentiment_thresholds(filters) is not None
+        for field, values in selected_values(filters).items():
+            if field == 'sentiment' and relabel:
+                continue
+            clauses.append(f"{field} IN ({','.join(['?' for _ in values])})")
+            params.extend(sorted(values))
+        score_clauses, score_params = build_score_clauses(filters, prefix='')
+        clauses.extend(score_clauses)
+        params.extend(score_params)
+        if filters.enriched is not None:
+            clauses.append("language != ?" if filters.enriched else "language = ?")
+            params.append(PENDING_ENRICHMENT)
+        terms = parse_keyword(filters.keyword or '')
+        if filters.keyword and not terms:
+            clauses.append("false")
+        for term, _ in terms:
+            clauses.append("(contains(lower(title), ?) OR contains(lower(summary), ?))")
+            params.extend([term.lower(), term.lower()])
+        return 'WHERE ' + ' AND '.join(clauses), params
+
+    @staticmethod
+    def select_list(filters):
+        """Build the ARTICLE_FIELDS select list, re-labeling sentiment under custom thresholds.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            
+        Returns:
+            str: Comma-separated column expressions.
+        """
+        return ', '.join(f'{sentiment_expr(filters, prefix="")} AS sentiment' if field == 'sentiment' else field
+                         for field in ARTICLE_FIELDS)
+
+    def insert_batch(self, articles, batch_size=1000):
+        """Insert articles, skipping ones already stored or repeated in the batch.
+        
+        Rows are loaded through a pandas DataFrame and anti-joined against the
+        table on (title, publication_date, source, url), the SQLite unique key.
+        
+        Args:
+            articles (list): Article dictionaries with the ARTICLE_FIELDS keys.
+            batch_size (int, optional): Rows per insert statement. Defaults to 1000.
+            
+        Returns:
+            int: Number of articles inserted.
+        """
+        inserted = 0
+        with self._write_lock:
+            cur = self.cursor()
+            try:
+                cur.execute('BEGIN TRANSACTION')
+                for start in range(0, len(articles), batch_size):
+                    batch = pd.DataFrame(articles[start:start + batch_size], columns=list(ARTICLE_FIELDS))
+                    cur.register('batch', batch)
+                    inserted += cur.execute(f'''
+                        INSERT INTO news ({ARTICLE_COLUMNS}, published_at, year)
+                        SELECT {ARTICLE_COLUMNS}, TRY_CAST(publication_date AS TIMESTAMP),
+                               strftime(TRY_CAST(publication_date AS TIMESTAMP), '%Y')
+                        FROM (SELECT DISTINCT ON (title, publication_date, source, url) * FROM batch) b
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM news n
+                            WHERE n.title = b.title AND n.publication_date = b.publication_date
+                              AND n.source = b.source AND n.url = b.url
+                        )
+                    ''').fetchone()[0]
+                    cur.unregister('batch')
+                cur.execute('COMMIT')
+            except BaseException:
+                cur.execute('ROLLBACK')
+                raise
+            finally:
+                cur.close()
+        if inserted:
+            self.cache.bump()
+        return inserted
+
+    def article_keys(self):
+        """Iterate over the (source, url, title) of every stored article.
+        
+        Returns:
+            list: Key tuples.
+        """
+        with self.cursor() as cur:
+            return cur.execute('SELECT source, url, title FROM news').fetchall()
+
+    def source_languages(self, per_source):
+        """Iterate over the languages of the most recent articles of every source.
+        
+        Args:
+            per_source (int): Maximum number of articles per source.
+            
+        Returns:
+            list: (source, language) tuples, oldest first within each source.
+        """
+        with self.cursor() as cur:
+            return cur.execute('''
+                SELECT source, language FROM news
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY source ORDER BY id DESC) <= ?
+                ORDER BY source, id
+            ''', [per_source]).fetchall()
+
+    def query(self, filters, cursor=None, limit=DEFAULT_PAGE_SIZE, include_total=False):
+        """Fetch one page, newest first, keyed on (publication_date, id).
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            cursor (str, optional): Cursor of the previous page. Defaults to the first page.
+            limit (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+            include_total (bool, optional): Also count every matching article. Defaults to False.
+            
+        Returns:
+            dict: Page with 'items', 'next_cursor' and 'total' (None unless requested).
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        where, params = self.build_where(filters)
+        page_where, page_params = where, list(params)
+        if cursor:
+            page_where += " AND (publication_date, id) < (?, ?)"
+            page_params.extend(decode_cursor(cursor, 'date'))
+        with self.cursor() as cur:
+            rows = cur.execute(f'''
+                SELECT {self.select_list(filters)}, id FROM news {page_where}
+                ORDER BY publication_date DESC, id DESC LIMIT ?
+            ''', page_params + [limit + 1]).fetchall()
+            total = None
+            if include_total:
+                total = cur.execute(f"SELECT COUNT(*) FROM news {where}", params).fetchone()[0]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor('date', [last[ARTICLE_FIELDS.index('publication_date')], last[-1]])
+        items = [dict(zip(ARTICLE_FIELDS, row)) for row in rows[:limit]]
+        return {'items': items, 'next_cursor': next_cursor, 'total': total}
+
+    def iter_batches(self, filters, cursor=None, batch_size=STREAM_BATCH_SIZE):
+        """Read every matching article, newest first, in fetchmany batches.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            cursor (str, optional): Cursor to start after. Defaults to the first article.
+            batch_size (int, optional): Rows per fetchmany call. Defaults to STREAM_BATCH_SIZE.
+            
+        Returns:
+            generator: Lists of article dictionaries.
+            
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        where, params = self.build_where(filters)
+        if cursor:
+            where += " AND (publication_date, id) < (?, ?)"
+            params.extend(decode_cursor(cursor, 'date'))
+        select = self.select_list(filters)
+
+        def batches():
+            with self.cursor() as cur:
+                cur.execute(f"SELECT {select} FROM news {where} ORDER BY publication_date DESC, id DESC", params)
+                while True:
+                    batch = cur.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield [dict(zip(ARTICLE_FIELDS, row)) for row in batch]
+
+        return batches()
+
+    def iter_new(self, after_id=0, batch_size=STREAM_BATCH_SIZE, before_id=None):
+        """Read the articles stored after an id, in insertion order, in fetchmany batches.
+        
+        Args:
+            after_id (int, optional): Last id already read. Defaults to 0 (every article).
+            batch_size (int, optional): Rows per fetchmany call. Defaults to STREAM_BATCH_SIZE.
+            before_id (int, optional): Stop before this id. Defaults to no bound.
+            
+        Returns:
+            generator: Lists of (id, article dictionary) tuples.
+        """
+        with self.cursor() as cur:
+            cur.execute(f"SELECT id, {ARTICLE_COLUMNS} FROM news WHERE id > ? AND id < ? ORDER BY id",
+                        [after_id, before_id if before_id is not None else 2 ** 63 - 1])
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    break
+                yield [(row[0], dict(zip(ARTICLE_FIELDS, row[1:]))) for row in batch]
+
+    def pending_articles(self, limit):
+        """Read the oldest articles awaiting enrichment.
+        
+        Args:
+            limit (int): Maximum number of articles.
+            
+        Returns:
+            list: (id, article dictionary) tuples in id order.
+        """
+        with self.cursor() as cur:
+            rows = cur.execute(f"SELECT id, {ARTICLE_COLUMNS} FROM news WHERE language = ? ORDER BY id LIMIT ?",
+                               [PENDING_ENRICHMENT, limit]).fetchall()
+        return [(row[0], dict(zip(ARTICLE_FIELDS, row[1:]))) for row in rows]
+
+    def update_enrichment(self, rows):
+        """Store the enrichment of pending articles with one UPDATE joined on a DataFrame.
+        
+        Args:
+            rows (list): (id, enriched article dictionary) tuples.
+            
+        Returns:
+            int: Number of articles updated (ones enriched meanwhile are skipped).
+        """
+        fields = ('language', 'sentiment') + SCORE_FIELDS
+        batch = pd.DataFrame([dict(item, id=row_id) for row_id, item in rows], columns=['id', *fields])
+        with self._write_lock:
+            with self.cursor() as cur:
+                cur.register('batch', batch)
+                updated = cur.execute(f'''
+                    UPDATE news SET {', '.join(f'{field} = b.{field}' for field in fields)}
+                    FROM batch b WHERE news.id = b.id AND news.language = ?
+                ''', [PENDING_ENRICHMENT]).fetchone()[0]
+                cur.unregister('batch')
+        if updated:
+            self.cache.bump()
+        return updated
+
+    def first_pending_id(self):
+        """Get the id of the oldest article awaiting enrichment.
+        
+        Returns:
+            int: Id, or None when every article is enriched.
+        """
+        with self.cursor() as cur:
+            return cur.execute('SELECT MIN(id) FROM news WHERE language = ?', [PENDING_ENRICHMENT]).fetchone()[0]
+
+    def facet_groups(self, keyword=None):
+        """Count articles per combination of FILTER_FIELDS values in one grouped scan.
+        
+        Args:
+            keyword (str, optional): Keyword search restricting the counted articles.
+            
+        Returns:
+            list: Tuples of the FILTER_FIELDS values followed by the article count.
+        """
+        where, params = self.build_where(FilterRequest(keyword=keyword))
+        columns = ', '.join(FILTER_FIELDS)
+
+        def load():
+            with self.cursor() as cur:
+                return cur.execute(f"SELECT {columns}, COUNT(*) FROM news {where} GROUP BY {columns}",
+                                   params).fetchall()
+
+        if keyword:
+            return load()
+        return self.cache.get('groups', load)
+
+    def day_counts(self, filters):
+        """Count the articles matching the filters per publication day.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            
+        Returns:
+            dict: Article count per day.
+        """
+        where, params = self.build_where(filters)
+        with self.cursor() as cur:
+            rows = cur.execute(f'''
+                SELECT strftime(published_at, '%Y-%m-%d'), COUNT(*) FROM news {where} GROUP BY 1
+            ''', params).fetchall()
+        return dict(rows)
+
+    def timeseries_points(self, filters, bucket, group_by, start, end):
+        """Count the articles matching the filters per time bucket and group.
+        
+        Args:
+            filters (FilterRequest): Filter parameters.
+            bucket (str): One of TIMESERIES_BUCKETS.
+            group_by (str): One of TIMESERIES_GROUPS, or None.
+            start (datetime): Earliest publication date, or None.
+            end (datetime): Latest publication date, or None.
+            
+        Returns:
+            list: {'time', 'group', 'count'} dictionaries ordered by time and group.
+        """
+        where, params = self.build_where(filters)
+        where += " AND published_at IS NOT NULL"
+        for bound, op in ((start, '>='), (end, '<=')):
+            if bound:
+                where += f" AND published_at {op} ?"
+                params.append(bound.astimezone(timezone.utc).replace(tzinfo=None) if bound.tzinfo else bound)
+        time_expr = {
+            'hour': "strftime(date_trunc('hour', published_at), '%Y-%m-%d %H:00:00')",
+            'day': "strftime(published_at, '%Y-%m-%d')",
+            'week': "strftime(date_trunc('week', published_at), '%Y-%m-%d')",
+        }[bucket]
+        group_expr = group_by or 'NULL'
+        with self.cursor() as cur:
+            rows = cur.execute(f'''
+                SELECT {time_expr}, {group_expr}, COUNT(*) FROM news {where} GROUP BY 1, 2 ORDER BY 1, 2
+            ''', params).fetchall()
+        return [{'time': time, 'group': group, 'count': count} for time, group, count in rows]
+
+def archive_date(publication_date):
+    """Get the date partition of an article.
+    
+    Args:
+        publication_date (str): Stored publication date ('YYYY-MM-DD HH:MM:SS' or ISO 8601).
+        
+    Returns:
+        str: The YYYY-MM-DD day, or ARCHIVE_NULL_PARTITION if the date is missing or malformed.
+    """
+    if publication_date and re.match(r'\d{4}-\d{2}-\d{2}', publication_date):
+        return publication_date[:10]
+    return ARCHIVE_NULL_PARTITION
+
+def build_archive_filter(filters=None, start=None, end=None):
+    """Build a pyarrow dataset expression for archive reads.
+    
+    Predicates on the date and country partition keys prune whole directories;
+    the others are pushed down to Parquet row-group statistics. Keyword terms are
+    case-insensitive substring matches on title or summary. Score ranges apply
+    to the score columns, which files archived before they existed read as null.
+    
+    Args:
+        filters (FilterRequest, optional): Field and keyword filters. Defaults to none.
+        start (str, optional): First publication day to include (YYYY-MM-DD).
+        end (str, optional): Last publication day to include (YYYY-MM-DD).
+        
+    Returns:
+        pyarrow.dataset.Expression: Filter expression, or None to read everything.
+    """
+    conditions = []
+    if start:
+        conditions.append(pc.field('date') >= start)
+    if end:
+        conditions.append(pc.field('date') <= end)
+    if filters is not None:
+        for field, values in selected_values(filters).items():
+            if field == 'year':
+                years = [(pc.field('date') >= f"{year}-01-01") & (pc.field('date') <= f"{year}-12-31")
+                         for year in sorted(values)]
+                conditions.append(functools.reduce(operator.or_, years))
+            else:
+                conditions.append(pc.field(field).isin(sorted(values)))
+        for name, column in SCORE_FILTERS.items():
+            low, high = getattr(filters, f'{name}_min'), getattr(filters, f'{name}_max')
+            if low is not None:
+                conditions.append(pc.field(column) >= low)
+            if high is not None:
+                conditions.append(pc.field(column) <= high)
+        terms = parse_keyword(filters.keyword or '')
+        if filters.keyword and not terms:
+            conditions.append(pc.scalar(False))
+        for text, _ in terms:
+            conditions.append(pc.match_substring(pc.field('title'), text, ignore_case=True) |
+                              pc.match_substring(pc.field('summary'), text, ignore_case=True))
+    return functools.reduce(operator.and_, conditions) if conditions else None
+
+class IncrementalExport:
+    """Base class of the exports that append the articles stored since the previous export.
+
+    New rows are read from the store with iter_new, so an export costs time
+    proportional to the delta rather than the corpus. The id of the last exported
+    row is kept in a JSON state file that is replaced atomically after every batch.
+    Subclasses write each batch in write_batch and may keep extra keys in self.state.
+    """
+
+    def __init__(self, state_path, batch_size):
+        """Load the export state.
+        
+        Args:
+            state_path (str): Path of the JSON state file.
+            batch_size (int): Articles read from the store per batch.
+        """
+        self.state_path = state_path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self.state = self.load_state()
+
+    def load_state(self):
+        """Read the export state.
+        
+        Returns:
+            dict: State with the last exported row id ('last_id', 0 for a new export).
+        """
+        try:
+            with open(self.state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'last_id': 0}
+
+    def save_state(self):
+        """Persist the export state, replacing the state file atomically."""
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def prepare(self):
+        """Recover from an interrupted export before appending; a no-op by default."""
+
+    def finish(self):
+        """Tidy up after the new articles are appended; a no-op by default."""
+
+    def write_batch(self, batch):
+        """Write one batch of new articles.
+        
+        Args:
+            batch (list): (row id, article dictionary) tuples in insertion order.
+        """
+        raise NotImplementedError
+
+    def export(self, store):
+        """Append the articles stored since the last export.
+        
+        Exports stop before the oldest article awaiting enrichment, since appended
+        rows are never rewritten; the rest follow once the backfill reaches them.
+        
+        Args:
+            store (NewsStore): Store to read new articles from.
+            
+        Returns:
+            int: Number of articles exported.
+        """
+        exported = 0
+        with self._lock:
+            self.prepare()
+            for batch in store.iter_new(self.state['last_id'], self.batch_size, store.first_pending_id()):
+                self.write_batch(batch)
+                exported += len(batch)
+                self.state['last_id'] = batch[-1][0]
+                self.save_state()
+            self.finish()
+        return exported
+
+class AppendOnlyFileExport(IncrementalExport):
+    """Single export file that only ever grows by the rows stored since the previous export.
+
+    Each batch is rendered in memory and appended with one write and an fsync;
+    the file size is saved with the last exported row id. An append cut short
+    by a crash is truncated away on the next export, which then rewrites that
+    batch, so the file never holds partial or duplicated rows for long.
+    """
+
+    def __init__(self, path, batch_size=EXPORT_BATCH_SIZE):
+        """Load the export state kept next to the file (.<name>.state.json).
+        
+        Args:
+            path (str): Path of the export file.
+            batch_size (int, optional): Articles read from the store per batch. Defaults to EXPORT_BATCH_SIZE.
+        """
+        self.path = path
+        directory, name = os.path.split(path)
+        super().__init__(os.path.join(directory, f'.{name}.state.json'), batch_size)
+        self.state.setdefault('size', 0)
+
+    def prepare(self):
+        """Truncate the file to the size recorded with the last exported row.
+        
+        A file without state (or replaced by a shorter one) is exported again
+        from the first article.
+        """
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size < self.state['size']:
+            logging.warning(f"{self.path} is shorter than its last export, exporting every article again")
+            self.state = {'last_id': 0, 'size': 0}
+        with open(self.path, 'ab') as f:
+            f.truncate(self.state['size'])
+
+    def render(self, articles, first):
+        """Serialize a batch of articles.
+        
+        Args:
+            articles (list): Article dictionaries.
+            first (bool): True for the first batch written to an empty file.
+            
+        Returns:
+            bytes: Serialized batch.
+        """
+        raise NotImplementedError
+
+    def write_batch(self, batch):
+        """Append one batch of new articles to the file.
+        
+        Args:
+            batch (list): (row id, article dictionary) tuples in insertion order.
+        """
+        data = self.render([item for _, item in batch], first=self.state['size'] == 0)
+        with open(self.path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.state['size'] += len(data)
+
+class CsvExport(AppendOnlyFileExport):
+    """CSV export of every stored article; the header row is written once, with the first batch."""
+
+    def prepare(self):
+        """Truncate the file to its last export, starting over if the columns changed.
+        
+        The header lists ARTICLE_FIELDS as they were when the file was started, so
+        a file written with other columns (such as before the score columns) is
+        exported again from the first article rather than appended to.
+        """
+        if self.state['size'] and self.state.get('fields') != list(ARTICLE_FIELDS):
+            logging.warning(f"{self.path} has other columns than {', '.join(ARTICLE_FIELDS)}, exporting every article again")
+            self.state = {'last_id': 0, 'size': 0}
+        super().prepare()
+        self.state['fields'] = list(ARTICLE_FIELDS)
+
+    def render(self, articles, first):
+        """Serialize a batch of articles as CSV rows.
+        
+        Args:
+            articles (list): Article dictionaries.
+            first (bool): True to start with the header row.
+            
+        Returns:
+            bytes: UTF-8 encoded CSV rows.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=ARTICLE_FIELDS, lineterminator='\n')
+        if first:
+            writer.writeheader()
+        writer.writerows(articles)
+        return buffer.getvalue().encode('utf-8')
+
+class JsonLinesExport(AppendOnlyFileExport):
+    """JSON Lines export of every stored article, one object per line."""
+
+    def render(self, articles, first):
+        """Serialize a batch of articles as JSON Lines.
+        
+        Args:
+            articles (list): Article dictionaries.
+            first (bool): Unused; JSON Lines has no header.
+            
+        Returns:
+            bytes: One JSON object per line.
+        """
+        return b''.join(orjson.dumps(item) + b'\n' for item in articles)
+
+class ParquetArchive(IncrementalExport):
+    """Compressed Parquet copy of the article corpus, partitioned by publication day and country.
+
+    Files are laid out Hive-style (date=2025-05-30/country=UK/part-<id>.parquet),
+    so pyarrow, DuckDB or Spark can query the directory in place and skip every
+    partition a date or country predicate rules out. Each export appends files for
+    the articles stored since the previous one, then merges the parts of closed
+    days (open_days behind the newest one) into one file per partition, so
+    the file count grows with days and countries rather than with runs. The export
+    state, including the days still to merge, is kept in _state.json, which
+    dataset readers ignore.
+    """
+
+    def __init__(self, path, compression=ARCHIVE_COMPRESSION, batch_size=EXPORT_BATCH_SIZE,
+                 open_days=ARCHIVE_OPEN_DAYS):
+        """Open (or create) the archive directory.
+        
+        Args:
+            path (str): Archive root directory.
+            compression (str, optional): Parquet compression codec. Defaults to ARCHIVE_COMPRESSION.
+            batch_size (int, optional): Articles read from the store per batch. Defaults to EXPORT_BATCH_SIZE.
+            open_days (int, optional): Days behind the newest one whose parts are not merged yet.
+                Defaults to ARCHIVE_OPEN_DAYS.
+        """
+        self.path = path
+        self.compression = compression
+        self.open_days = open_days
+        self.file_schema = pa.schema([('id', pa.int64())] + [
+            (field, pa.float64() if field in SCORE_FIELDS else pa.string())
+            for field in ARTICLE_FIELDS if field not in ARCHIVE_PARTITIONS])
+        self.partitioning = ds.partitioning(pa.schema([(key, pa.string()) for key in ARCHIVE_PARTITIONS]),
+                                            flavor='hive')
+        os.makedirs(path, exist_ok=True)
+        super().__init__(os.path.join(path, '_state.json'), batch_size)
+        if 'unmerged' not in self.state:
+            # Archives written before parts were merged: every day may hold several parts
+            days = sorted(unquote(name[5:]) for name in os.listdir(path) if name.startswith('date='))
+            self.state['unmerged'] = days
+            dated = [day for day in days if day != ARCHIVE_NULL_PARTITION]
+            if dated:
+                self.state['newest_date'] = dated[-1]
+
+    def write_partition(self, date, country, articles, first_id):
+        """Write one batch's articles of a partition to a new Parquet file.
+        
+        The file is named after the batch's first row id, so re-exporting a batch
+        after a crash replaces its files instead of duplicating them; it is written
+        under a temporary name and renamed, so readers never see a partial file.
+        
+        Args:
+            date (str): Date partition value.
+            country (str): Country partition value.
+            articles (list): (row id, article dictionary) tuples, sorted by publication date.
+            first_id (int): Row id of the batch's first article.
+        """
+        directory = os.path.join(self.path, f"date={quote(date, safe='')}",
+                                 f"country={quote(country or ARCHIVE_NULL_PARTITION, safe='')}")
+        os.makedirs(directory, exist_ok=True)
+        columns = {'id': [row_id for row_id, _ in articles]}
+        for field in self.file_schema.names[1:]:
+            columns[field] = [item[field] for _, item in articles]
+        path = os.path.join(directory, f"part-{first_id}.parquet")
+        pq.write_table(pa.table(columns, schema=self.file_schema), path + '.tmp', compression=self.compression)
+        os.replace(path + '.tmp', path)
+
+    def write_batch(self, batch):
+        """Write one batch of new articles, one file per partition it touches.
+        
+        The days written to are recorded in the state (saved with the batch), so
+        they are merged once closed even if this export is interrupted.
+        
+        Args:
+            batch (list): (row id, article dictionary) tuples in insertion order.
+        """
+        groups = {}
+        for row_id, item in batch:
+            key = (archive_date(item['publication_date']), item['country'])
+            groups.setdefault(key, []).append((row_id, item))
+        unmerged = set(self.state.get('unmerged', []))
+        for (date, country), items in groups.items():
+            items.sort(key=lambda pair: pair[1]['publication_date'] or '')
+            self.write_partition(date, country, items, batch[0][0])
+            unmerged.add(date)
+            if date != ARCHIVE_NULL_PARTITION:
+                self.state['newest_date'] = max(date, self.state.get('newest_date', date))
+        self.state['unmerged'] = sorted(unmerged)
+
+    def compact_partition(self, directory):
+        """Merge the part files of one partition into a single file.
+        
+        The merged file takes the name of the lowest part, which is replaced
+        atomically before the others are deleted; rows are deduplicated by id, so
+        merging again after a crash between the two steps repairs the partition.
+        
+        Args:
+            directory (str): Partition directory (date=.../country=...).
+        """
+        parts = sorted((name for name in os.listdir(directory)
+                        if name.startswith('part-') and name.endswith('.parquet')),
+                       key=lambda name: int(name[5:-8]))
+        if len(parts) < 2:
+            return
+        table = pa.concat_tables([pq.read_table(os.path.join(directory, name), schema=self.file_schema)
+                                  for name in parts])
+        ids = table.column('id').to_pylist()
+        if len(set(ids)) < len(ids):
+            seen = set()
+            table = table.filter(pa.array([row_id not in seen and not seen.add(row_id) for row_id in ids]))
+        table = table.sort_by([('publication_date', 'ascending'), ('id', 'ascending')])
+        path = os.path.join(directory, parts[0])
+        pq.write_table(table, path + '.tmp', compression=self.compression)
+        os.replace(path + '.tmp', path)
+        for name in parts[1:]:
+            os.remove(os.path.join(directory, name))
+
+    def finish(self):
+        """Merge the parts of every closed day written to since the last merge."""
+        newest = self.state.get('newest_date')
+        if not self.state.get('unmerged') or newest is None:
+            return
+        cutoff = (datetime.strptime(newest, '%Y-%m-%d') - timedelta(days=self.open_days)).strftime('%Y-%m-%d')
+        still_open = []
+        for date in self.state['unmerged']:
+            # Undated articles never close; their partition is merged whenever it grows
+            if date != ARCHIVE_NULL_PARTITION and date > cutoff:
+                still_open.append(date)
+                continue
+            day = os.path.join(self.path, f"date={quote(date, safe='')}")
+            for country in os.listdir(day):
+                self.compact_partition(os.path.join(day, country))
+        self.state['unmerged'] = still_open
+        self.save_state()
+
+    def dataset(self):
+        """Open the archive as a pyarrow dataset with the partition keys as columns.
+        
+        Returns:
+            pyarrow.dataset.Dataset: Dataset over every archived file.
+        """
+        schema = self.file_schema
+        for key in ARCHIVE_PARTITIONS:
+            schema = schema.append(pa.field(key, pa.string()))
+        return ds.dataset(self.path, schema=schema, format='parquet', partitioning=self.partitioning)
+
+    def read(self, filters=None, start=None, end=None, columns=None):
+        """Read archived articles, pushing the filters down to partitions and row groups.
+        
+        Args:
+            filters (FilterRequest, optional): Field and keyword filters. Defaults to none.
+            start (str, optional): First publication day to include (YYYY-MM-DD).
+            end (str, optional): Last publication day to include (YYYY-MM-DD).
+            columns (list, optional): Columns to read. Defaults to every column.
+            
+        Returns:
+            pyarrow.Table: Matching articles.
+        """
+        return self.dataset().to_table(columns=columns, filter=build_archive_filter(filters, start, end))
+
+scraper = None  # Built by start_scraper, so importing this module starts no threads or processes
+
+@app.on_event("startup")
+def start_scraper():
+    """Build the scraper serving the API, unless one was installed before startup (as benchmark.py does)."""
+    global scraper
+    if scraper is None:
+        scraper = NewsScraper(storage=os.environ.get('NEWS_STORAGE', 'sqlite'),
+                              enrichment=os.environ.get('NEWS_ENRICHMENT', 'inline'))
+
+@app.on_event("shutdown")
+def shutdown_scraper():
+    """Stop the scheduler, the enrichment backfill and workers, and close the databases."""
+    if scraper is not None:
+        scraper.close()
+
+# API Endpoints
+@app.get("/news")
+async def get_all_news(cursor: str | None = None,
+                       limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                       include_total: bool = False,
+                       stream: Literal['ndjson', 'json'] | None = None):
+    """Fetch one page of news articles from the database, newest first.
+    
+    Args:
+        cursor (str, optional): Cursor of the previous page. Defaults to the first page.
+        limit (int, optional): Page size. Defaults to DEFAULT_PAGE_SIZE.
+        include_total (bool, optional): Also count every article. Defaults to False.
+        stream (str, optional): 'ndjson' or 'json' to stream every article instead of one page.
+        
+    Returns:
+        dict: Page with 'items', 'next_cursor' and 'total', or a StreamingResponse when streaming.
+        
+    Raises:
+        HTTPException: If the cursor is invalid or there's an error accessing the database.
+    """
+    try:
+        if stream:
+            return stream_news(FilterRequest(), cursor, stream)
+        return await scraper.db.run(page_response, FilterRequest(), cursor, limit, include_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching news: {str(e)}")
 
 @app.post("/news/filter")
@@ -497,42 +4229,18 @@ async def filter_news(filters: FilterRequest):
         filters (FilterRequest): Filter parameters (country, source, etc.).
         
     Returns:
-        list: List of filtered article dictionaries.
+        dict: Page with 'items', 'next_cursor' and 'total', or a StreamingResponse when
+            filters.stream is set.
         
     Raises:
-        HTTPException: If there's an error querying the database.
+        HTTPException: If the cursor is invalid or there's an error querying the database.
     """
     try:
-        query = "SELECT * FROM news WHERE 1=1"
-        params = []
-
-        if filters.country:
-            countries = [c.strip() for c in filters.country.split(',')]
-            query += f" AND country IN ({','.join(['?' for _ in countries])})"
-            params.extend(countries)
-        if filters.source:
-            sources = [s.strip() for s in filters.source.split(',')]
-            query += f" AND source IN ({','.join(['?' for _ in sources])})"
-            params.extend(sources)
-        if filters.language:
-            languages = [l.strip() for l in filters.language.split(',')]
-            query += f" AND language IN ({','.join(['?' for _ in languages])})"
-            params.extend(languages)
-        if filters.sentiment:
-            sentiments = [s.strip() for s in filters.sentiment.split(',')]
-            query += f" AND sentiment IN ({','.join(['?' for _ in sentiments])})"
-            params.extend(sentiments)
-        if filters.year:
-            years = [y.strip() for y in filters.year.split(',')]
-            query += f" AND strftime('%Y', publication_date) IN ({','.join(['?' for _ in years])})"
-            params.extend(years)
-        if filters.keyword:
-            query += " AND (title LIKE ? summary LIKE ?)"
-            params.extend([f"%{filters.keyword}%", f"%{filters.keyword}%"])
-
-        with sqlite3.connect(scraper.db_name) as conn:
-            df = pd.read_sql_query(query, conn, params=params)
-        return df.to_dict(orient='records')
+        if filters.stream:
+            return stream_news(filters, filters.cursor, filters.stream)
+        return await scraper.db.run(page_response, filters, filters.cursor, filters.limit, filters.include_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error filtering news: {str(e)}")
 
@@ -547,10 +4255,7 @@ async def get_countries():
         HTTPException: If there's an error accessing the database.
     """
     try:
-        with sqlite3.connect(scraper.db_name) as conn:
-            cursor = conn.execute('SELECT DISTINCT country FROM news')
-            countries = [row[0] for row in cursor.fetchall()]
-        return countries
+        return await scraper.db.run(scraper.store.distinct, 'country')
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching countries: {str(e)}")
 
@@ -565,10 +4270,7 @@ async def get_sources():
         HTTPException: If there's an error accessing the database.
     """
     try:
-        with sqlite3.connect(scraper.db_name) as conn:
-            cursor = conn.execute('SELECT DISTINCT source FROM news')
-            sources = [row[0] for row in cursor.fetchall()]
-        return sources
+        return await scraper.db.run(scraper.store.distinct, 'source')
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sources: {str(e)}")
 
@@ -583,10 +4285,7 @@ async def get_languages():
         HTTPException: If there's an error accessing the database.
     """
     try:
-        with sqlite3.connect(scraper.db_name) as conn:
-            cursor = conn.execute('SELECT DISTINCT language FROM news')
-            languages = [row[0] for row in cursor.fetchall()]
-        return languages
+        return await scraper.db.run(scraper.store.distinct, 'language')
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching languages: {str(e)}")
 
@@ -601,10 +4300,7 @@ async def get_sentiments():
         HTTPException: If there's an error accessing the database.
     """
     try:
-        with sqlite3.connect(scraper.db_name) as conn:
-            cursor = conn.execute('SELECT DISTINCT sentiment FROM news')
-            sentiments = [row[0] for row in cursor.fetchall()]
-        return sentiments
+        return await scraper.db.run(scraper.store.distinct, 'sentiment')
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sentiments: {str(e)}")
 
@@ -619,13 +4315,137 @@ async def get_years():
         HTTPException: If there's an error accessing the database.
     """
     try:
-        with sqlite3.connect(scraper.db_name) as conn:
-            cursor = conn.execute("SELECT DISTINCT strftime('%Y', publication_date) as year FROM news")
-            years = [row[0] for row in cursor.fetchall()]
-        return years
+        return await scraper.db.run(scraper.store.distinct, 'year')
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching years: {str(e)}")
 
+@app.get("/news/facets")
+async def get_facets(
+    country: str | None = None,
+    source: str | None = None,
+    language: str | None = None,
+    sentiment: str | None = None,
+    year: str | None = None,
+    keyword: str | None = None,
+    enriched: bool | None = None
+):
+    """Fetch every facet with per-value article counts in one call.
+    
+    Args:
+        country (str, optional): Comma-separated countries to filter by.
+        source (str, optional): Comma-separated sources to filter by.
+        language (str, optional): Comma-separated language codes to filter by.
+        sentiment (str, optional): Comma-separated sentiment labels to filter by.
+        year (str, optional): Comma-separated years to filter by.
+        keyword (str, optional): Keyword search in title/summary.
+        enriched (bool, optional): True for enriched articles only, False for ones awaiting enrichment.
+        
+    Returns:
+        dict: 'total' matching articles and per-field lists of {'value', 'count'}.
+        
+    Raises:
+        HTTPException: If there's an error accessing the database.
+    """
+    try:
+        filters = FilterRequest(country=country, source=source, language=language,
+                                sentiment=sentiment, year=year, keyword=keyword, enriched=enriched)
+        return await scraper.db.run(scraper.store.facets, filters)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching facets: {str(e)}")
+
+@app.get("/news/stats")
+async def get_stats(
+    by: list[str] = Query(['country', 'language', 'sentiment']),
+    country: str | None = None,
+    source: str | None = None,
+    language: str | None = None,
+    sentiment: str | None = None,
+    year: str | None = None,
+    keyword: str | None = None,
+    enriched: bool | None = None
+):
+    """Fetch dashboard statistics from the rollup table.
+    
+    Args:
+        by (list): Fields to group by (repeat the parameter), any of STATS_FIELDS.
+        country (str, optional): Comma-separated countries to filter by.
+        source (str, optional): Comma-separated sources to filter by.
+        language (str, optional): Comma-separated language codes to filter by.
+        sentiment (str, optional): Comma-separated sentiment labels to filter by.
+        year (str, optional): Comma-separated years to filter by.
+        keyword (str, optional): Keyword search in title/summary (counted from the articles).
+        enriched (bool, optional): True for enriched articles only, False for ones awaiting enrichment.
+        
+    Returns:
+        dict: 'total' matching articles and per-field lists of {'value', 'count'}.
+        
+    Raises:
+        HTTPException: If a group-by field is unknown or there's an error accessing the database.
+    """
+    try:
+        filters = FilterRequest(country=country, source=source, language=language,
+                                sentiment=sentiment, year=year, keyword=keyword, enriched=enriched)
+        return await scraper.db.run(scraper.store.aggregate, filters, by)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching stats: {str(e)}")
+
+@app.get("/news/timeseries")
+async def get_timeseries(
+    bucket: str = 'day',
+    group_by: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    normalize: bool = False,
+    country: str | None = None,
+    source: str | None = None,
+    language: str | None = None,
+    sentiment: str | None = None,
+    year: str | None = None,
+    keyword: str | None = None,
+    enriched: bool | None = None
+):
+    """Fetch article volume per time bucket, optionally split by a dimension.
+    
+    Args:
+        bucket (str): 'hour', 'day' or 'week'.
+        group_by (str, optional): 'country', 'source', 'language' or 'sentiment'.
+        start (datetime, optional): Earliest publication date (ISO 8601).
+        end (datetime, optional): Latest publication date (ISO 8601).
+        normalize (bool): Add each group's share of its bucket, e.g. sentiment ratios.
+        country (str, optional): Comma-separated countries to filter by.
+        source (str, optional): Comma-separated sources to filter by.
+        language (str, optional): Comma-separated language codes to filter by.
+        sentiment (str, optional): Comma-separated sentiment labels to filter by.
+        year (str, optional): Comma-separated years to filter by.
+        keyword (str, optional): Keyword search in title/summary.
+        enriched (bool, optional): True for enriched articles only, False for ones awaiting enrichment.
+        
+    Returns:
+        dict: Bucket size, group-by dimension and the list of points.
+        
+    Raises:
+        HTTPException: If the bucket or dimension is unknown or there's an error accessing the database.
+    """
+    try:
+        filters = FilterRequest(country=country, source=source, language=language,
+                                sentiment=sentiment, year=year, keyword=keyword, enriched=enriched)
+        return await scraper.db.run(scraper.store.timeseries, filters, bucket, group_by, start, end, normalize)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching timeseries: {str(e)}")
+
+@app.get("/news/cache_stats")
+async def get_cache_stats():
+    """Report the facet cache counters.
+    
+    Returns:
+        dict: Data version, hits, misses, hit rate and number of cached facets.
+    """
+    return scraper.store.cache.stats()
+
 @app.post("/news/scrape")
 async def scrape_rss(request: ScrapeRequest):
     """Scrape a single RSS feed based on the provided request.
@@ -640,27 +4460,70 @@ async def scrape_rss(request: ScrapeRequest):
         HTTPException: If there's an error during scraping.
     """
     try:
-        entries = scraper.scrape_single_feed(request.rss_url, request.country, request.agency)
+        # Fetching and saving block, so keep them off the event loop
+        entries = await asyncio.to_thread(scraper.scrape_single_feed, request.rss_url, request.country, request.agency)
         return entries
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error scraping RSS feed: {str(e)}")
 
-@app.get("/news/scrape_all")
+@app.get("/news/scrape_all", status_code=202)
 async def scrape_all():
-    """Trigger a full scrape of all configured feeds and historical articles.
+    """Start a full scrape of all configured feeds and historical articles in the background.
+    
+    Only one full scrape runs at a time; while one is queued or running, its job
+    is returned instead of starting another.
     
     Returns:
-        dict: Success message.
+        dict: Message, job ID and status of the scrape job; poll /jobs/{job_id} for progress.
         
     Raises:
-        HTTPException: If there's an error during scraping.
+        HTTPException: If the job cannot be submitted.
+    """
+    try:
+        job, created = scraper.submit_scrape()
+        message = "Scraping started" if created else "Scraping already in progress"
+        return {"message": message, "job_id": job['id'], "status": job['status']}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error starting full scrape: {str(e)}")
+
+@app.post("/news/backfill", status_code=202)
+async def backfill_enrichment():
+    """Wake the enrichment backfill to enrich every article awaiting enrichment now.
+    
+    Returns:
+        dict: Number of articles awaiting enrichment and of articles backfilled since startup.
+        
+    Raises:
+        HTTPException: If there's an error accessing the database.
     """
     try:
-        scraper.run_scrape()
-        return {"message": "Scraping completed"}
+        page = await scraper.db.run(scraper.store.query, FilterRequest(enriched=False), None, 1, True)
+        scraper.backfill.notify()
+        return {'pending': page['total'], 'backfilled': scraper.backfill.backfilled,
+                'message': 'Backfill started' if page['total'] else 'No articles awaiting enrichment'}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error during full scrape: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error starting backfill: {str(e)}")
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Fetch the status and progress of a background job.
+    
+    Args:
+        job_id (str): Job ID returned by /news/scrape_all.
+        
+    Returns:
+        dict: Job status ('queued', 'running', 'succeeded' or 'failed'), timestamps,
+            progress counters (feeds done, articles new/duplicate, errors) and result.
+        
+    Raises:
+        HTTPException: If the job is unknown.
+    """
+    job = scraper.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
 
 if __name__ == "__main__":
-    scraper.run_scrape()  # Perform an initial scrape
-    uvicorn.run(app, host="0.0.0.0", port=8000)  # Start the FastAPI server
\ No newline at end of file
+    start_scraper()
+    scraper.submit_scrape()  # Perform an initial scrape in the background
+    uvicorn.run(app, host="0.0.0.0", port=8000)  # Start the FastAPI server
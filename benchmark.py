@@ -0,0 +1,1131 @@
+"""Benchmarks for the News Explorer backend.
+
+Each benchmark is a sub-command and runs against local fixtures (temporary
+databases and local HTTP servers), so no real news site is contacted:
+
+    python benchmark.py fetch --feeds 2000 --hosts 20
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import resource
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import combinations
+
+import backend
+from backend import (FILTER_FIELDS, AsyncFeedFetcher, FilterRequest, NewsScraper, ParquetArchive,
+                     build_count_query, build_filter_query)
+
+
+COUNTRIES = ['UK', 'USA', 'India', 'Japan', 'Qatar', 'Germany', 'France', 'Brazil', 'Russia', 'Nigeria']
+LANGUAGES = ['en', 'en', 'en', 'hi', 'ja', 'de', 'fr', 'pt', 'ru', 'unknown']
+SENTIMENTS = ['positive', 'negative', 'neutral', 'unknown']
+WORDS = ('election', 'markets', 'climate', 'football', 'inflation', 'summit', 'earthquake', 'vaccine',
+         'parliament', 'protest', 'startup', 'drought', 'tariff', 'satellite', 'festival', 'refinery',
+         'budget', 'strike', 'museum', 'hurricane', 'ceasefire', 'semiconductor', 'tourism', 'olympics')
+
+
+def make_articles(count, offset=0, seed=0):
+    """Generate synthetic articles shaped like the scraper output.
+
+    Args:
+        count (int): Number of articles.
+        offset (int): First article number, so batches do not collide.
+        seed (int): Random seed for reproducible data.
+
+    Returns:
+        list: List of article dictionaries.
+    """
+    rng = random.Random(seed + offset)
+    articles = []
+    for i in range(offset, offset + count):
+        country = rng.choice(COUNTRIES)
+        published = time.gmtime(1672531200 + rng.randrange(3 * 365 * 86400))  # 2023-2025
+        articles.append({
+            'title': f"{' '.join(rng.sample(WORDS, 3)).capitalize()} headline {i}",
+            'publication_date': time.strftime('%Y-%m-%d %H:%M:%S', published),
+            'source': f'{country} Agency {rng.randrange(3)}',
+            'country': country,
+            'summary': f"Article {i} covers {', '.join(rng.sample(WORDS, 6))} and more.",
+            'url': f'http://example.com/{country.lower()}/{i}',
+            'language': rng.choice(LANGUAGES),
+            'sentiment': rng.choice(SENTIMENTS),
+        })
+        articles[-1].update(make_scores(rng, articles[-1]['sentiment']))
+    return articles
+
+
+def make_scores(rng, sentiment):
+    """Generate VADER scores consistent with a sentiment label.
+
+    Args:
+        rng (random.Random): Random generator.
+        sentiment (str): Sentiment label; 'unknown' gets no scores.
+
+    Returns:
+        dict: Value per backend.SCORE_FIELDS field.
+    """
+    if sentiment == 'unknown':
+        return dict.fromkeys(backend.SCORE_FIELDS)
+    low, high = {'positive': (0.06, 1.0), 'negative': (-1.0, -0.06), 'neutral': (-0.05, 0.05)}[sentiment]
+    compound = round(rng.uniform(low, high), 4)
+    pos, neg = round(max(compound, 0) / 2, 3), round(max(-compound, 0) / 2, 3)
+    return dict(zip(backend.SCORE_FIELDS, (compound, pos, neg, round(1 - pos - neg, 3))))
+
+
+def build_rss(items):
+    """Build an RSS document with the given number of items.
+
+    Args:
+        items (int): Number of items in the feed.
+
+    Returns:
+        bytes: Encoded RSS document.
+    """
+    now = time.strftime('%a, %d %b %Y %H:%M:%S +0000', time.gmtime())
+    entries = ''.join(
+        f"<item><title>Benchmark headline {i}</title><link>http://example.com/{i}</link>"
+        f"<description>Markets rallied today as investors welcomed the good news {i}.</description>"
+        f"<pubDate>{now}</pubDate></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>{entries}</channel></rss>'.encode('utf-8')
+
+
+def start_feed_server(body, delay):
+    """Start a local HTTP server that serves a feed body after a delay.
+
+    Args:
+        body (bytes): Feed body to serve on every path.
+        delay (float): Seconds to wait before answering, simulating a remote host.
+
+    Returns:
+        ThreadingHTTPServer: Running server (call shutdown() when done).
+    """
+    class FeedHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_fetch(args):
+    """Compare the async and threaded fetch modes over many local feeds."""
+    body = build_rss(args.items)
+    # The first host is slow, like The Punch or The Straits Times in the logs
+    servers = [start_feed_server(body, args.slow_delay if i == 0 else args.delay) for i in range(args.hosts)]
+    rss_feeds = {'Benchmark': [
+        (f'Feed {i}', f'http://127.0.0.1:{servers[i % args.hosts].server_address[1]}/feed/{i}')
+        for i in range(args.feeds)
+    ]}
+    try:
+        for mode in args.modes:
+            # A fresh database per mode, so the second mode does not skip the articles the first one saved
+            with tempfile.TemporaryDirectory() as tmp:
+                scraper = NewsScraper(db_name=os.path.join(tmp, 'bench.db'), output_dir=tmp,
+                                      max_in_flight=args.max_in_flight, per_host_limit=args.per_host_limit)
+                scraper.scheduler.shutdown(wait=False)
+                start = time.perf_counter()
+                run = scraper.scrape_all_feeds(mode=mode, rss_feeds=rss_feeds, historical_urls={})
+                elapsed = time.perf_counter() - start
+                print(f"{mode:>8}: {args.feeds} feeds, {run.stats['entries_new']} articles "
+                      f"in {elapsed:.2f}s ({args.feeds / elapsed:.1f} feeds/s)")
+                scraper.close()
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+def bench_slow_host(args):
+    """Check that feeds on fast hosts are not held up behind a slow host.
+
+    The slow host's feeds are requested first and outnumber the global budget.
+    Exits with status 1 if any fast host finishes later than --fast-delay plus
+    --tolerance, which is what happens when requests waiting on the slow host's
+    per-host limit hold global slots.
+    """
+    slow = start_feed_server(build_rss(1), args.slow_delay)
+    fast = [start_feed_server(build_rss(1), args.fast_delay) for _ in range(args.fast_hosts)]
+    urls = [f'http://127.0.0.1:{slow.server_address[1]}/feed/{i}' for i in range(args.slow_feeds)]
+    urls += [f'http://127.0.0.1:{server.server_address[1]}/feed/{i}'
+             for server in fast for i in range(args.feeds_per_host)]
+    fetcher = AsyncFeedFetcher(max_in_flight=args.max_in_flight, per_host_limit=args.per_host_limit)
+    finished = {}
+
+    async def fetch_all():
+        start = time.perf_counter()
+
+        async def fetch(client, url):
+            await fetcher.fetch(client, url)
+            host = url.split('/')[2]
+            finished[host] = max(finished.get(host, 0), time.perf_counter() - start)
+
+        async with fetcher.create_client() as client:
+            await asyncio.gather(*(fetch(client, url) for url in urls))
+
+    try:
+        asyncio.run(fetch_all())
+    finally:
+        for server in [slow] + fast:
+            server.shutdown()
+    slow_host = f'127.0.0.1:{slow.server_address[1]}'
+    fast_times = [elapsed for host, elapsed in finished.items() if host != slow_host]
+    limit = args.fast_delay + args.tolerance
+    print(f"slow host: {args.slow_feeds} feeds done after {finished[slow_host]:.2f}s")
+    print(f"fast hosts: {len(fast_times)} hosts done after {min(fast_times):.2f}s-{max(fast_times):.2f}s "
+          f"(limit {limit:.2f}s)")
+    if max(fast_times) > limit:
+        print("fast hosts were delayed by the slow host")
+        sys.exit(1)
+
+
+def save_per_row(db_name, articles):
+    """Baseline: the original save_to_database loop, one commit per article."""
+    with sqlite3.connect(db_name) as conn:
+        for item in articles:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR IGNORE INTO news (title, publication_date, source, country, summary, url, language, sentiment)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (item['title'], item['publication_date'], item['source'], item['country'],
+                  item['summary'], item['url'], item['language'], item['sentiment']))
+            conn.commit()
+
+
+def bench_insert(args):
+    """Compare the bulk single-transaction writer with the per-row commit loop.
+
+    Every size gets fresh databases, so no size deduplicates against the rows of
+    the previous one.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            articles = make_articles(rows)
+            scraper = NewsScraper(db_name=os.path.join(tmp, f'bulk{rows}.db'), output_dir=tmp,
+                                  db_batch_size=args.batch_size)
+            scraper.scheduler.shutdown(wait=False)
+            start = time.perf_counter()
+            counts = scraper.save_to_database(articles)
+            bulk = time.perf_counter() - start
+            scraper.close()
+            assert counts['inserted'] == rows, f"expected {rows} rows inserted, got {counts}"
+            print(f"{rows:>9} rows  bulk:    {bulk:8.2f}s ({rows / bulk:,.0f} rows/s) {counts}")
+
+            if rows > args.per_row_limit:
+                print(f"{rows:>9} rows  per-row: skipped (above --per-row-limit {args.per_row_limit})")
+                continue
+            per_row_scraper = NewsScraper(db_name=os.path.join(tmp, f'per_row{rows}.db'), output_dir=tmp)
+            per_row_scraper.close()
+            start = time.perf_counter()
+            save_per_row(per_row_scraper.db_name, articles)
+            per_row = time.perf_counter() - start
+            print(f"{rows:>9} rows  per-row: {per_row:8.2f}s ({rows / per_row:,.0f} rows/s), "
+                  f"bulk is {per_row / bulk:.1f}x faster")
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers (nearest rank)."""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_mixed_workload(write_batch, read_once, batches, readers, think_time=0.01):
+    """Run reader threads in a loop while one thread writes a series of batches.
+
+    Args:
+        write_batch (callable): Writes one batch; called with the batch index.
+        read_once (callable): Runs one read query.
+        batches (int): Number of batches to write.
+        readers (int): Number of concurrent reader threads.
+        think_time (float): Pause between two reads of one reader (s), like API clients.
+
+    Returns:
+        dict: Write time, read latencies (seconds) and read error count.
+    """
+    done = threading.Event()
+    latencies = []
+    errors = []
+
+    def reader():
+        while not done.is_set():
+            start = time.perf_counter()
+            try:
+                read_once()
+                latencies.append(time.perf_counter() - start)
+            except sqlite3.Error as e:
+                errors.append(e)
+            time.sleep(think_time)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for i in range(batches):
+        write_batch(i)
+    write_time = time.perf_counter() - start
+    done.set()
+    for thread in threads:
+        thread.join()
+    return {'write_time': write_time, 'latencies': latencies, 'errors': len(errors)}
+
+
+def bench_concurrency(args):
+    """Read latency during a scrape's writes: WAL factory vs. default rollback journal."""
+    read_sql = "SELECT * FROM news WHERE country = 'UK' ORDER BY rowid DESC LIMIT 50"
+    batches = [make_articles(args.batch_rows, offset=args.rows + i * args.batch_rows) for i in range(args.batches)]
+    with tempfile.TemporaryDirectory() as tmp:
+        # Tuned: NewsScraper's WAL connection factory, per-thread reader connections
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'wal.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        scraper.save_to_database(make_articles(args.rows))
+
+        def read_wal():
+            with scraper.db.reader() as conn:
+                conn.execute(read_sql).fetchall()
+
+        # Baseline: default journal mode and a fresh connection per request, as before
+        baseline_db = os.path.join(tmp, 'rollback.db')
+        with sqlite3.connect(baseline_db) as conn:
+            conn.execute('''
+                CREATE TABLE news (title TEXT, publication_date TEXT, source TEXT, country TEXT, summary TEXT,
+                                   url TEXT, language TEXT NOT NULL, sentiment TEXT, sentiment_compound REAL,
+                                   sentiment_pos REAL, sentiment_neg REAL, sentiment_neu REAL,
+                                   UNIQUE(title, publication_date, source, url))
+            ''')
+        insert_sql = f"INSERT OR IGNORE INTO news VALUES ({', '.join('?' for _ in backend.ARTICLE_FIELDS)})"
+
+        def write_baseline(articles):
+            with sqlite3.connect(baseline_db) as conn:
+                conn.executemany(insert_sql, [tuple(a.values()) for a in articles])
+
+        def read_baseline():
+            with sqlite3.connect(baseline_db) as conn:
+                conn.execute(read_sql).fetchall()
+            conn.close()
+
+        write_baseline(make_articles(args.rows))
+
+        for name, write, read in (
+            ('rollback', write_baseline, read_baseline),
+            ('wal', scraper.save_to_database, read_wal),
+        ):
+            result = run_mixed_workload(lambda i: write(batches[i]), read, args.batches, args.readers,
+                                        args.think_time)
+            latencies = result['latencies']
+            print(f"{name:>8}: wrote {args.batches}x{args.batch_rows} rows in {result['write_time']:.2f}s; "
+                  f"{len(latencies)} reads, p50 {percentile(latencies, 50) * 1000:.1f}ms, "
+                  f"p99 {percentile(latencies, 99) * 1000:.1f}ms, max {max(latencies, default=0) * 1000:.1f}ms, "
+                  f"{result['errors']} errors")
+        scraper.close()
+
+
+def bench_plans(args):
+    """Check with EXPLAIN QUERY PLAN that no filter combination scans the news table.
+
+    The count query, the first-page query and a next-page query (with a cursor)
+    are checked, for every combination of the filter fields and the keyword, and
+    for each score range, custom-threshold sentiment filter and enriched filter
+    alone and combined with each of them.
+    Exits with status 1 if any query falls back to a SCAN of the news table or
+    walks the publication_date index: LIMIT only stops that walk early when
+    matches are common, so a rare value reads the whole table on every page.
+    FTS5 lookups show up as a SCAN of the news_fts virtual table and are fine.
+    """
+    fields_checked = FILTER_FIELDS + ('keyword',)
+    cases = [('+'.join(fields), {field: 'a,b' for field in fields})
+             for size in range(1, len(fields_checked) + 1) for fields in combinations(fields_checked, size)]
+    extra_cases = [(f'{name}_{bound}', {f'{name}_{bound}': 0.5})
+                   for name in backend.SCORE_FILTERS for bound in ('min', 'max')]
+    extra_cases += [(f'{name}_min+{name}_max', {f'{name}_min': 0.2, f'{name}_max': 0.6})
+                    for name in backend.SCORE_FILTERS]
+    extra_cases += [(f'thresholds+sentiment={labels}', {'sentiment': labels, 'negative_threshold': -0.3,
+                                                        'positive_threshold': 0.3})
+                    for labels in ('positive', 'negative', 'neutral', 'positive,negative')]
+    extra_cases += [(f'enriched={enriched}', {'enriched': enriched}) for enriched in (True, False)]
+    cases += extra_cases
+    cases += [(f'{name}+{field}', dict({field: 'a,b'}, **values))
+              for name, values in extra_cases for field in fields_checked if field not in values]
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'plans.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        articles = make_articles(args.rows)
+        for item in articles[::100]:  # A backlog of articles awaiting deferred enrichment
+            item.update(dict.fromkeys(backend.SCORE_FIELDS), language=backend.PENDING_ENRICHMENT,
+                        sentiment=backend.PENDING_ENRICHMENT)
+        scraper.save_to_database(articles)
+        with scraper.db.writer() as conn:
+            conn.execute('ANALYZE')
+
+        failures = 0
+        for name, values in cases:
+            filters = FilterRequest(**values)
+            cursor = (backend.encode_cursor('rank', [-1.0, args.rows // 2]) if filters.keyword else
+                      backend.encode_cursor('date', ['2024-06-30 12:00:00', args.rows // 2]))
+            for kind, (query, params) in (('count', build_count_query(filters)),
+                                          ('page', build_filter_query(filters, limit=101)),
+                                          ('next', build_filter_query(filters, cursor=cursor, limit=101))):
+                with scraper.db.reader() as conn:
+                    plan = [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {query}', params)]
+                scans = [step for step in plan if step == 'SCAN news' or step.startswith('SCAN news ')
+                         or 'idx_news_publication_date' in step]
+                failures += bool(scans)
+                print(f"{'SCAN' if scans else 'ok':>4}  {kind:>5} {name}: {'; '.join(plan)}")
+        print(f"{failures} filter combinations fall back to a full scan")
+        scraper.close()
+        if failures:
+            sys.exit(1)
+
+
+def bench_pages(args):
+    """Page to the end of rare and common filters and check that page latency stays flat.
+
+    Every --sizes database holds --rare articles from each of two rare countries,
+    in a rare language, spread over the whole date range, so a rare filter has
+    the same matches at every table size. Each filter is paged through with its
+    cursor for up to --pages pages. Exits with status 1 if any page takes longer
+    than --max-ms, which is what a page walking the publication_date index until
+    it finds enough rare rows costs on a large table.
+    """
+    filters = {'country=Rareland': {'country': 'Rareland'},
+               'country=Rareland,Atlantis': {'country': 'Rareland,Atlantis'},
+               'language=xx+enriched': {'language': 'xx', 'enriched': True},
+               'country=UK': {'country': 'UK'},
+               'sentiment=positive,negative': {'sentiment': 'positive,negative'}}
+    slowest = 0.0
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            scraper = NewsScraper(db_name=os.path.join(tmp, 'pages.db'), output_dir=tmp)
+            scraper.scheduler.shutdown(wait=False)
+            step = max(size // (2 * args.rare), 1)
+            for offset in range(0, size, 100000):
+                articles = make_articles(min(100000, size - offset), offset=offset)
+                for i, item in enumerate(articles, offset):
+                    if i % step == 0 and i // step < 2 * args.rare:
+                        item.update(country=('Rareland', 'Atlantis')[i // step % 2], language='xx')
+                scraper.save_to_database(articles)
+            with scraper.db.writer() as conn:
+                conn.execute('ANALYZE')
+
+            for name, values in filters.items():
+                cursor, latencies = None, []
+                for _ in range(args.pages):
+                    start = time.perf_counter()
+                    page = scraper.store.query(FilterRequest(**values), cursor=cursor, limit=args.limit)
+                    latencies.append(time.perf_counter() - start)
+                    cursor = page['next_cursor']
+                    if not cursor:
+                        break
+                slowest = max(slowest, max(latencies))
+                print(f"{size:>8} rows {name:>28}: {len(latencies):>3} pages, first {latencies[0] * 1000:6.1f}ms, "
+                      f"last {latencies[-1] * 1000:6.1f}ms, slowest {max(latencies) * 1000:6.1f}ms")
+            scraper.close()
+    print(f"slowest page {slowest * 1000:.1f}ms (limit {args.max_ms}ms)")
+    if slowest * 1000 > args.max_ms:
+        sys.exit(1)
+
+
+def bench_search(args):
+    """Compare ranked keyword search through news_fts with the old LIKE scan.
+
+    The LIKE baseline returns every match, as /news/filter used to; the FTS query
+    returns the top --limit rows by BM25, which still requires scoring every match.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'search.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        for offset in range(0, args.rows, 100000):
+            scraper.save_to_database(make_articles(min(100000, args.rows - offset), offset=offset))
+        print(f"{args.rows} articles indexed")
+
+        for keyword in args.keywords:
+            query, params = build_filter_query(FilterRequest(keyword=keyword), limit=args.limit)
+            with scraper.db.reader() as conn:
+                start = time.perf_counter()
+                fts_rows = conn.execute(query, params).fetchall()
+                fts = time.perf_counter() - start
+
+                like = keyword.strip('"*')
+                start = time.perf_counter()
+                like_rows = conn.execute('SELECT title FROM news WHERE title LIKE ? OR summary LIKE ?',
+                                         [f'%{like}%', f'%{like}%']).fetchall()
+                scan = time.perf_counter() - start
+            print(f"{keyword!r:>28}: fts top {len(fts_rows):>3} in {fts * 1000:8.1f}ms, "
+                  f"LIKE {len(like_rows):>7} rows in {scan * 1000:8.1f}ms")
+        scraper.close()
+
+
+def bench_api(args):
+    """Compare /news/filter against the previous pandas-based endpoint.
+
+    The legacy endpoint runs the same SQL through pd.read_sql_query and returns
+    DataFrame.to_dict('records') through FastAPI's default JSON encoder, as the API
+    did before; both are driven in-process with TestClient.
+    """
+    import pandas as pd
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, 'api.db')
+        scraper = NewsScraper(db_name=db_name, output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        for offset in range(0, args.rows, 100000):
+            scraper.save_to_database(make_articles(min(100000, args.rows - offset), offset=offset))
+        print(f"{args.rows} articles stored, {args.limit} rows per response")
+
+        legacy = FastAPI()
+        legacy_conn = sqlite3.connect(db_name, check_same_thread=False)
+
+        @legacy.post('/news/filter')
+        def legacy_filter(filters: FilterRequest):
+            query, params = build_filter_query(filters, limit=filters.limit)
+            df = pd.read_sql_query(query, legacy_conn, params=params)
+            # Missing scores come back as NaN, which JSON cannot encode
+            df = df.astype(object).where(df.notna(), None)
+            return {'items': df.drop(columns=['_rowid']).to_dict('records')}
+
+        backend.scraper = scraper
+        payloads = [{'limit': args.limit},
+                    {'country': 'India', 'limit': args.limit},
+                    {'language': 'en', 'sentiment': 'positive', 'limit': args.limit}]
+        for name, app in (('pandas', legacy), ('row+orjson', backend.app)):
+            with TestClient(app) as client:
+                for payload in payloads:
+                    client.post('/news/filter', json=payload).raise_for_status()
+                latencies = []
+                start = time.perf_counter()
+                for i in range(args.requests):
+                    began = time.perf_counter()
+                    response = client.post('/news/filter', json=payloads[i % len(payloads)])
+                    latencies.append(time.perf_counter() - began)
+                    response.raise_for_status()
+                elapsed = time.perf_counter() - start
+            print(f"{name:>12}: {args.requests / elapsed:8.1f} req/s, "
+                  f"p50 {percentile(latencies, 50) * 1000:7.1f}ms, p99 {percentile(latencies, 99) * 1000:7.1f}ms")
+        legacy_conn.close()
+        scraper.close()
+
+
+def serve_app(variant, db_name, port):
+    """Serve the API on a local port from a child process (see bench_load).
+
+    'pool' serves backend.app, whose endpoints await the database thread pool;
+    'inline' serves /news/filter the way it was before, running the query inside
+    the async endpoint on the event loop.
+    """
+    import uvicorn
+    from fastapi import FastAPI
+
+    scraper = NewsScraper(db_name=db_name, output_dir=os.path.dirname(db_name))
+    scraper.scheduler.shutdown(wait=False)
+    backend.scraper = scraper
+    app = backend.app
+    if variant == 'inline':
+        app = FastAPI()
+
+        @app.post('/news/filter')
+        async def filter_news(filters: backend.FilterRequest):
+            return backend.page_response(filters, filters.cursor, filters.limit, filters.include_total)
+
+        @app.get('/news/cache_stats')
+        async def cache_stats():
+            return scraper.store.cache.stats()
+
+    uvicorn.run(app, host='127.0.0.1', port=port, log_level='warning')
+
+
+async def hammer(url, payloads, concurrency, duration):
+    """POST payloads to url from concurrent clients while probing a cheap endpoint.
+
+    Returns:
+        tuple: /news/filter latencies and latencies of /news/cache_stats probes,
+            which touch no database and so measure how long the event loop is blocked.
+    """
+    import httpx
+
+    latencies, probes = [], []
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency + 1)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        async def worker(offset):
+            i = offset
+            while time.perf_counter() < deadline:
+                began = time.perf_counter()
+                response = await client.post('/news/filter', json=payloads[i % len(payloads)])
+                latencies.append(time.perf_counter() - began)
+                response.raise_for_status()
+                i += 1
+
+        async def probe():
+            while time.perf_counter() < deadline:
+                began = time.perf_counter()
+                (await client.get('/news/cache_stats')).raise_for_status()
+                probes.append(time.perf_counter() - began)
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(probe(), *(worker(i) for i in range(concurrency)))
+    return latencies, probes
+
+
+def bench_load(args):
+    """Load-test /news/filter over HTTP with inline vs thread-pool database access.
+
+    Each variant runs under uvicorn in its own process; the client drives it with
+    --concurrency simultaneous requests for --duration seconds per level.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, 'load.db')
+        scraper = NewsScraper(db_name=db_name, output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        for offset in range(0, args.rows, 100000):
+            scraper.save_to_database(make_articles(min(100000, args.rows - offset), offset=offset))
+        print(f"{args.rows} articles stored, {args.limit} rows per response, {os.cpu_count()} CPUs")
+
+        payloads = [{'limit': args.limit},
+                    {'country': 'India,UK', 'limit': args.limit},
+                    {'language': 'en', 'sentiment': 'positive', 'limit': args.limit},
+                    {'keyword': 'climate', 'limit': args.limit},
+                    {'year': '2024', 'source': 'Japan Agency 1', 'include_total': True, 'limit': args.limit}]
+        for variant in args.variants:
+            with socket.socket() as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            server = multiprocessing.get_context('fork').Process(target=serve_app, args=(variant, db_name, port))
+            server.start()
+            try:
+                for _ in range(100):
+                    try:
+                        socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                        break
+                    except OSError:
+                        time.sleep(0.1)
+                url = f'http://127.0.0.1:{port}'
+                for concurrency in args.concurrency:
+                    latencies, probes = asyncio.run(hammer(url, payloads, concurrency, args.duration))
+                    print(f"{variant:>7} c={concurrency:<3}: {len(latencies) / args.duration:7.1f} req/s, "
+                          f"p50 {percentile(latencies, 50) * 1000:7.1f}ms, p99 {percentile(latencies, 99) * 1000:7.1f}ms, "
+                          f"cheap endpoint p99 {percentile(probes, 99) * 1000:7.1f}ms")
+            finally:
+                server.terminate()
+                server.join()
+        scraper.close()
+
+
+def bench_storage(args):
+    """Run the same query suite against the SQLite and DuckDB storage backends.
+
+    The store cache is bumped before every run, so facets and aggregates are
+    computed from the data rather than served from memory.
+    """
+    F = FilterRequest
+    suite = [
+        ('first page', lambda store: store.query(F())),
+        ('filtered page', lambda store: store.query(F(country='India,UK', language='en'))),
+        ('keyword page', lambda store: store.query(F(keyword='climate summit'))),
+        ('filtered count', lambda store: store.query(F(year='2024', sentiment='positive'), include_total=True)),
+        ('facets', lambda store: store.facets(F(country='Japan'))),
+        ('stats by country/lang/sentiment', lambda store: store.aggregate(F(year='2024'), ['country', 'language', 'sentiment'])),
+        ('daily series by sentiment', lambda store: store.timeseries(F(), 'day', 'sentiment')),
+        ('weekly series, one country', lambda store: store.timeseries(F(country='India'), 'week')),
+        ('hourly series for a month', lambda store: store.timeseries(F(), 'hour', 'country', datetime(2024, 3, 1),
+                                                                     datetime(2024, 3, 31, 23, 59, 59))),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        stores, scrapers = {}, []
+        for storage in args.backends:
+            scraper = NewsScraper(db_name=os.path.join(tmp, f'{storage}.db'), output_dir=tmp, storage=storage)
+            scraper.scheduler.shutdown(wait=False)
+            start = time.perf_counter()
+            for offset in range(0, args.rows, 100000):
+                scraper.store.insert_batch(make_articles(min(100000, args.rows - offset), offset=offset), 10000)
+            print(f"{storage}: {args.rows} articles inserted in {time.perf_counter() - start:.1f}s")
+            stores[storage] = scraper.store
+            scrapers.append(scraper)
+
+        print(f"{'query':>32}" + ''.join(f"{storage:>12}" for storage in stores))
+        for name, run in suite:
+            timings = []
+            for store in stores.values():
+                runs = []
+                for _ in range(args.repeat):
+                    store.cache.bump()
+                    start = time.perf_counter()
+                    run(store)
+                    runs.append(time.perf_counter() - start)
+                timings.append(sorted(runs)[len(runs) // 2])
+            print(f"{name:>32}" + ''.join(f"{timing * 1000:10.1f}ms" for timing in timings))
+        for scraper in scrapers:
+            scraper.close()
+
+
+def scrape_peak_memory(rss_feeds, result):
+    """Run one full scrape in a fresh process and report how much its peak RSS grew.
+
+    Args:
+        rss_feeds (dict): Feeds to scrape.
+        result (multiprocessing.Queue): Receives (articles saved, peak RSS growth in KiB, seconds).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'pipeline.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        scraper.detect_language('Load the language profiles before the baseline')
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        run = scraper.scrape_all_feeds(rss_feeds=rss_feeds, historical_urls={})
+        elapsed = time.perf_counter() - start
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result.put((run.stats['articles_inserted'], peak - baseline, elapsed))
+        scraper.close()
+
+
+def bench_pipeline(args):
+    """Measure peak memory of a full scrape as the number of feeds grows.
+
+    Every scrape runs in a freshly spawned process, so each peak is its own.
+    Part of the growth is expected to scale with the corpus rather than the
+    run: the seen-item index keeps one key per stored article, and SQLite's
+    page cache and memory map fill up to their configured limits.
+    """
+    servers = [start_feed_server(build_rss(args.items), 0) for _ in range(args.hosts)]
+    context = multiprocessing.get_context('spawn')
+    try:
+        for feeds in args.feeds:
+            rss_feeds = {'Benchmark': [
+                (f'Feed {i}', f'http://127.0.0.1:{servers[i % args.hosts].server_address[1]}/feed/{i}')
+                for i in range(feeds)
+            ]}
+            result = context.Queue()
+            process = context.Process(target=scrape_peak_memory, args=(rss_feeds, result))
+            process.start()
+            articles, growth, elapsed = result.get()
+            process.join()
+            print(f"{feeds:>6} feeds: {articles:>7} articles saved in {elapsed:6.1f}s, "
+                  f"peak RSS +{growth / 1024:.1f} MiB")
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+def bench_archive(args):
+    """Grow a corpus run by run, exporting each run incrementally, then query the archive.
+
+    Each simulated run publishes its articles over the previous day, like a
+    4-hourly scrape, and appends them to the CSV, JSON Lines and Parquet exports.
+    Per-run export times are compared with rewriting the whole corpus as CSV
+    (what every run used to cost), and filtered archive reads with a full read,
+    on the archive (closed days merged) and on a copy that never merges its parts.
+    """
+    import pandas as pd
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'archive.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        # No day closes within the simulated runs, so every export's parts stay
+        unmerged = ParquetArchive(os.path.join(tmp, 'unmerged'), open_days=args.runs)
+        exports = {'csv': scraper.csv_export, 'jsonl': scraper.json_export, 'parquet': scraper.archive,
+                   'parquet unmerged': unmerged}
+        export_times = {name: [] for name in exports}
+        for run in range(args.runs):
+            articles = make_articles(args.per_run, offset=run * args.per_run)
+            day_start = 1704067200 + run * 4 * 3600  # Runs every 4 hours from 2024-01-01
+            for item in articles:
+                published = time.gmtime(day_start - random.randrange(86400))
+                item['publication_date'] = time.strftime('%Y-%m-%d %H:%M:%S', published)
+            scraper.save_to_database(articles)
+            for name, export in exports.items():
+                start = time.perf_counter()
+                export.export(scraper.store)
+                export_times[name].append(time.perf_counter() - start)
+        print(f"{args.runs} runs x {args.per_run} articles")
+        for archive in (scraper.archive, unmerged):
+            files = sum(len(names) for _, _, names in os.walk(archive.path)) - 1
+            print(f"{os.path.basename(archive.path):>16}: {files} Parquet files")
+        for name, times in export_times.items():
+            print(f"{name:>16} export per run: mean {sum(times) / len(times) * 1000:.1f}ms, "
+                  f"last {times[-1] * 1000:.1f}ms")
+
+        start = time.perf_counter()
+        corpus = [article for batch in scraper.store.iter_new() for _, article in batch]
+        pd.DataFrame(corpus).to_csv(os.path.join(tmp, 'corpus.csv'), index=False)
+        print(f"full CSV rewrite of the corpus: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        mid = time.strftime('%Y-%m-%d', time.gmtime(1704067200 + args.runs * 2 * 3600))
+        queries = [
+            ('full read', {}),
+            ('one country', {'filters': FilterRequest(country='India')}),
+            ('one day', {'start': mid, 'end': mid}),
+            ('one day, one country, en', {'filters': FilterRequest(country='India', language='en'),
+                                          'start': mid, 'end': mid}),
+        ]
+        for archive in (scraper.archive, unmerged):
+            archive.read(columns=['id'])  # Warm the page cache, so neither layout pays for the first read
+        for name, kwargs in queries:
+            timings, rows = [], []
+            for archive in (scraper.archive, unmerged):
+                start = time.perf_counter()
+                rows.append(archive.read(**kwargs).num_rows)
+                timings.append(time.perf_counter() - start)
+            mismatch = '' if rows[0] == rows[1] else f'  MISMATCH: {rows[1]} rows unmerged'
+            print(f"{name:>28}: {rows[0]:8d} rows in {timings[0] * 1000:8.1f}ms merged, "
+                  f"{timings[1] * 1000:8.1f}ms unmerged{mismatch}")
+        scraper.close()
+
+
+def bench_langdetect(args):
+    """Batched language detection with per-source priors vs one detect() per article.
+
+    Streams of articles per source are built from a CSV export (each text made
+    unique so in-batch deduplication does not flatter the batched path) and
+    interleaved. The per-call path labels every article; the batched path runs
+    on the same stream in pipeline-sized batches and is scored against it.
+    """
+    import pandas as pd
+    from collections import Counter
+    corpus = pd.read_csv(args.csv).fillna('')
+    rng = random.Random(0)
+    stream = []
+    for source, group in corpus.groupby('source'):
+        texts = (group['title'] + ' ' + group['summary']).tolist()
+        stream.extend((source, f"{rng.choice(texts)} {i}") for i in range(args.per_source))
+    rng.shuffle(stream)
+    sources = [source for source, _ in stream]
+    texts = [text for _, text in stream]
+    print(f"{len(stream)} articles from {corpus['source'].nunique()} sources")
+
+    detector = backend.LanguageDetector()
+    start = time.perf_counter()
+    reference = [detector.detect(text) for text in texts]
+    per_call = time.perf_counter() - start
+
+    detector = backend.LanguageDetector()
+    stats = {}
+    start = time.perf_counter()
+    batched = []
+    for i in range(0, len(texts), args.batch_size):
+        batched.extend(detector.detect_batch(texts[i:i + args.batch_size], sources[i:i + args.batch_size], stats))
+    elapsed = time.perf_counter() - start
+
+    print(f"{'per-call':>9}: {len(texts) / per_call:8.0f} articles/s")
+    print(f"{'batched':>9}: {len(texts) / elapsed:8.0f} articles/s ({per_call / elapsed:.1f}x), "
+          f"{stats.get('detected', 0)} detected, {stats.get('prior', 0)} from a prior, "
+          f"{stats.get('short', 0)} too short")
+    agree = Counter(source for source, a, b in zip(sources, reference, batched) if a == b)
+    total = Counter(sources)
+    print(f"agreement with per-call: {sum(agree.values()) / len(stream) * 100:.2f}%")
+    for source in sorted(total):
+        print(f"  {source:>28}: {agree[source] / total[source] * 100:6.2f}% "
+              f"prior {detector.prior(source) or '-'}")
+
+
+def bench_enrich(args):
+    """Enrichment throughput with language detection and sentiment in worker processes.
+
+    Uses the same per-source streams as the langdetect benchmark and enriches them
+    in pipeline-sized batches with each worker count, checking that every count
+    produces the labels of the inline run.
+    """
+    import pandas as pd
+    import pickle
+    corpus = pd.read_csv(args.csv).fillna('')
+    rng = random.Random(0)
+    stream = []
+    for source, group in corpus.groupby('source'):
+        rows = group[['title', 'summary', 'country']].values.tolist()
+        for i in range(args.per_source):
+            title, summary, country = rng.choice(rows)
+            stream.append({'title': f"{title} {i}", 'summary': summary, 'source': source, 'country': country})
+    rng.shuffle(stream)
+    payload = ([item['title'] + ' ' + item['summary'] for item in stream[:backend.ENRICH_CHUNK_SIZE]],
+               [item['summary'] for item in stream[:backend.ENRICH_CHUNK_SIZE]])
+    start = time.perf_counter()
+    size = len(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"{len(stream)} articles, {os.cpu_count()} CPUs; a {backend.ENRICH_CHUNK_SIZE}-article chunk pickles "
+          f"to {size / 1024:.0f} KiB in {(time.perf_counter() - start) * 1000:.2f}ms")
+
+    reference = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in args.workers:
+            scraper = NewsScraper(db_name=os.path.join(tmp, f'enrich{workers}.db'), output_dir=tmp,
+                                  enrich_workers=workers)
+            scraper.scheduler.shutdown(wait=False)
+            scraper.start_enrich_pool()  # Fork the workers before timing
+            articles = [dict(item) for item in stream]
+            start = time.perf_counter()
+            for i in range(0, len(articles), args.batch_size):
+                scraper.enrich_articles(articles[i:i + args.batch_size])
+            elapsed = time.perf_counter() - start
+            scraper.close()
+            labels = [(item['language'], item['sentiment']) for item in articles]
+            reference = reference or labels
+            same = sum(a == b for a, b in zip(reference, labels)) / len(labels) * 100
+            print(f"{workers:3d} workers: {len(articles) / elapsed:8.0f} articles/s, "
+                  f"labels matching the first run {same:.2f}%")
+
+
+def bench_cache(args):
+    """Enrichment time per run with and without the enrichment cache.
+
+    Each simulated run carries --repeat-share of stories already seen in earlier
+    runs or other feeds (syndicated wire copy, live-blog updates) under new URLs,
+    so the seen-item index does not catch them. The uncached run enriches the
+    same articles with every hash lookup missing.
+    """
+    rng = random.Random(0)
+    previous = []
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'cache.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        uncached = NewsScraper(db_name=os.path.join(tmp, 'uncached.db'), output_dir=tmp)
+        uncached.scheduler.shutdown(wait=False)
+        uncached.enrichment_cache.get_many = lambda kind, texts, stats=None: {}
+        for number in range(args.runs):
+            repeats = int(args.per_run * args.repeat_share) if previous else 0
+            articles = [dict(rng.choice(previous), url=f'https://wire.example/{number}/{i}') for i in range(repeats)]
+            articles += make_articles(args.per_run - repeats, offset=number * args.per_run, seed=number)
+            for item in articles:
+                item.pop('language', None)
+                item.pop('sentiment', None)
+            previous.extend(dict(item) for item in articles)
+            timings = []
+            for target in (uncached, scraper):
+                run = backend.ScrapeRun()
+                batch = [dict(item) for item in articles]
+                start = time.perf_counter()
+                for i in range(0, len(batch), 1000):
+                    target.enrich_articles(batch[i:i + 1000], run)
+                timings.append(time.perf_counter() - start)
+            progress = run.progress()
+            print(f"run {number + 1:2d}: uncached {timings[0] * 1000:7.0f}ms, cached {timings[1] * 1000:7.0f}ms, "
+                  f"hit rate language {progress['language_cache_hit_rate']}, "
+                  f"sentiment {progress['vader_cache_hit_rate']}")
+        print(f"{scraper.enrichment_cache.rows} cache rows")
+        scraper.close()
+        uncached.close()
+
+
+def bench_thresholds(args):
+    """Re-label the corpus under new sentiment thresholds from the stored scores vs re-running VADER.
+
+    Counts every label under each threshold pair with indexed /news/filter queries
+    (include_total) and compares with scoring the summaries again, which is what
+    a threshold change cost while only the labels were stored (extrapolated from
+    --sample summaries).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = NewsScraper(db_name=os.path.join(tmp, 'thresholds.db'), output_dir=tmp)
+        scraper.scheduler.shutdown(wait=False)
+        articles = make_articles(args.rows)
+        scraper.save_to_database(articles)
+        with scraper.db.writer() as conn:
+            conn.execute('ANALYZE')
+
+        sample = [item['summary'] for item in articles[:args.sample]]
+        start = time.perf_counter()
+        for summary in sample:
+            scraper.analyze_sentiment(summary)
+        rescore = (time.perf_counter() - start) / len(sample) * args.rows
+        print(f"{args.rows} articles; re-running VADER over every summary: ~{rescore:.1f}s")
+
+        for negative, positive in args.thresholds or [(-0.05, 0.05), (-0.3, 0.3), (-0.6, 0.5)]:
+            start = time.perf_counter()
+            counts = {label: scraper.store.query(FilterRequest(sentiment=label, negative_threshold=negative,
+                                                               positive_threshold=positive),
+                                                 limit=1, include_total=True)['total']
+                      for label in ('positive', 'neutral', 'negative')}
+            elapsed = time.perf_counter() - start
+            print(f"thresholds ({negative:+.2f}, {positive:+.2f}): {counts} in {elapsed * 1000:.1f}ms")
+        scraper.close()
+
+
+def bench_deferred(args):
+    """Ingest time of inline vs deferred enrichment, and how long the backfill takes to catch up.
+
+    Parsed entries go through an ArticlePipeline as fetch workers would hand them
+    over, one feed of --per-feed entries at a time. Ingest ends when the last
+    article is stored; in deferred mode the backfill then enriches them.
+    """
+    feeds = []
+    for offset in range(0, args.articles, args.per_feed):
+        entries = make_articles(min(args.per_feed, args.articles - offset), offset=offset)
+        for item in entries:
+            for field in ('language', 'sentiment') + backend.SCORE_FIELDS:
+                del item[field]
+        feeds.append(entries)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            scraper = NewsScraper(db_name=os.path.join(tmp, f'{mode}.db'), output_dir=tmp, enrichment=mode)
+            scraper.scheduler.shutdown(wait=False)
+            scraper.detect_language('Load the language profiles before timing')
+            scraper.start_enrich_pool()
+            run = backend.ScrapeRun()
+            pipeline = backend.ArticlePipeline(scraper, run, batch_size=args.batch_size)
+            start = time.perf_counter()
+            pipeline.start()
+            for entries in feeds:
+                pipeline.put([dict(item) for item in entries])
+            pipeline.close()
+            ingest = time.perf_counter() - start
+            line = (f"{mode:>8}: {run.stats['articles_inserted']} articles stored in {ingest:6.2f}s "
+                    f"({run.stats['articles_inserted'] / ingest:7.0f}/s)")
+            if mode == 'deferred':
+                while scraper.store.first_pending_id() is not None:
+                    time.sleep(0.05)
+                line += f", all enriched after {time.perf_counter() - start:6.2f}s"
+            scraper.close()
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    fetch = subparsers.add_parser('fetch', help='async vs threaded feed fetching')
+    fetch.add_argument('--feeds', type=int, default=500, help='number of feeds to fetch')
+    fetch.add_argument('--hosts', type=int, default=10, help='number of distinct local hosts')
+    fetch.add_argument('--items', type=int, default=5, help='items per feed')
+    fetch.add_argument('--delay', type=float, default=0.2, help='response delay of a normal host (s)')
+    fetch.add_argument('--slow-delay', type=float, default=2.0, help='response delay of the slow host (s)')
+    fetch.add_argument('--max-in-flight', type=int, default=100)
+    fetch.add_argument('--per-host-limit', type=int, default=10)
+    fetch.add_argument('--modes', nargs='+', default=['async', 'threaded'])
+    fetch.set_defaults(func=bench_fetch)
+
+    slow_host = subparsers.add_parser('slowhost', help='fails if a slow host delays feeds on fast hosts')
+    slow_host.add_argument('--slow-feeds', type=int, default=20, help='feeds on the slow host, requested first')
+    slow_host.add_argument('--fast-hosts', type=int, default=5, help='number of fast hosts')
+    slow_host.add_argument('--feeds-per-host', type=int, default=2, help='feeds per fast host')
+    slow_host.add_argument('--slow-delay', type=float, default=1.0, help='response delay of the slow host (s)')
+    slow_host.add_argument('--fast-delay', type=float, default=0.05, help='response delay of a fast host (s)')
+    slow_host.add_argument('--tolerance', type=float, default=0.5, help='allowed delay of a fast host (s)')
+    slow_host.add_argument('--max-in-flight', type=int, default=8)
+    slow_host.add_argument('--per-host-limit', type=int, default=4)
+    slow_host.set_defaults(func=bench_slow_host)
+
+    insert = subparsers.add_parser('insert', help='bulk vs per-row database inserts')
+    insert.add_argument('--rows', type=int, nargs='+', default=[1000, 100000, 1000000])
+    insert.add_argument('--batch-size', type=int, default=1000)
+    insert.add_argument('--per-row-limit', type=int, default=1000000,
+                        help='skip the per-row baseline above this many rows')
+    insert.set_defaults(func=bench_insert)
+
+    concurrency = subparsers.add_parser('concurrency', help='read latency while a scrape writes')
+    concurrency.add_argument('--rows', type=int, default=100000, help='rows in the database before the scrape')
+    concurrency.add_argument('--batches', type=int, default=10, help='saves performed by the scrape')
+    concurrency.add_argument('--batch-rows', type=int, default=20000, help='articles per save')
+    concurrency.add_argument('--readers', type=int, default=4, help='concurrent reader threads')
+    concurrency.add_argument('--think-time', type=float, default=0.01, help='pause between reads (s)')
+    concurrency.set_defaults(func=bench_concurrency)
+
+    plans = subparsers.add_parser('plans', help='assert every /news/filter combination uses an index')
+    plans.add_argument('--rows', type=int, default=10000, help='rows to analyze the planner statistics on')
+    plans.set_defaults(func=bench_plans)
+
+    pages = subparsers.add_parser('pages', help='fails if deep pages of rare filters get slower with table size')
+    pages.add_argument('--sizes', type=int, nargs='+', default=[20000, 300000])
+    pages.add_argument('--rare', type=int, default=500, help='articles per rare country, at every size')
+    pages.add_argument('--pages', type=int, default=50, help='most pages read per filter')
+    pages.add_argument('--limit', type=int, default=100, help='rows per page')
+    pages.add_argument('--max-ms', type=float, default=50.0, help='slowest page allowed')
+    pages.set_defaults(func=bench_pages)
+
+    search = subparsers.add_parser('search', help='FTS5 keyword search vs LIKE')
+    search.add_argument('--rows', type=int, default=1000000)
+    search.add_argument('--limit', type=int, default=50, help='rows returned per query')
+    search.add_argument('--keywords', nargs='+',
+                        default=['ceasefire', '"climate summit"', 'semicon*', 'drought tariff', 'headline 4242'])
+    search.set_defaults(func=bench_search)
+
+    api = subparsers.add_parser('api', help='/news/filter throughput vs the pandas endpoint')
+    api.add_argument('--rows', type=int, default=100000)
+    api.add_argument('--limit', type=int, default=1000, help='page size of each request')
+    api.add_argument('--requests', type=int, default=300)
+    api.set_defaults(func=bench_api)
+
+    load = subparsers.add_parser('load', help='concurrent HTTP load on /news/filter')
+    load.add_argument('--rows', type=int, default=100000)
+    load.add_argument('--limit', type=int, default=100, help='page size of each request')
+    load.add_argument('--concurrency', type=int, nargs='+', default=[1, 50])
+    load.add_argument('--duration', type=float, default=10, help='seconds per concurrency level')
+    load.add_argument('--variants', nargs='+', default=['inline', 'pool'])
+    load.set_defaults(func=bench_load)
+
+    storage = subparsers.add_parser('storage', help='SQLite vs DuckDB storage backends on one query suite')
+    storage.add_argument('--rows', type=int, default=1000000)
+    storage.add_argument('--repeat', type=int, default=3, help='runs per query (median reported)')
+    storage.add_argument('--backends', nargs='+', default=['sqlite', 'duckdb'])
+    storage.set_defaults(func=bench_storage)
+
+    pipeline = subparsers.add_parser('pipeline', help='peak memory of a full scrape as the feed count grows')
+    pipeline.add_argument('--feeds', type=int, nargs='+', default=[30, 300, 3000])
+    pipeline.add_argument('--items', type=int, default=10, help='items per feed')
+    pipeline.add_argument('--hosts', type=int, default=10, help='number of distinct local hosts')
+    pipeline.set_defaults(func=bench_pipeline)
+
+    archive = subparsers.add_parser('archive', help='incremental CSV/JSON Lines/Parquet exports and filtered archive reads')
+    archive.add_argument('--runs', type=int, default=180, help='simulated 4-hourly scrape runs')
+    archive.add_argument('--per-run', type=int, default=2000, help='new articles per run')
+    archive.set_defaults(func=bench_archive)
+
+    langdetect = subparsers.add_parser('langdetect', help='batched language detection with source priors vs per-call')
+    langdetect.add_argument('--csv', default=os.path.join('downloads', 'news_data.csv'),
+                            help='CSV export to take titles and summaries from')
+    langdetect.add_argument('--per-source', type=int, default=2000, help='articles streamed per source')
+    langdetect.add_argument('--batch-size', type=int, default=1000, help='articles per detect_batch call')
+    langdetect.set_defaults(func=bench_langdetect)
+
+    enrich = subparsers.add_parser('enrich', help='enrichment throughput by worker process count')
+    enrich.add_argument('--csv', default=os.path.join('downloads', 'news_data.csv'),
+                        help='CSV export to take titles and summaries from')
+    enrich.add_argument('--per-source', type=int, default=2000, help='articles streamed per source')
+    enrich.add_argument('--batch-size', type=int, default=1000, help='articles per enrich_articles call')
+    enrich.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    enrich.set_defaults(func=bench_enrich)
+
+    cache = subparsers.add_parser('cache', help='enrichment time per run with and without the enrichment cache')
+    cache.add_argument('--runs', type=int, default=6, help='simulated scrape runs')
+    cache.add_argument('--per-run', type=int, default=2000, help='articles enriched per run')
+    cache.add_argument('--repeat-share', type=float, default=0.3, help='share of each run repeating earlier text')
+    cache.set_defaults(func=bench_cache)
+
+    thresholds = subparsers.add_parser('thresholds', help='re-label sentiment from stored scores vs re-running VADER')
+    thresholds.add_argument('--rows', type=int, default=1000000)
+    thresholds.add_argument('--sample', type=int, default=5000, help='summaries scored to estimate a VADER pass')
+    thresholds.add_argument('--thresholds', type=float, nargs=2, action='append', metavar=('NEGATIVE', 'POSITIVE'),
+                            help='threshold pair to count labels under (repeatable)')
+    thresholds.set_defaults(func=bench_thresholds)
+
+    deferred = subparsers.add_parser('deferred', help='ingest time of inline vs deferred enrichment')
+    deferred.add_argument('--articles', type=int, default=20000)
+    deferred.add_argument('--per-feed', type=int, default=20, help='entries handed over per feed')
+    deferred.add_argument('--batch-size', type=int, default=1000, help='pipeline batch size')
+    deferred.add_argument('--modes', nargs='+', default=['inline', 'deferred'])
+    deferred.set_defaults(func=bench_deferred)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
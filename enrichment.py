@@ -0,0 +1,78 @@
+"""Language detection and sentiment scoring run by the enrichment worker processes.
+
+Importing this module has no side effects: it builds no scraper, scheduler,
+thread or database connection. That is why the workers are started with the
+'spawn' method (see NewsScraper.start_enrich_pool) and only load this module,
+instead of being forked from a process that already runs threads.
+"""
+import logging
+
+from langdetect import DetectorFactory
+from langdetect.detector_factory import PROFILES_DIRECTORY
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+_enrich_worker = {}  # Analyzer and detector factory of an enrichment worker process, see init_enrich_worker
+
+def detect_language(factory, text):
+    """Detect the language of one text.
+
+    Args:
+        factory (DetectorFactory): langdetect factory with its profiles loaded.
+        text (str): Text to analyze.
+
+    Returns:
+        str: Language code (e.g., 'en', 'hi') or 'unknown' if detection fails.
+    """
+    try:
+        if len(text.strip()) < 10:
+            return 'unknown'
+        detector = factory.create()
+        detector.append(text[:1000])  # Limit to first 1000 characters
+        return detector.detect() or 'unknown'
+    except Exception as e:
+        logging.error(f"Language detection error: {str(e)}")
+        return 'unknown'
+
+def sentiment_scores(analyzer, text):
+    """Score the sentiment of a text with a VADER analyzer.
+
+    Args:
+        analyzer (SentimentIntensityAnalyzer): Analyzer to score the text with.
+        text (str): Text to analyze for sentiment.
+
+    Returns:
+        tuple: Compound, positive, negative and neutral scores (SCORE_FIELDS order), or
+            None if the analysis fails.
+    """
+    try:
+        scores = analyzer.polarity_scores(text)
+        return scores['compound'], scores['pos'], scores['neg'], scores['neu']
+    except Exception as e:
+        logging.error(f"Sentiment analysis error: {str(e)}")
+        return None
+
+def init_enrich_worker():
+    """Load the VADER lexicon and langdetect profiles once per enrichment worker process."""
+    DetectorFactory.seed = 0  # Same seed as the scraper process, so results do not depend on where they ran
+    factory = DetectorFactory()
+    factory.load_profile(PROFILES_DIRECTORY)
+    _enrich_worker['analyzer'] = SentimentIntensityAnalyzer()
+    _enrich_worker['factory'] = factory
+
+def enrich_chunk(texts, summaries):
+    """Detect languages and score sentiments in an enrichment worker process.
+
+    Only the strings travel to the worker and only language codes and score
+    tuples travel back, so a chunk costs little to pickle compared with the work
+    done on it.
+
+    Args:
+        texts (list): Texts to detect the language of.
+        summaries (list): Summaries to score the sentiment of.
+
+    Returns:
+        tuple: Language code per text and score tuple (or None) per summary.
+    """
+    factory, analyzer = _enrich_worker['factory'], _enrich_worker['analyzer']
+    return ([detect_language(factory, text) for text in texts],
+            [sentiment_scores(analyzer, summary) for summary in summaries])
@@ -16,6 +16,9 @@ st.set_page_config(
 # API base URL
 API_URL = "http://localhost:8000"
 
+# Number of articles requested per page from the paginated /news/filter endpoint
+PAGE_SIZE = 100
+
 # Language code to name mapping
 LANGUAGE_MAP = {
     'en': 'English',
@@ -61,6 +64,15 @@ def post_data(endpoint, data):
         st.error(f"Error posting to {endpoint}: {e}. Is the backend running at {API_URL}?")
         return []
 
+def load_more_articles():
+    """Append the next page of the active filter results to the session dataset."""
+    page = post_data("news/filter", {**st.session_state.filters, 'limit': PAGE_SIZE,
+                                     'cursor': st.session_state.next_cursor})
+    if page:
+        st.session_state.data_df = pd.concat([st.session_state.data_df, pd.DataFrame(page['items'])],
+                                             ignore_index=True)
+        st.session_state.next_cursor = page['next_cursor']
+
 def main():
     st.title("📰 News Explorer")
     st.markdown("Explore news articles from different countries collected from various sources.")
@@ -68,11 +80,13 @@ def main():
     # Sidebar filters
     with st.sidebar:
         st.header("Filters")
-        countries = sorted(fetch_data("news/countries"))
-        sources = sorted(fetch_data("news/sources"))
-        languages = sorted(fetch_data("news/languages"))
+        # One request returns every facet with its article counts
+        facets = (fetch_data("news/facets") or {}).get('facets', {})
+        countries = sorted(item['value'] for item in facets.get('country', []))
+        sources = sorted(item['value'] for item in facets.get('source', []))
+        languages = sorted(item['value'] for item in facets.get('language', []))
         sentiments = ['positive', 'negative', 'neutral', 'unknown']
-        years = sorted(fetch_data("news/years"), reverse=True)
+        years = sorted((item['value'] for item in facets.get('year', []) if item['value']), reverse=True)
 
         selected_countries = st.multiselect(
             "Select Countries",
@@ -107,7 +121,7 @@ def main():
         keyword = st.text_input(
             "Keyword (in title or summary)",
             "",
-            help="Search in titles or summaries"
+            help='Search in titles or summaries. All words must match; use "quotes" for phrases and word* for prefixes'
         )
         apply_filters = st.button("Apply Filters")
 
@@ -115,56 +129,79 @@ def main():
     if 'active_data' not in st.session_state:
         st.session_state.active_data = None
         st.session_state.data_df = pd.DataFrame()
+        st.session_state.filters = None
+        st.session_state.next_cursor = None
+        st.session_state.total = 0
 
     # Main content
     st.subheader("News Articles")
-    if apply_filters or not (selected_countries or selected_sources or selected_languages or selected_sentiments or selected_years or keyword):
-        # Prepare filter params, converting language names back to codes
-        filters = {
-            'country': ','.join(selected_countries) if selected_countries else None,
-            'source': ','.join(selected_sources) if selected_sources else None,
-            'language': ','.join([REVERSE_LANGUAGE_MAP.get(lang, lang) for lang in selected_languages]) if selected_languages else None,
-            'sentiment': ','.join(selected_sentiments) if selected_sentiments else None,
-            'year': selected_years.strip() if selected_years.strip() else None,
-            'keyword': keyword.strip() if keyword.strip() else None
-        }
-        news_data = post_data("news/filter", filters)
-        filtered_df = pd.DataFrame(news_data)
+    # Prepare filter params, converting language names back to codes
+    filters = {
+        'country': ','.join(selected_countries) if selected_countries else None,
+        'source': ','.join(selected_sources) if selected_sources else None,
+        'language': ','.join([REVERSE_LANGUAGE_MAP.get(lang, lang) for lang in selected_languages]) if selected_languages else None,
+        'sentiment': ','.join(selected_sentiments) if selected_sentiments else None,
+        'year': selected_years.strip() if selected_years.strip() else None,
+        'keyword': keyword.strip() if keyword.strip() else None
+    }
+    no_filters = not (selected_countries or selected_sources or selected_languages or selected_sentiments or selected_years or keyword)
+    # Fetch the first page when filters are applied; later pages are appended by "Load more"
+    if apply_filters or (no_filters and st.session_state.filters != filters):
+        page = post_data("news/filter", {**filters, 'limit': PAGE_SIZE, 'include_total': True})
+        filtered_df = pd.DataFrame(page['items'] if page else [])
         if not filtered_df.empty:
             st.session_state.active_data = 'filtered'
             st.session_state.data_df = filtered_df
-            st.write(f"Total articles found: {len(filtered_df)}")
-            # Display as expandable cards
-            for _, row in filtered_df.iterrows():
-                with st.expander(f"{row.get('title', 'No title')}"):
-                    url = row.get('url', 'No URL available')
-                    st.markdown(f"**Link to full Article:** [{'Click here' if url != 'No URL available' else url}]({url})")
-                    st.markdown(f"**News Title:** {row.get('title', 'N/A')}")
-                    st.markdown(f"**Publication Date:** {row.get('publication_date', 'N/A')}")
-                    st.markdown(f"**Source (News Agency):** {row.get('source', 'N/A')}")
-                    st.markdown(f"**Country:** {row.get('country', 'N/A')}")
-                    st.markdown(f"**Language:** {LANGUAGE_MAP.get(row.get('language', 'N/A'), row.get('language', 'N/A'))}")
-                    st.markdown(f"**Sentiment:** {row.get('sentiment', 'N/A')}")
-                    st.markdown(f"**Summary:** {row.get('summary', 'No summary available')}")
+            st.session_state.filters = filters
+            st.session_state.next_cursor = page['next_cursor']
+            st.session_state.total = page['total']
         else:
             st.warning("No articles found with the current filters")
             st.session_state.active_data = None
             st.session_state.data_df = pd.DataFrame()
+            st.session_state.filters = None
+            st.session_state.next_cursor = None
 
-    # Visualizations
+    if st.session_state.active_data == 'filtered':
+        filtered_df = st.session_state.data_df
+        st.write(f"Total articles found: {st.session_state.total} (showing {len(filtered_df)})")
+        # Display as expandable cards
+        for _, row in filtered_df.iterrows():
+            with st.expander(f"{row.get('title', 'No title')}"):
+                url = row.get('url', 'No URL available')
+                st.markdown(f"**Link to full Article:** [{'Click here' if url != 'No URL available' else url}]({url})")
+                st.markdown(f"**News Title:** {row.get('title', 'N/A')}")
+                st.markdown(f"**Publication Date:** {row.get('publication_date', 'N/A')}")
+                st.markdown(f"**Source (News Agency):** {row.get('source', 'N/A')}")
+                st.markdown(f"**Country:** {row.get('country', 'N/A')}")
+                st.markdown(f"**Language:** {LANGUAGE_MAP.get(row.get('language', 'N/A'), row.get('language', 'N/A'))}")
+                st.markdown(f"**Sentiment:** {row.get('sentiment', 'N/A')}")
+                if row.get('snippet'):
+                    # Keyword searches return the best-matching passage with matches in bold
+                    st.markdown(f"**Keyword Match:** {row['snippet']}")
+                st.markdown(f"**Summary:** {row.get('summary', 'No summary available')}")
+        if st.session_state.next_cursor:
+            st.button("Load more articles", on_click=load_more_articles)
+
+    # Visualizations, counted by the backend over every matching article (not just the loaded pages)
     st.subheader("Visualizations")
+    stats = None
+    if st.session_state.active_data == 'filtered':
+        # Articles still awaiting deferred enrichment have no language or sentiment to chart yet
+        params = {**{key: value for key, value in st.session_state.filters.items() if value}, 'enriched': 'true'}
+        stats = fetch_data("news/stats", params={**params, 'by': ['country', 'language', 'sentiment']})
     col1, col2, col3 = st.columns(3)
     with col1:
-        if not st.session_state.data_df.empty and st.session_state.active_data == 'filtered':
-            country_counts = st.session_state.data_df['country'].value_counts().reset_index()
+        if stats and stats['by']['country']:
+            country_counts = pd.DataFrame(stats['by']['country'])
             country_counts.columns = ['Country', 'Count']
             fig = px.bar(country_counts, x='Country', y='Count', title='Articles by Country')
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.write("No data for Articles by Country")
     with col2:
-        if not st.session_state.data_df.empty and st.session_state.active_data == 'filtered':
-            language_counts = st.session_state.data_df['language'].value_counts().reset_index()
+        if stats and stats['by']['language']:
+            language_counts = pd.DataFrame(stats['by']['language'])
             language_counts.columns = ['Language', 'Count']
             # Map language codes to names for visualization
             language_counts['Language'] = language_counts['Language'].map(lambda x: LANGUAGE_MAP.get(x, x))
@@ -173,13 +210,22 @@ def main():
         else:
             st.write("No data for Articles by Language")
     with col3:
-        if not st.session_state.data_df.empty and st.session_state.active_data == 'filtered':
-            sentiment_counts = st.session_state.data_df['sentiment'].value_counts().reset_index()
+        if stats and stats['by']['sentiment']:
+            sentiment_counts = pd.DataFrame(stats['by']['sentiment'])
             sentiment_counts.columns = ['Sentiment', 'Count']
             fig = px.bar(sentiment_counts, x='Sentiment', y='Count', title='Sentiment Distribution')
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.write("No data for Sentiment Distribution")
+    if stats:
+        # Weekly volume split by sentiment, bucketed by the backend
+        trend = fetch_data("news/timeseries", params={**params, 'bucket': 'week', 'group_by': 'sentiment', 'normalize': True})
+        if trend and trend['points']:
+            trend_df = pd.DataFrame(trend['points'])
+            trend_df.columns = ['Week', 'Sentiment', 'Count', 'Share']
+            fig = px.line(trend_df, x='Week', y='Count', color='Sentiment', hover_data=['Share'],
+                          title='Weekly Articles by Sentiment')
+            st.plotly_chart(fig, use_container_width=True)
 
     # Live scraping
     st.subheader("Scrape News Feed Using Url")
@@ -241,27 +287,27 @@ def main():
     col1, col2, col3 = st.columns(3)
     with col1:
         st.markdown("### Countries")
-        countries = fetch_data("news/countries")
-        if countries:
-            st.write(f"Total countries: {len(countries)}")
-            st.dataframe(pd.DataFrame(countries, columns=["Country"]), height=200)
+        if facets.get('country'):
+            st.write(f"Total countries: {len(facets['country'])}")
+            st.dataframe(pd.DataFrame([(item['value'], item['count']) for item in facets['country']],
+                                      columns=["Country", "Articles"]), height=200)
         else:
             st.warning("No countries data available")
     with col2:
         st.markdown("### Sources")
-        sources = fetch_data("news/sources")
-        if sources:
-            st.write(f"Total sources: {len(sources)}")
-            st.dataframe(pd.DataFrame(sources, columns=["Source"]), height=200)
+        if facets.get('source'):
+            st.write(f"Total sources: {len(facets['source'])}")
+            st.dataframe(pd.DataFrame([(item['value'], item['count']) for item in facets['source']],
+                                      columns=["Source", "Articles"]), height=200)
         else:
             st.warning("No sources data available")
     with col3:
         st.markdown("### Languages")
-        languages = fetch_data("news/languages")
-        if languages:
-            st.write(f"Total languages: {len(languages)}")
+        if facets.get('language'):
+            st.write(f"Total languages: {len(facets['language'])}")
             # Display language names in summary
-            st.dataframe(pd.DataFrame([LANGUAGE_MAP.get(lang, lang) for lang in languages], columns=["Language"]), height=200)
+            st.dataframe(pd.DataFrame([(LANGUAGE_MAP.get(item['value'], item['value']), item['count']) for item in facets['language']],
+                                      columns=["Language", "Articles"]), height=200)
         else:
             st.warning("No languages data available")
 